@@ -13,6 +13,8 @@ from app.models import (  # noqa: F401
     InterviewAnalysis,
     Interviewer,
     ProcessingJob,
+    SummaryCacheEntry,
+    TranscriptCacheEntry,
     User,
 )
 
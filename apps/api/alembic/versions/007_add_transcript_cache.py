@@ -0,0 +1,57 @@
+"""Add transcript_cache table for content-addressed transcript reuse.
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-16
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "007"
+down_revision: Union[str, None] = "006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keyed by audio content hash plus the model settings that produced it
+    op.create_table(
+        "transcript_cache",
+        sa.Column("audio_sha256", sa.CHAR(length=64), nullable=False),
+        sa.Column("model_size", sa.VARCHAR(length=64), nullable=False),
+        sa.Column("compute_type", sa.VARCHAR(length=32), nullable=False),
+        sa.Column("transcript", sa.Text(), nullable=False),
+        sa.Column("segments", postgresql.JSONB(), nullable=True),
+        sa.Column("size_bytes", sa.Integer(), nullable=False),
+        sa.Column("hit_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "created_at",
+            sa.DateTime(),
+            nullable=False,
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+        ),
+        sa.Column(
+            "last_accessed_at",
+            sa.DateTime(),
+            nullable=False,
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+        ),
+        sa.PrimaryKeyConstraint("audio_sha256", "model_size", "compute_type"),
+    )
+    # Eviction scans by recency
+    op.create_index(
+        "ix_transcript_cache_last_accessed_at",
+        "transcript_cache",
+        ["last_accessed_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_transcript_cache_last_accessed_at", table_name="transcript_cache")
+    op.drop_table("transcript_cache")
@@ -0,0 +1,31 @@
+"""Add checkpoints column to processing_jobs for resumable retries.
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-16
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "008"
+down_revision: Union[str, None] = "007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Completed pipeline stage outputs, keyed by stage name
+    op.add_column(
+        "processing_jobs",
+        sa.Column("checkpoints", postgresql.JSONB(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("processing_jobs", "checkpoints")
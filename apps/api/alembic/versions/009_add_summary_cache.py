@@ -0,0 +1,56 @@
+"""Add summary_cache table for reusing summaries across reprocessing.
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-16
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "009"
+down_revision: Union[str, None] = "008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keyed by a hash of the transcript plus the prompts, model and
+    # generation settings that produced the summary
+    op.create_table(
+        "summary_cache",
+        sa.Column("cache_key", sa.CHAR(length=64), nullable=False),
+        sa.Column("model", sa.VARCHAR(length=255), nullable=False),
+        sa.Column("summary", postgresql.JSONB(), nullable=False),
+        sa.Column("size_bytes", sa.Integer(), nullable=False),
+        sa.Column("hit_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "created_at",
+            sa.DateTime(),
+            nullable=False,
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+        ),
+        sa.Column(
+            "last_accessed_at",
+            sa.DateTime(),
+            nullable=False,
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+        ),
+        sa.PrimaryKeyConstraint("cache_key"),
+    )
+    # Eviction scans by recency
+    op.create_index(
+        "ix_summary_cache_last_accessed_at",
+        "summary_cache",
+        ["last_accessed_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_summary_cache_last_accessed_at", table_name="summary_cache")
+    op.drop_table("summary_cache")
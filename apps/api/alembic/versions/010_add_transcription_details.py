@@ -0,0 +1,42 @@
+"""Add transcription details to interview_analyses and transcript_cache.
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-16
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "010"
+down_revision: Union[str, None] = "009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Language, duration, confidence and segments from the Whisper pass
+    op.add_column(
+        "interview_analyses",
+        sa.Column("transcript_json", postgresql.JSONB(), nullable=True),
+    )
+    # Cached transcripts keep the same details
+    op.add_column(
+        "transcript_cache",
+        sa.Column("language", sa.VARCHAR(length=16), nullable=True),
+    )
+    op.add_column(
+        "transcript_cache",
+        sa.Column("duration_seconds", sa.Float(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("transcript_cache", "duration_seconds")
+    op.drop_column("transcript_cache", "language")
+    op.drop_column("interview_analyses", "transcript_json")
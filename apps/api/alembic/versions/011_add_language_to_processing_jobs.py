@@ -0,0 +1,30 @@
+"""Add language hint to processing_jobs for transcription routing.
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-16
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "011"
+down_revision: Union[str, None] = "010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Spoken language given at upload; NULL means detect it
+    op.add_column(
+        "processing_jobs",
+        sa.Column("language", sa.VARCHAR(length=16), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("processing_jobs", "language")
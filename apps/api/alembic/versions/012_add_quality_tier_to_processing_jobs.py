@@ -0,0 +1,35 @@
+"""Add quality_tier to processing_jobs for per-job processing quality.
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-16
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "012"
+down_revision: Union[str, None] = "011"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # fast / balanced / accurate; existing jobs ran as balanced
+    op.add_column(
+        "processing_jobs",
+        sa.Column(
+            "quality_tier",
+            sa.VARCHAR(length=20),
+            nullable=False,
+            server_default="balanced",
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("processing_jobs", "quality_tier")
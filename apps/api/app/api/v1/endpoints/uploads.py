@@ -7,8 +7,10 @@ from fastapi import APIRouter, HTTPException, status
 
 from app.api.deps import CurrentUser, S3ServiceDep, SessionDep
 from app.core.celery_utils import enqueue_interview_processing
+from app.core.config import get_settings
 from app.models.enums import JobStatus
 from app.models.processing_job import ProcessingJob
+from app.models.user import User
 from app.schemas.upload import (
     ConfirmUploadRequest,
     JobConfirmResponse,
@@ -73,7 +75,8 @@ def confirm_upload(
     """Confirm that a file upload has completed.
 
     Updates the ProcessingJob status from PENDING to QUEUED,
-    sets the interviewer_id, and marks it ready for processing.
+    sets the interviewer_id, optional language hint and quality tier,
+    charges the tier's credits and marks it ready for processing.
     """
     job = session.get(ProcessingJob, job_id)
 
@@ -95,8 +98,21 @@ def confirm_upload(
             detail="Job already confirmed",
         )
 
+    cost = get_settings().quality_tier_credits.get(request.quality_tier.value, 0)
+    if cost:
+        user = session.get(User, current_user.id)
+        if user.credits < cost:
+            raise HTTPException(
+                status_code=status.HTTP_402_PAYMENT_REQUIRED,
+                detail="Insufficient credits",
+            )
+        user.credits -= cost
+        session.add(user)
+
     job.status = JobStatus.QUEUED
     job.interviewer_id = request.interviewer_id
+    job.language = request.language
+    job.quality_tier = request.quality_tier
     session.add(job)
     session.flush()  # Write to DB but don't commit yet
 
@@ -107,7 +123,7 @@ def confirm_upload(
         session.commit()
         session.refresh(job)
     except Exception:
-        # Enqueue failed - rollback to keep PENDING status
+        # Enqueue failed - rollback to keep PENDING status (and the credits)
         session.rollback()
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
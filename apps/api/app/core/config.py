@@ -50,6 +50,10 @@ class Settings(BaseSettings):
     aws_region: str = "us-east-1"
     s3_bucket_name: str = ""
 
+    # Credits charged per job by quality tier (fast / balanced / accurate);
+    # JSON object, tiers left out are free
+    quality_tier_credits: dict[str, int] = {}
+
     # Development settings
     dev_auth_bypass: bool = False
 
@@ -4,6 +4,8 @@ from app.models.enums import AuthProvider, JobStatus, ProfileStatus
 from app.models.interview_analysis import InterviewAnalysis
 from app.models.interviewer import Interviewer
 from app.models.processing_job import ProcessingJob
+from app.models.summary_cache import SummaryCacheEntry
+from app.models.transcript_cache import TranscriptCacheEntry
 from app.models.user import User
 
 __all__ = [
@@ -13,5 +15,7 @@ __all__ = [
     "InterviewAnalysis",
     "Interviewer",
     "ProcessingJob",
+    "SummaryCacheEntry",
+    "TranscriptCacheEntry",
     "User",
 ]
@@ -27,3 +27,11 @@ class JobStatus(str, Enum):
     PROCESSING = "processing"
     COMPLETED = "completed"
     FAILED = "failed"
+
+
+class QualityTier(str, Enum):
+    """Processing quality chosen per job, trading latency for accuracy."""
+
+    FAST = "fast"
+    BALANCED = "balanced"
+    ACCURATE = "accurate"
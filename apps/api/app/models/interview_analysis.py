@@ -24,5 +24,10 @@ class InterviewAnalysis(SQLModel, table=True):
         sa_column=Column(JSONB),
     )
     transcript_redacted: Optional[str] = Field(default=None)
+    # Whisper output beyond the text: language, duration, confidence, segments
+    transcript_json: Optional[dict[str, Any]] = Field(
+        default=None,
+        sa_column=Column(JSONB),
+    )
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
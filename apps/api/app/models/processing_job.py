@@ -1,12 +1,13 @@
 """ProcessingJob model definition."""
 
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
 from uuid import UUID, uuid4
 
-from sqlmodel import Field, SQLModel
+from sqlmodel import Column, Field, SQLModel
+from sqlalchemy.dialects.postgresql import JSONB
 
-from app.models.enums import JobStatus
+from app.models.enums import JobStatus, QualityTier
 
 
 class ProcessingJob(SQLModel, table=True):
@@ -28,5 +29,15 @@ class ProcessingJob(SQLModel, table=True):
     s3_audio_key: str = Field()
     status: JobStatus = Field(default=JobStatus.PENDING, index=True)
     error_message: Optional[str] = Field(default=None)
+    # Spoken language given at upload; the worker detects it when None
+    language: Optional[str] = Field(default=None, max_length=16)
+    # Picks the worker queues, models and decoding settings for the job
+    quality_tier: QualityTier = Field(default=QualityTier.BALANCED)
+    # Outputs of completed pipeline stages, written by the worker so that
+    # retries resume at the first incomplete stage
+    checkpoints: Optional[dict[str, Any]] = Field(
+        default=None,
+        sa_column=Column(JSONB),
+    )
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
@@ -0,0 +1,25 @@
+"""SummaryCacheEntry model definition."""
+
+from datetime import datetime
+from typing import Any
+
+from sqlmodel import Column, Field, SQLModel
+from sqlalchemy.dialects.postgresql import JSONB
+
+
+class SummaryCacheEntry(SQLModel, table=True):
+    """Cached summary keyed by transcript and summarization settings.
+
+    Written and evicted by the worker; lets reprocessed jobs skip the
+    LLM while the transcript, prompts and model are unchanged.
+    """
+
+    __tablename__ = "summary_cache"
+
+    cache_key: str = Field(primary_key=True, max_length=64)
+    model: str = Field(max_length=255)
+    summary: dict[str, Any] = Field(sa_column=Column(JSONB, nullable=False))
+    size_bytes: int = Field()
+    hit_count: int = Field(default=0)
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    last_accessed_at: datetime = Field(default_factory=datetime.utcnow, index=True)
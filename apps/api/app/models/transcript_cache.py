@@ -0,0 +1,32 @@
+"""TranscriptCacheEntry model definition."""
+
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlmodel import Column, Field, SQLModel
+from sqlalchemy.dialects.postgresql import JSONB
+
+
+class TranscriptCacheEntry(SQLModel, table=True):
+    """Cached transcript keyed by audio content hash and model settings.
+
+    Written and evicted by the worker; lets re-uploads of the same
+    recording skip transcription.
+    """
+
+    __tablename__ = "transcript_cache"
+
+    audio_sha256: str = Field(primary_key=True, max_length=64)
+    model_size: str = Field(primary_key=True, max_length=64)
+    compute_type: str = Field(primary_key=True, max_length=32)
+    transcript: str = Field()
+    segments: Optional[list[dict[str, Any]]] = Field(
+        default=None,
+        sa_column=Column(JSONB),
+    )
+    language: Optional[str] = Field(default=None, max_length=16)
+    duration_seconds: Optional[float] = Field(default=None)
+    size_bytes: int = Field()
+    hit_count: int = Field(default=0)
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    last_accessed_at: datetime = Field(default_factory=datetime.utcnow, index=True)
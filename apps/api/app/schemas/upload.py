@@ -1,10 +1,11 @@
 """Schemas for file upload operations."""
 
+from typing import Optional
 from uuid import UUID
 
 from pydantic import BaseModel, field_validator
 
-from app.models.enums import JobStatus
+from app.models.enums import JobStatus, QualityTier
 from app.services.s3_service import ALLOWED_CONTENT_TYPES
 
 
@@ -45,6 +46,20 @@ class ConfirmUploadRequest(BaseModel):
     """Request schema for confirming an upload."""
 
     interviewer_id: UUID
+    # Spoken language (ISO 639 code such as "en"); detected when omitted
+    language: Optional[str] = None
+    quality_tier: QualityTier = QualityTier.BALANCED
+
+    @field_validator("language")
+    @classmethod
+    def validate_language(cls, v: Optional[str]) -> Optional[str]:
+        """Normalize the language hint to a lowercase language code."""
+        if v is None:
+            return v
+        v = v.strip().lower()
+        if not (2 <= len(v) <= 3 and v.isascii() and v.isalpha()):
+            raise ValueError("Language must be a 2 or 3 letter language code")
+        return v
 
 
 class JobConfirmResponse(BaseModel):
@@ -8,7 +8,7 @@ from fastapi.testclient import TestClient
 from sqlmodel import Session
 
 from app.core.security import create_access_token, get_password_hash
-from app.models.enums import AuthProvider, JobStatus
+from app.models.enums import AuthProvider, JobStatus, QualityTier
 from app.models.interviewer import Interviewer
 from app.models.processing_job import ProcessingJob
 from app.models.user import User
@@ -200,6 +200,83 @@ class TestConfirmUploadEndpoint:
         assert pending_job.status == JobStatus.QUEUED
         assert pending_job.interviewer_id == test_interviewer.id
 
+    def test_confirm_upload_with_language(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        pending_job: ProcessingJob,
+        test_interviewer: Interviewer,
+        db_session: Session,
+    ):
+        """A language hint is normalized and stored on the job."""
+        response = client.post(
+            f"/api/v1/uploads/{pending_job.id}/confirm",
+            json={"interviewer_id": str(test_interviewer.id), "language": "DE"},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 200
+        db_session.refresh(pending_job)
+        assert pending_job.language == "de"
+
+    def test_confirm_upload_invalid_language(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        pending_job: ProcessingJob,
+        test_interviewer: Interviewer,
+    ):
+        """A language hint that is not a language code returns 422."""
+        response = client.post(
+            f"/api/v1/uploads/{pending_job.id}/confirm",
+            json={"interviewer_id": str(test_interviewer.id), "language": "english"},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 422
+
+    def test_confirm_upload_with_quality_tier(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        pending_job: ProcessingJob,
+        test_interviewer: Interviewer,
+        db_session: Session,
+    ):
+        """The chosen quality tier is stored on the job."""
+        response = client.post(
+            f"/api/v1/uploads/{pending_job.id}/confirm",
+            json={"interviewer_id": str(test_interviewer.id), "quality_tier": "fast"},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 200
+        db_session.refresh(pending_job)
+        assert pending_job.quality_tier == QualityTier.FAST
+
+    def test_confirm_upload_insufficient_credits(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        pending_job: ProcessingJob,
+        test_interviewer: Interviewer,
+        db_session: Session,
+    ):
+        """A tier costing more credits than the user has returns 402."""
+        with patch(
+            "app.api.v1.endpoints.uploads.get_settings",
+            return_value=MagicMock(quality_tier_credits={"accurate": 5}),
+        ):
+            response = client.post(
+                f"/api/v1/uploads/{pending_job.id}/confirm",
+                json={"interviewer_id": str(test_interviewer.id), "quality_tier": "accurate"},
+                headers=auth_headers,
+            )
+
+        assert response.status_code == 402
+        db_session.refresh(pending_job)
+        assert pending_job.status == JobStatus.PENDING
+
     def test_confirm_upload_not_found(
         self, client: TestClient, auth_headers: dict, test_interviewer: Interviewer
     ):
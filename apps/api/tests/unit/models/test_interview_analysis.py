@@ -47,3 +47,22 @@ class TestInterviewAnalysisModel:
         assert analysis.metrics_json["interruption_count"] == 5
         assert analysis.metrics_json["speaking_ratio"] == 0.4
         assert analysis.metrics_json["sentiment_volatility"] == 0.15
+
+    def test_interview_analysis_transcript_json(self):
+        """Analysis stores the transcription details next to the text."""
+        details = {
+            "language": "en",
+            "duration": 1800.0,
+            "confidence": 0.82,
+            "segments": [{"start": 0.0, "end": 2.5, "text": "Hello."}],
+        }
+
+        analysis = InterviewAnalysis(
+            user_id=uuid4(),
+            interviewer_id=uuid4(),
+            sentiment_score=0.5,
+            transcript_json=details,
+        )
+
+        assert analysis.transcript_json["language"] == "en"
+        assert analysis.transcript_json["segments"][0]["text"] == "Hello."
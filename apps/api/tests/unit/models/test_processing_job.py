@@ -4,7 +4,7 @@ from uuid import UUID, uuid4
 
 import pytest
 
-from app.models.enums import JobStatus
+from app.models.enums import JobStatus, QualityTier
 from app.models.processing_job import ProcessingJob
 
 
@@ -55,3 +55,16 @@ class TestProcessingJobModel:
         )
 
         assert job.status == JobStatus.PENDING
+
+    def test_processing_job_language_default(self):
+        """New job has no language hint, so the worker detects it."""
+        job = ProcessingJob(user_id=uuid4(), s3_audio_key="audio/test.mp3")
+
+        assert job.language is None
+
+    def test_processing_job_quality_tier_default(self):
+        """New job runs at the balanced quality tier."""
+        job = ProcessingJob(user_id=uuid4(), s3_audio_key="audio/test.mp3")
+
+        assert job.quality_tier == QualityTier.BALANCED
+        assert [tier.value for tier in QualityTier] == ["fast", "balanced", "accurate"]
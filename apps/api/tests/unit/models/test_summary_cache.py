@@ -0,0 +1,26 @@
+"""Unit tests for SummaryCacheEntry model."""
+
+from app.models.summary_cache import SummaryCacheEntry
+
+
+class TestSummaryCacheEntryModel:
+    """Tests for SummaryCacheEntry SQLModel."""
+
+    def test_summary_cache_entry_model(self):
+        """Entry keyed by a single content hash."""
+        entry = SummaryCacheEntry(
+            cache_key="b" * 64,
+            model="meta-llama/Llama-3.3-8B-Instruct",
+            summary={"executive_summary": "Good interview.", "sentiment_score": 0.5},
+            size_bytes=64,
+        )
+
+        assert entry.cache_key == "b" * 64
+        assert entry.summary["executive_summary"] == "Good interview."
+        assert entry.hit_count == 0
+
+    def test_summary_cache_primary_key(self):
+        """Primary key is the cache key alone."""
+        pk = [c.name for c in SummaryCacheEntry.__table__.primary_key.columns]
+
+        assert pk == ["cache_key"]
@@ -0,0 +1,28 @@
+"""Unit tests for TranscriptCacheEntry model."""
+
+from app.models.transcript_cache import TranscriptCacheEntry
+
+
+class TestTranscriptCacheEntryModel:
+    """Tests for TranscriptCacheEntry SQLModel."""
+
+    def test_transcript_cache_entry_model(self):
+        """Entry keyed by audio hash and model settings."""
+        entry = TranscriptCacheEntry(
+            audio_sha256="a" * 64,
+            model_size="distil-large-v3",
+            compute_type="int8",
+            transcript="Hello.",
+            segments=[{"start": 0.0, "end": 1.0, "text": "Hello."}],
+            size_bytes=64,
+        )
+
+        assert entry.audio_sha256 == "a" * 64
+        assert entry.segments[0]["text"] == "Hello."
+        assert entry.hit_count == 0
+
+    def test_transcript_cache_composite_primary_key(self):
+        """Primary key spans hash, model size and compute type."""
+        pk = [c.name for c in TranscriptCacheEntry.__table__.primary_key.columns]
+
+        assert pk == ["audio_sha256", "model_size", "compute_type"]
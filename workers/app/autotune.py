@@ -0,0 +1,280 @@
+"""Pick the fastest faster-whisper configuration for this CPU.
+
+Transcribes a short clip under every compute type and thread split,
+measures throughput, and keeps the fastest configuration whose
+transcript stays within a word error rate tolerance of the float32
+transcript. Measurements are cached on disk per CPU model, core count
+and Whisper model, so each machine type is tuned once.
+
+A thread split divides the cores between ``num_workers`` parallel
+transcriptions of ``cpu_threads`` threads each. Splits with several
+workers only pay off for callers that share one model across threads
+(the batched engine or the model server), so every measurement is
+cached and a worker that runs one transcription at a time on its model
+only considers ``num_workers=1``.
+
+Run it once per machine type, or set ``TRANSCRIPTION_AUTOTUNE=true`` to
+tune on the first worker start without cached measurements:
+
+    python -m app.autotune --clip sample_interview.wav
+    python -m app.autotune --clip sample_interview.wav --model-size large-v3 --force
+"""
+
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import platform
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Any, Optional
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Compute types tried, most accurate last; float32 also gives the reference
+COMPUTE_TYPES = ("int8", "int8_float32", "float32")
+
+# Parallel transcriptions tried per model
+WORKER_COUNTS = (1, 2, 4)
+
+
+@dataclass
+class TuneResult:
+    """One measured configuration."""
+
+    compute_type: str
+    cpu_threads: int
+    num_workers: int
+    throughput: float  # Audio seconds transcribed per wall-clock second
+    wer: float  # Against the float32 transcript
+
+
+def cpu_model() -> str:
+    """CPU model name, e.g. "AMD EPYC 7R13 Processor"."""
+    try:
+        with open("/proc/cpuinfo") as f:
+            for line in f:
+                if line.startswith("model name"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or platform.machine()
+
+
+def cache_key(model_size: str) -> str:
+    """Key of cached measurements: CPU model, usable cores and Whisper model."""
+    return f"{cpu_model()}|{len(os.sched_getaffinity(0))}|{model_size}"
+
+
+def word_error_rate(reference: str, hypothesis: str) -> float:
+    """Word-level edit distance over the reference length (0 = identical)."""
+    ref = reference.lower().split()
+    hyp = hypothesis.lower().split()
+    if not ref:
+        return float(bool(hyp))
+    previous = list(range(len(hyp) + 1))
+    for i, ref_word in enumerate(ref, 1):
+        current = [i]
+        for j, hyp_word in enumerate(hyp, 1):
+            current.append(
+                min(
+                    previous[j] + 1,
+                    current[j - 1] + 1,
+                    previous[j - 1] + (ref_word != hyp_word),
+                )
+            )
+        previous = current
+    return previous[-1] / len(ref)
+
+
+def thread_splits(cores: int) -> list[tuple[int, int]]:
+    """(cpu_threads, num_workers) pairs that use every core once."""
+    return [(cores // workers, workers) for workers in WORKER_COUNTS if cores // workers >= 1]
+
+
+def _measure(
+    model_size: str, audio, compute_type: str, cpu_threads: int, num_workers: int, beam_size: int
+) -> tuple[str, float]:
+    """Transcribe the clip once per worker, in parallel.
+
+    Returns:
+        The transcript and the throughput in audio seconds per second.
+    """
+    from faster_whisper import WhisperModel
+
+    from app.services.audio import SAMPLE_RATE
+
+    model = WhisperModel(
+        model_size,
+        device="cpu",
+        compute_type=compute_type,
+        cpu_threads=cpu_threads,
+        num_workers=num_workers,
+    )
+
+    def run() -> str:
+        segments, _ = model.transcribe(audio, beam_size=beam_size, language="en")
+        return " ".join(segment.text.strip() for segment in segments)
+
+    run()  # Warm-up: first call pays for allocations
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=num_workers) as pool:
+        texts = list(pool.map(lambda _: run(), range(num_workers)))
+    elapsed = time.perf_counter() - start
+    return texts[0], num_workers * (len(audio) / SAMPLE_RATE) / elapsed
+
+
+def tune(
+    model_size: str, clip_path: str, beam_size: int = 5
+) -> list[TuneResult]:
+    """Measure every configuration.
+
+    Args:
+        model_size: Whisper model to tune.
+        clip_path: Representative recording, ideally 20-60 s of speech.
+        beam_size: Decoding beam width used in production.
+
+    Returns:
+        One result per compute type and thread split.
+    """
+    from faster_whisper import decode_audio
+
+    from app.services.audio import SAMPLE_RATE
+
+    audio = decode_audio(clip_path, sampling_rate=SAMPLE_RATE)
+    cores = len(os.sched_getaffinity(0))
+    logger.info(f"Autotuning {model_size} on {cpu_model()} ({cores} cores)")
+
+    reference, _ = _measure(model_size, audio, "float32", cores, 1, beam_size)
+    results = []
+    for compute_type in COMPUTE_TYPES:
+        for cpu_threads, num_workers in thread_splits(cores):
+            text, throughput = _measure(
+                model_size, audio, compute_type, cpu_threads, num_workers, beam_size
+            )
+            result = TuneResult(
+                compute_type=compute_type,
+                cpu_threads=cpu_threads,
+                num_workers=num_workers,
+                throughput=round(throughput, 2),
+                wer=round(word_error_rate(reference, text), 4),
+            )
+            logger.info(f"Autotune: {result}")
+            results.append(result)
+    return results
+
+
+def choose(results: list[TuneResult], wer_tolerance: float, shared: bool = False) -> TuneResult:
+    """Fastest result within the WER tolerance (float32 always qualifies).
+
+    Args:
+        results: Measurements from ``tune``.
+        wer_tolerance: Highest WER accepted against the float32 transcript.
+        shared: Whether callers share the model across threads; if not,
+            only single-worker splits are considered.
+    """
+    if not shared:
+        results = [result for result in results if result.num_workers == 1]
+    accurate = [result for result in results if result.wer <= wer_tolerance]
+    return max(accurate or results, key=lambda result: result.throughput)
+
+
+def load_results(cache_path: str, model_size: str) -> Optional[list[TuneResult]]:
+    """The cached measurements for this machine and model, if any."""
+    try:
+        with open(os.path.expanduser(cache_path)) as f:
+            cached = json.load(f).get(cache_key(model_size))
+        return [TuneResult(**result) for result in cached] if cached else None
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def save_results(cache_path: str, model_size: str, results: list[TuneResult]) -> None:
+    """Record measurements, keeping those of other machines and models."""
+    path = os.path.expanduser(cache_path)
+    try:
+        with open(path) as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        cached = {}
+    cached[cache_key(model_size)] = [asdict(result) for result in results]
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(cached, f, indent=2)
+
+
+def tuned_options(settings, model_size: str, shared: bool = False) -> dict[str, Any]:
+    """TranscriptionService options for this CPU, tuning if not cached.
+
+    Tuning runs in a spawned process, so no model threads are left in a
+    worker master that forks afterwards.
+
+    Args:
+        settings: Worker Settings.
+        model_size: Whisper model to tune.
+        shared: Whether callers share the model across threads (the
+            batched engine or the model server).
+
+    Returns:
+        compute_type, cpu_threads and num_workers; empty when nothing is
+        cached and no clip is configured to tune on.
+    """
+    results = load_results(settings.transcription_autotune_cache_path, model_size)
+    if results is None:
+        if not settings.transcription_autotune_clip:
+            logger.warning("Autotune enabled without a clip or cached results, skipping")
+            return {}
+        with ProcessPoolExecutor(
+            max_workers=1, mp_context=multiprocessing.get_context("spawn")
+        ) as pool:
+            results = pool.submit(
+                tune,
+                model_size,
+                settings.transcription_autotune_clip,
+                settings.transcription_beam_size,
+            ).result()
+        save_results(settings.transcription_autotune_cache_path, model_size, results)
+
+    decision = choose(results, settings.transcription_autotune_wer_tolerance, shared)
+    logger.info(f"Using autotuned Whisper config for {model_size}: {decision}")
+    return {
+        "compute_type": decision.compute_type,
+        "cpu_threads": decision.cpu_threads,
+        "num_workers": decision.num_workers,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    settings = get_settings()
+    parser.add_argument("--clip", default=settings.transcription_autotune_clip)
+    parser.add_argument("--model-size", default=settings.transcription_model)
+    parser.add_argument(
+        "--wer-tolerance", type=float, default=settings.transcription_autotune_wer_tolerance
+    )
+    parser.add_argument("--beam-size", type=int, default=settings.transcription_beam_size)
+    parser.add_argument("--cache-path", default=settings.transcription_autotune_cache_path)
+    parser.add_argument("--force", action="store_true", help="Re-tune despite cached measurements")
+    args = parser.parse_args()
+    if not args.clip:
+        parser.error("--clip is required (or set TRANSCRIPTION_AUTOTUNE_CLIP)")
+
+    logging.basicConfig(level=logging.INFO)
+    key = cache_key(args.model_size)
+    results = None if args.force else load_results(args.cache_path, args.model_size)
+    if results is None:
+        results = tune(args.model_size, args.clip, args.beam_size)
+        save_results(args.cache_path, args.model_size, results)
+        logger.info(f"Saved {len(results)} measurements for {key}")
+    for shared in (False, True):
+        logger.info(
+            f"{'Shared' if shared else 'Single'} model: "
+            f"{choose(results, args.wer_tolerance, shared)}"
+        )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,285 @@
+"""Re-summarize stored transcripts after a prompt or model change.
+
+Streams ``interview_analyses`` rows through a server-side cursor,
+summarizes their redacted transcripts in batches and writes the new
+summaries back in bulk. No audio is read, so the transcription fleet is
+not involved.
+
+Progress is kept in Redis per summarization fingerprint (see
+``SummarizationService.fingerprint``): an interrupted run resumes after
+the last batch it wrote, and a run under new prompts or a new model
+starts from the beginning.
+
+Run it on a summarization node, or send ``backfill_summaries`` to the
+summarization queue to run it in task-sized slices:
+
+    python -m app.backfill --dry-run
+    python -m app.backfill --batch-size 16 --concurrency 2
+"""
+
+import argparse
+import json
+import logging
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Iterator, Optional
+
+from sqlmodel import text
+
+from app import tasks
+from app.core.config import get_settings
+from app.core.database import get_session
+from app.services.summarization import FALLBACK_SUMMARY
+from app.services.summary_cache import summary_cache_key
+
+logger = logging.getLogger(__name__)
+
+# Redis key of the last analysis id written, per summarization fingerprint
+PROGRESS_KEY = "vibecheck:backfill:{fingerprint}"
+
+# Orders before every UUID, for a run with no progress yet
+_START_ID = "00000000-0000-0000-0000-000000000000"
+
+
+@dataclass
+class BackfillStats:
+    """Outcome of one backfill run."""
+
+    rows: int = 0  # Rows summarized (and written, unless a dry run)
+    failed: int = 0  # Rows whose summary could not be parsed, left unchanged
+    cached: int = 0  # Rows answered by the summary cache
+    seconds: float = 0.0
+    done: bool = False  # Whether every row after the start point was reached
+
+
+class BackfillProgress:
+    """Last analysis id written by a backfill, stored in Redis."""
+
+    def __init__(self, redis, fingerprint: str):
+        self.redis = redis
+        self.key = PROGRESS_KEY.format(fingerprint=fingerprint)
+
+    def get(self) -> str:
+        value = self.redis.get(self.key)
+        return value.decode() if value else _START_ID
+
+    def set(self, analysis_id: str) -> None:
+        self.redis.set(self.key, analysis_id)
+
+    def clear(self) -> None:
+        self.redis.delete(self.key)
+
+
+def _stream_rows(after_id: str, batch_size: int) -> Iterator[list[tuple[str, str]]]:
+    """Batches of (id, transcript) after ``after_id``, in id order.
+
+    The server-side cursor keeps memory flat however many rows there are.
+    """
+    with get_session() as session:
+        result = session.execute(
+            text("""
+                SELECT id, transcript_redacted FROM interview_analyses
+                WHERE transcript_redacted IS NOT NULL AND id > CAST(:after_id AS uuid)
+                ORDER BY id
+            """),
+            {"after_id": after_id},
+            execution_options={"stream_results": True},
+        )
+        for partition in result.partitions(batch_size):
+            yield [(str(row[0]), row[1]) for row in partition]
+
+
+def _count_rows(after_id: str) -> int:
+    """Rows left after ``after_id``."""
+    with get_session() as session:
+        return session.execute(
+            text("""
+                SELECT COUNT(*) FROM interview_analyses
+                WHERE transcript_redacted IS NOT NULL AND id > CAST(:after_id AS uuid)
+            """),
+            {"after_id": after_id},
+        ).scalar()
+
+
+def _summarize_rows(
+    rows: list[tuple[str, str]], use_cache: bool
+) -> tuple[list[Optional[dict[str, Any]]], int]:
+    """Summaries for a batch of rows, cached ones first.
+
+    Returns:
+        One summary per row (None where the output could not be parsed)
+        and how many came from the cache.
+    """
+    service = tasks.get_summarization_service()
+    cache = tasks.get_summary_cache()
+    keys = [summary_cache_key(service.fingerprint, transcript) for _, transcript in rows]
+    summaries: list[Optional[dict[str, Any]]] = [None] * len(rows)
+    if cache:
+        summaries = [cache.get(key) for key in keys]
+    cached = sum(summary is not None for summary in summaries)
+
+    misses = [index for index, summary in enumerate(summaries) if summary is None]
+    if misses:
+        fresh = service.summarize_batch([rows[index][1] for index in misses])
+        for index, summary in zip(misses, fresh):
+            if summary.get("executive_summary") == FALLBACK_SUMMARY["executive_summary"]:
+                continue
+            summaries[index] = summary
+            if cache and use_cache:
+                cache.put(keys[index], service.model_name, summary)
+    return summaries, cached
+
+
+def _write_summaries(rows: list[tuple[str, str]], summaries: list[Optional[dict]]) -> None:
+    """Update the batch's analyses in one executemany round trip.
+
+    The summary's metrics replace the stored ones, but the transcription
+    metrics (language, model, RTF) are kept: no audio is re-read here.
+    """
+    now = datetime.now(timezone.utc)
+    params = [
+        {
+            "id": analysis_id,
+            "sentiment_score": summary["sentiment_score"],
+            "summary": summary["executive_summary"],
+            "metrics_json": json.dumps(tasks.analysis_metrics(summary)),
+            "now": now,
+        }
+        for (analysis_id, _), summary in zip(rows, summaries)
+        if summary is not None
+    ]
+    if not params:
+        return
+    with get_session() as session:
+        session.execute(
+            text("""
+                UPDATE interview_analyses
+                SET sentiment_score = :sentiment_score, summary = :summary,
+                    metrics_json = jsonb_strip_nulls(
+                        jsonb_build_object('transcription', metrics_json -> 'transcription')
+                    ) || CAST(:metrics_json AS jsonb),
+                    updated_at = :now
+                WHERE id = CAST(:id AS uuid)
+            """),
+            params,
+        )
+        session.commit()
+
+
+def run_backfill(
+    batch_size: int,
+    concurrency: int,
+    limit: Optional[int] = None,
+    dry_run: bool = False,
+    restart: bool = False,
+) -> BackfillStats:
+    """Re-summarize stored transcripts from the last progress marker.
+
+    Batches are summarized ``concurrency`` at a time and written in
+    order, so the progress marker only ever passes rows already written.
+
+    Args:
+        batch_size: Transcripts per summarize_batch call and bulk update.
+        concurrency: Batches in flight at once. A local model runs one
+            batch at a time; higher values need a model server, which
+            batches concurrent requests on its GPU.
+        limit: Stop after about this many rows (whole batches); None = all.
+        dry_run: Summarize without writing analyses, the cache or
+            progress, and log the estimated time for every row left.
+        restart: Ignore the progress marker and start from the first row.
+
+    Returns:
+        The run's BackfillStats.
+    """
+    from redis import Redis
+
+    settings = get_settings()
+    if concurrency > 1 and not settings.model_server_url:
+        logger.warning("Backfill concurrency above 1 needs a model server, using 1")
+        concurrency = 1
+
+    progress = BackfillProgress(
+        Redis.from_url(settings.get_redis_url()),
+        tasks.get_summarization_service().fingerprint,
+    )
+    if restart and not dry_run:
+        progress.clear()
+    after_id = _START_ID if restart else progress.get()
+    logger.info(f"Backfill starting after analysis {after_id}")
+
+    stats = BackfillStats()
+    start = time.perf_counter()
+
+    def finish(rows, future) -> None:
+        summaries, cached = future.result()
+        if not dry_run:
+            _write_summaries(rows, summaries)
+            progress.set(rows[-1][0])
+        failed = summaries.count(None)
+        stats.rows += len(rows) - failed
+        stats.failed += failed
+        stats.cached += cached
+        logger.info(
+            f"Backfill: {stats.rows} rows re-summarized, {stats.failed} failed, "
+            f"{stats.cached} from cache ({time.perf_counter() - start:.0f}s)"
+        )
+
+    queued = 0
+    stats.done = True
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        in_flight: deque = deque()
+        for rows in _stream_rows(after_id, batch_size):
+            if limit is not None and queued >= limit:
+                stats.done = False
+                break
+            in_flight.append((rows, pool.submit(_summarize_rows, rows, not dry_run)))
+            queued += len(rows)
+            if len(in_flight) >= concurrency:
+                finish(*in_flight.popleft())
+        while in_flight:
+            finish(*in_flight.popleft())
+    stats.seconds = time.perf_counter() - start
+
+    if dry_run and queued:
+        remaining = _count_rows(after_id)
+        rate = queued / stats.seconds
+        logger.info(
+            f"Dry run: {queued} rows in {stats.seconds:.1f}s ({rate:.2f} rows/s); "
+            f"{remaining} rows left, about {remaining / rate / 3600:.1f} h"
+        )
+    return stats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    settings = get_settings()
+    parser.add_argument("--batch-size", type=int, default=settings.backfill_batch_size)
+    parser.add_argument("--concurrency", type=int, default=settings.backfill_concurrency)
+    parser.add_argument("--limit", type=int, default=None, help="Stop after this many rows")
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Summarize a sample without writing and estimate the full run",
+    )
+    parser.add_argument("--restart", action="store_true", help="Ignore saved progress")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    limit = args.limit
+    if args.dry_run and limit is None:
+        # Two rounds of in-flight batches are enough for a steady rate
+        limit = 2 * args.batch_size * args.concurrency
+    run_backfill(
+        batch_size=args.batch_size,
+        concurrency=args.concurrency,
+        limit=limit,
+        dry_run=args.dry_run,
+        restart=args.restart,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 """Configuration settings for the VibeCheck Worker."""
 
 from functools import lru_cache
+from typing import Any
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -33,6 +34,110 @@ class Settings(BaseSettings):
     s3_bucket_name: str = "vibecheck-uploads"
     s3_region: str = "us-east-1"
 
+    # Retry backoff for transient errors (exponential, with jitter)
+    retry_backoff_base_seconds: int = 30
+    retry_backoff_max_seconds: int = 900
+
+    # Transcription settings
+    transcription_model: str = "distil-large-v3"  # English (or every language without the next)
+    transcription_multilingual_model: str = ""  # Other languages, e.g. "large-v3"; "" = off
+    transcription_memory_budget_mb: int = 0  # Whisper weights kept loaded; 0 = no limit
+    transcription_compute_type: str = "float16"  # int8 on CPU
+    transcription_beam_size: int = 5  # 1 = greedy
+    transcription_without_timestamps: bool = False  # Window-length segments, faster decoding
+    transcription_cpu_threads: int = 0  # CTranslate2 threads per model on CPU; 0 = default
+    transcription_num_workers: int = 1  # Parallel transcriptions per model
+    transcription_autotune: bool = False  # Pick CPU compute type and threads (app.autotune)
+    transcription_autotune_clip: str = ""  # Recording to tune on when nothing is cached
+    transcription_autotune_wer_tolerance: float = 0.02  # Max WER against float32
+    transcription_autotune_cache_path: str = "~/.cache/vibecheck/autotune.json"
+    streaming_ingest: bool = False  # Decode straight from the S3 stream
+    stream_window_seconds: float = 30.0  # Audio per model call when streaming
+    chunked_transcription: bool = False  # Parallel chunks across a process pool
+    chunk_min_seconds: float = 60.0  # Chunks are cut at the first pause after this
+    chunk_max_seconds: float = 120.0  # Unbroken speech is force-split here
+    chunk_pool_workers: int = 0  # Pool processes; 0 = a quarter of the CPUs
+    batched_transcription: bool = False  # Share inference batches across jobs
+    transcription_batch_size: int = 16  # Max 30 s windows per inference call
+    transcription_batch_max_wait_ms: int = 50  # Wait for a batch to fill
+    partitioned_transcription: bool = False  # One pinned model per core slice (CPU nodes)
+    transcription_partitions: int = 4  # Core slices; run the worker with as many threads
+    fanout_enabled: bool = False  # Spread very long recordings across workers
+    fanout_min_audio_seconds: float = 7200.0  # Recordings at least this long
+    fanout_segment_seconds: float = 900.0  # Audio per fanned-out part
+    fanout_s3_prefix: str = "tmp/fanout"  # Where temporary parts are uploaded
+
+    # Summarization settings
+    summarization_backend: str = "transformers"  # "transformers" or "llama_cpp"
+    summarization_gguf_path: str = ""  # Local GGUF file for llama_cpp
+    summarization_gguf_repo: str = ""  # HuggingFace repo to fetch the GGUF from, without a path
+    summarization_gguf_file: str = "*Q4_K_M.gguf"  # File (or glob) in the repo
+    summarization_context_tokens: int = 32768  # llama_cpp context window
+    summarization_threads: int = 0  # llama_cpp threads; 0 = all usable CPUs
+    summarization_compression_ratio: float = 1.0  # Extractive pre-compression: share of words kept; 1 = off
+    summarization_map_reduce: bool = True  # Long transcripts via map-reduce, not truncation
+    summarization_max_input_tokens: int = 24000  # Longest transcript summarized in one pass
+    summarization_window_tokens: int = 6000  # Transcript tokens per map-step window
+    summarization_reduce_fan_in: int = 8  # Section analyses merged per generation
+    summarization_batch_size: int = 4  # Conversations per batched generation
+    summarization_batch_max_wait_ms: int = 50  # Model server: wait for a batch to fill
+    batched_summarization: bool = False  # Summarize queued transcripts together
+    summarization_dispatch_max_wait_ms: int = 2000  # Wait for summarization_batch_size jobs
+    summarization_dispatch_lease_seconds: int = 4500  # Hard time limit + max retry backoff
+    summarization_prompt_cache: bool = True  # Reuse the system prompt's KV cache
+    summarization_constrained_decoding: bool = False  # Decode only schema-valid JSON
+    # Cheaper models tried first, in order (HF names, or GGUF paths for llama_cpp);
+    # JSON list, e.g. ["meta-llama/Llama-3.2-3B-Instruct"]
+    summarization_cascade_models: list[str] = []
+    summarization_cascade_max_input_tokens: int = 8000  # Longer transcripts skip the cascade
+    summarization_min_list_items: int = 1  # Cascade quality check on every list
+    summarization_draft_model: str = ""  # Assisted decoding, e.g. meta-llama/Llama-3.2-1B-Instruct
+
+    # Per-job quality tiers (see app.core.quality): settings each tier
+    # overrides, as a JSON object; "balanced" runs the settings above.
+    # Tiers other than balanced use their own queues, e.g. transcription.fast
+    quality_tiers: dict[str, dict[str, Any]] = {
+        "fast": {
+            # English only; other languages (and detection) use "small"
+            "transcription_model": "distil-small.en",
+            "transcription_multilingual_model": "small",
+            "transcription_beam_size": 1,
+            "transcription_without_timestamps": True,
+            "summarization_compression_ratio": 0.5,
+        },
+        "balanced": {},
+        "accurate": {
+            # One multilingual model for every language
+            "transcription_model": "large-v3",
+            "transcription_multilingual_model": "",
+            "summarization_compression_ratio": 1.0,
+            "summarization_cascade_models": [],
+        },
+    }
+
+    # Node-local model server (python -m app.model_server); empty = in-process models
+    model_server_url: str = ""  # http://127.0.0.1:8765 or unix:///run/vibecheck/models.sock
+    model_server_timeout_seconds: float = 1800.0
+
+    # Load models in the Celery master before forking (see app.preload)
+    preload_models: bool = False
+    preload_child_timeout_seconds: float = 300.0  # Children load Whisper before going live
+
+    # Transcript cache (keyed by audio SHA-256)
+    transcript_cache_enabled: bool = True
+    transcript_cache_max_bytes: int = 512 * 1024 * 1024  # Total transcript size
+    transcript_cache_max_age_days: int = 30  # Since last access
+
+    # Summary cache (keyed by transcript and summarization settings)
+    summary_cache_enabled: bool = True
+    summary_cache_max_bytes: int = 64 * 1024 * 1024  # Total summary size
+    summary_cache_max_age_days: int = 30  # Since last access
+
+    # Re-summarization backfill over stored transcripts (app.backfill)
+    backfill_batch_size: int = 16  # Transcripts per summarize_batch call
+    backfill_concurrency: int = 2  # Batches in flight; above 1 needs a model server
+    backfill_rows_per_task: int = 500  # Rows per backfill_summaries task
+
     @property
     def database_url(self) -> str:
         """Construct PostgreSQL database URL."""
@@ -0,0 +1,58 @@
+"""Per-job quality tiers.
+
+A job's tier (chosen at upload) selects the settings its transcription
+and summarization run with, overriding the worker defaults as configured
+in ``Settings.quality_tiers``, and the queues its stages are sent to, so
+each tier can run on workers sized for it.
+"""
+
+from enum import Enum
+
+from app.core.config import Settings
+
+
+class QualityTier(str, Enum):
+    """Processing quality of a job - MUST match API enum values."""
+
+    FAST = "fast"
+    BALANCED = "balanced"
+    ACCURATE = "accurate"
+
+
+def parse_tier(value: str | None) -> QualityTier:
+    """The tier stored on a job; balanced when unset or unknown."""
+    try:
+        return QualityTier((value or QualityTier.BALANCED.value).lower())
+    except ValueError:
+        return QualityTier.BALANCED
+
+
+def tier_settings(settings: Settings, tier: QualityTier) -> Settings:
+    """Worker settings with the tier's overrides applied.
+
+    faster-whisper decodes everything as English on an English-only
+    (``.en``) model, so a tier that sets one without a multilingual
+    model keeps the balanced routing for other languages.
+    """
+    overrides = dict(settings.quality_tiers.get(tier.value, {}))
+    model = overrides.get("transcription_model", settings.transcription_model)
+    multilingual = overrides.get(
+        "transcription_multilingual_model", settings.transcription_multilingual_model
+    )
+    if model.endswith(".en") and not multilingual:
+        fallback = settings.transcription_multilingual_model or settings.transcription_model
+        if not fallback.endswith(".en"):
+            overrides["transcription_multilingual_model"] = fallback
+    return settings.model_copy(update=overrides) if overrides else settings
+
+
+def tier_queue(queue: str, tier: QualityTier) -> str:
+    """Queue a stage is sent to for a tier.
+
+    Balanced jobs use the stage queue itself, so workers that predate
+    tiers keep serving them; other tiers add a suffix, e.g.
+    ``transcription.fast``.
+    """
+    if tier == QualityTier.BALANCED:
+        return queue
+    return f"{queue}.{tier.value}"
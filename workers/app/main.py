@@ -6,6 +6,24 @@ from app.core.config import get_settings
 
 settings = get_settings()
 
+# Task names - process_interview MUST match API producer
+TASK_PROCESS_INTERVIEW = "vibecheck.tasks.process_interview"
+TASK_FETCH_AUDIO = "vibecheck.tasks.fetch_audio"
+TASK_TRANSCRIBE = "vibecheck.tasks.transcribe"
+TASK_TRANSCRIBE_PART = "vibecheck.tasks.transcribe_part"
+TASK_MERGE_PARTS = "vibecheck.tasks.merge_parts"
+TASK_SUMMARIZE = "vibecheck.tasks.summarize"
+TASK_SUMMARIZE_BATCH = "vibecheck.tasks.summarize_batch"
+TASK_PERSIST = "vibecheck.tasks.persist"
+TASK_BACKFILL_SUMMARIES = "vibecheck.tasks.backfill_summaries"
+
+# Queue names - one per pipeline stage so each can be scaled separately
+QUEUE_DEFAULT = "celery"  # API producer publishes here
+QUEUE_FETCH = "fetch"
+QUEUE_TRANSCRIPTION = "transcription"
+QUEUE_SUMMARIZATION = "summarization"
+QUEUE_PERSIST = "persist"
+
 # Initialize Celery app - name MUST match API producer
 celery_app = Celery(
     "vibecheck",
@@ -28,7 +46,38 @@ celery_app.conf.update(
     task_time_limit=3600,  # Hard limit: 60 minutes (kills task)
     task_soft_time_limit=3300,  # Soft limit: 55 minutes (raises SoftTimeLimitExceeded)
     task_track_started=True,  # Track task state as STARTED
+    # Preloading children build their Whisper model before reporting up;
+    # the 4 s default would kill them mid-load
+    worker_proc_alive_timeout=(
+        settings.preload_child_timeout_seconds if settings.preload_models else 4.0
+    ),
+    # Pipeline stage routing. Run dedicated workers per queue, e.g.
+    #   celery -A app.main.celery_app worker -Q transcription --concurrency=2
+    #   celery -A app.main.celery_app worker -Q summarization --concurrency=1
+    # A worker only loads the models its queues need.
+    # With partitioned transcription, run one thread per partition so
+    # each job gets a free core slice:
+    #   celery -A app.main.celery_app worker -Q transcription --pool threads --concurrency=4
+    # Jobs at the fast and accurate quality tiers send transcribe and
+    # summarize to suffixed queues instead (see app.core.quality), e.g.
+    #   celery -A app.main.celery_app worker -Q transcription.fast
+    task_default_queue=QUEUE_DEFAULT,
+    task_routes={
+        TASK_PROCESS_INTERVIEW: {"queue": QUEUE_DEFAULT},
+        TASK_FETCH_AUDIO: {"queue": QUEUE_FETCH},
+        TASK_TRANSCRIBE: {"queue": QUEUE_TRANSCRIPTION},
+        TASK_TRANSCRIBE_PART: {"queue": QUEUE_TRANSCRIPTION},
+        # Light I/O callback; keep it off the busy transcription queue
+        TASK_MERGE_PARTS: {"queue": QUEUE_FETCH},
+        TASK_SUMMARIZE: {"queue": QUEUE_SUMMARIZATION},
+        TASK_SUMMARIZE_BATCH: {"queue": QUEUE_SUMMARIZATION},
+        TASK_PERSIST: {"queue": QUEUE_PERSIST},
+        TASK_BACKFILL_SUMMARIES: {"queue": QUEUE_SUMMARIZATION},
+    },
 )
 
 # Import tasks to register them with Celery
 from app import tasks  # noqa: F401, E402
+
+# Connect the worker signal handlers for model preloading
+from app import preload  # noqa: F401, E402
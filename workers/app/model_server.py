@@ -0,0 +1,189 @@
+"""Node-local model server shared by every Celery child on the host.
+
+Owns one Whisper model and one LLM, so worker concurrency can grow
+without duplicating weights. Concurrent requests are batched: Whisper
+windows through the BatchedTranscriptionEngine, LLM generations through
+a MicroBatchingBackend.
+
+Workers reach it through ``app.services.model_client`` when
+``MODEL_SERVER_URL`` is set. Run one per node, listening on the same URL::
+
+    python -m app.model_server
+"""
+
+import io
+import json
+import logging
+import os
+import socketserver
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+import numpy as np
+
+from app.autotune import tuned_options
+from app.core.config import get_settings
+from app.services.audio import SAMPLE_RATE
+from app.services.batched_transcription import BatchedTranscriptionEngine
+from app.services.summarization import SummarizationService
+from app.services.summarization_backends import MicroBatchingBackend, create_backend
+from app.services.transcription import TranscriptionService
+
+logger = logging.getLogger(__name__)
+
+
+class ModelServer:
+    """The models and the request operations served over HTTP."""
+
+    def __init__(self, settings):
+        self.transcription = TranscriptionService(
+            model_size=settings.transcription_model,
+            compute_type=settings.transcription_compute_type,
+            multilingual_model_size=settings.transcription_multilingual_model or None,
+            memory_budget_mb=settings.transcription_memory_budget_mb,
+            cpu_threads=settings.transcription_cpu_threads,
+            num_workers=settings.transcription_num_workers,
+        )
+        if settings.transcription_autotune and self.transcription.device == "cpu":
+            # Every worker process on the node shares this model
+            tuned = tuned_options(settings, self.transcription.model_size, shared=True)
+            for option, value in tuned.items():
+                setattr(self.transcription, option, value)
+        self.engine = BatchedTranscriptionEngine(
+            self.transcription,
+            batch_size=settings.transcription_batch_size,
+            max_wait_ms=settings.transcription_batch_max_wait_ms,
+        )
+        self.summarization = SummarizationService.from_settings(
+            settings,
+            backend=MicroBatchingBackend(
+                create_backend(settings),
+                batch_size=settings.summarization_batch_size,
+                max_wait_ms=settings.summarization_batch_max_wait_ms,
+            ),
+        )
+        for tier in self.summarization.cascade:
+            tier.backend = MicroBatchingBackend(
+                tier.backend,
+                batch_size=settings.summarization_batch_size,
+                max_wait_ms=settings.summarization_batch_max_wait_ms,
+            )
+
+    def load(self) -> None:
+        """Load every model up front so no request pays for it."""
+        self.engine._load_pipeline()
+        self.summarization.load()
+
+    def info(self) -> dict:
+        return {
+            "status": "ok",
+            "model_size": self.transcription.model_size,
+            "compute_type": self.transcription.compute_type,
+            "model_key": self.transcription.model_key,
+            "summarization_model": self.summarization.model_name,
+            "summarization_fingerprint": self.summarization.fingerprint,
+        }
+
+    def transcribe(self, data: bytes, language: str | None) -> dict:
+        """Transcribe an uploaded audio file."""
+        from faster_whisper import decode_audio
+
+        audio = decode_audio(io.BytesIO(data), sampling_rate=SAMPLE_RATE)
+        return self.engine.submit(audio, language).result().to_dict()
+
+    def transcribe_pcm(self, data: bytes, language: str | None) -> dict:
+        """Transcribe raw float32 PCM, reporting the language used."""
+        audio = np.frombuffer(data, dtype=np.float32)
+        language = language or self.transcription.detect_language(audio)
+        return self.engine.submit(audio, language).result().to_dict()
+
+    def detect_language(self, data: bytes) -> dict:
+        return {"language": self.transcription.detect_language(np.frombuffer(data, dtype=np.float32))}
+
+    def summarize(self, payload: dict) -> dict:
+        return {"summary": self.summarization.summarize(payload["transcript"])}
+
+    def summarize_batch(self, payload: dict) -> dict:
+        return {"summaries": self.summarization.summarize_batch(payload["transcripts"])}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Routes requests to the server's ModelServer."""
+
+    server_version = "VibeCheckModelServer/1.0"
+
+    def address_string(self) -> str:
+        # Unix socket peers have no (host, port) address
+        return self.client_address[0] if self.client_address else "unix"
+
+    def _send(self, status: int, body: dict) -> None:
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self) -> None:
+        if self.path == "/health":
+            self._send(200, self.server.models.info())
+        else:
+            self._send(404, {"error": f"Unknown path {self.path}"})
+
+    def do_POST(self) -> None:
+        models: ModelServer = self.server.models
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        language = self.headers.get("X-Language")
+        routes = {
+            "/transcribe": lambda: models.transcribe(body, language),
+            "/transcribe-pcm": lambda: models.transcribe_pcm(body, language),
+            "/detect-language": lambda: models.detect_language(body),
+            "/summarize": lambda: models.summarize(json.loads(body)),
+            "/summarize-batch": lambda: models.summarize_batch(json.loads(body)),
+        }
+        if self.path not in routes:
+            self._send(404, {"error": f"Unknown path {self.path}"})
+            return
+        try:
+            self._send(200, routes[self.path]())
+        except Exception as e:
+            logger.exception(f"Request to {self.path} failed")
+            self._send(500, {"error": str(e)})
+
+
+class _ThreadingUnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def create_server(url: str, models: ModelServer) -> socketserver.BaseServer:
+    """Bind an HTTP server for ``url`` (``http://host:port`` or ``unix:///path``)."""
+    parts = urlsplit(url)
+    if parts.scheme == "unix":
+        if os.path.exists(parts.path):
+            os.remove(parts.path)
+        server = _ThreadingUnixHTTPServer(parts.path, _Handler)
+    elif parts.scheme == "http":
+        server = ThreadingHTTPServer((parts.hostname or "127.0.0.1", parts.port or 80), _Handler)
+    else:
+        raise ValueError(f"Unsupported model server URL: {url}")
+    server.models = models
+    return server
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    settings = get_settings()
+    url = settings.model_server_url or "http://127.0.0.1:8765"
+
+    models = ModelServer(settings)
+    models.load()
+    server = create_server(url, models)
+    logger.info(f"Model server listening on {url}")
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
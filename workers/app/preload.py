@@ -0,0 +1,149 @@
+"""Opt-in model preloading for prefork Celery workers.
+
+With ``PRELOAD_MODELS=true`` the worker master loads the models its
+queues need before forking the pool, so the first task after a restart
+or a ``max-tasks-per-child`` recycle does not pay for a model load:
+
+- LLM: loaded in the master when it runs on CPU. Children inherit the
+  weights copy-on-write; they only read them, so the pages stay shared
+  (GGUF weights are memory-mapped and shared through the page cache).
+- Whisper: CTranslate2 starts its inference threads when a model is
+  built and threads do not survive fork, so the master only fetches the
+  model files into the page cache. Each child then builds its model
+  from memory at process start, before it accepts a task.
+- CUDA contexts cannot be inherited either, so on GPU every model is
+  built in the children at process start.
+
+Startup time and memory are logged for the master and every child, with
+or without preloading, so the two modes can be compared.
+"""
+
+import logging
+import os
+import time
+
+from celery.signals import worker_init, worker_process_init
+
+from app import tasks
+from app.core.config import get_settings
+from app.core.quality import QualityTier, tier_queue
+from app.main import QUEUE_SUMMARIZATION, QUEUE_TRANSCRIPTION
+
+logger = logging.getLogger(__name__)
+
+# smaps_rollup fields reported, in kB
+_MEMORY_FIELDS = {"Rss": "rss", "Pss": "pss", "Shared_Clean": "shared", "Shared_Dirty": "shared"}
+
+# Quality tiers whose models the children build at process start:
+# (whisper, llm); set in the master
+_child_models: tuple[list[QualityTier], list[QualityTier]] = ([], [])
+
+
+def memory_usage_mb() -> dict[str, float]:
+    """Memory of this process in MB, from /proc (empty where unavailable).
+
+    ``rss`` counts pages inherited copy-on-write in full in every child;
+    ``pss`` splits shared pages between the processes sharing them, so
+    summing it over the pool gives the real footprint.
+    """
+    usage = {"rss": 0.0, "pss": 0.0, "shared": 0.0}
+    try:
+        with open("/proc/self/smaps_rollup") as f:
+            for line in f:
+                name, _, value = line.partition(":")
+                if name in _MEMORY_FIELDS:
+                    usage[_MEMORY_FIELDS[name]] += int(value.split()[0]) / 1024
+    except (OSError, ValueError):
+        return {}
+    return usage
+
+
+def _format_memory(usage: dict[str, float]) -> str:
+    if not usage:
+        return "memory unavailable"
+    return (
+        f"RSS {usage['rss']:.0f} MB, PSS {usage['pss']:.0f} MB, "
+        f"shared {usage['shared']:.0f} MB"
+    )
+
+
+def _queue_models(worker) -> tuple[list[QualityTier], list[QualityTier]]:
+    """Quality tiers whose models (Whisper, LLM) the worker's queues need."""
+    consume_from = getattr(worker.app.amqp.queues, "consume_from", None)
+    if not consume_from:
+        # No -Q option: the worker consumes every stage queue, balanced only
+        return [QualityTier.BALANCED], [QualityTier.BALANCED]
+    return tuple(
+        [tier for tier in QualityTier if tier_queue(queue, tier) in consume_from]
+        for queue in (QUEUE_TRANSCRIPTION, QUEUE_SUMMARIZATION)
+    )
+
+
+@worker_init.connect
+def preload_in_master(sender=None, **kwargs) -> None:
+    """Load the worker's models in the master, before the pool forks."""
+    global _child_models
+    settings = get_settings()
+    if not settings.preload_models:
+        return
+    if settings.model_server_url:
+        logger.info("Model server configured, nothing to preload")
+        return
+
+    # torch.cuda.is_available() would otherwise initialize CUDA in the
+    # master, leaving it unusable in the forked children
+    os.environ.setdefault("PYTORCH_NVML_BASED_CUDA_CHECK", "1")
+
+    whisper, llm = _queue_models(sender)
+    before = memory_usage_mb()
+    start = time.perf_counter()
+
+    for tier in whisper:
+        transcription_service = tasks.get_transcription_service(tier)
+        if transcription_service.device == "cpu":
+            transcription_service.prefetch_model()
+    for tier in llm:
+        summarization_service = tasks.get_summarization_service(tier)
+        if getattr(summarization_service.backend, "device", "cpu") == "cpu":
+            summarization_service.load()
+        else:
+            logger.info("LLM runs on CUDA, children will load it at start")
+
+    _child_models = (whisper, llm)
+    logger.info(
+        f"Preloaded models in master in {time.perf_counter() - start:.1f}s "
+        f"(before: {_format_memory(before)}; after: {_format_memory(memory_usage_mb())})"
+    )
+
+
+@worker_init.connect
+def start_partitions(sender=None, **kwargs) -> None:
+    """Start the transcription partitions with the worker, preloading or not.
+
+    Spawned partition processes load their own models; partitioned
+    workers run a thread pool, so nothing forks after this.
+    """
+    settings = get_settings()
+    if not settings.partitioned_transcription or settings.model_server_url:
+        return
+    if QualityTier.BALANCED in _queue_models(sender)[0]:
+        tasks.get_partitioned_engine()
+
+
+@worker_process_init.connect
+def finish_child_startup(**kwargs) -> None:
+    """Build the models not inherited from the master and report startup."""
+    before = memory_usage_mb()
+    start = time.perf_counter()
+
+    whisper, llm = _child_models
+    for tier in whisper:
+        tasks.get_transcription_service(tier)._load_model()
+    for tier in llm:
+        # No-op when the master already loaded it
+        tasks.get_summarization_service(tier).load()
+
+    logger.info(
+        f"Worker child {os.getpid()} started in {time.perf_counter() - start:.1f}s "
+        f"(at fork: {_format_memory(before)}; ready: {_format_memory(memory_usage_mb())})"
+    )
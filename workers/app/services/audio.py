@@ -0,0 +1,254 @@
+"""Audio decoding, windowing and encoding helpers."""
+
+import io
+import logging
+import subprocess
+import threading
+import wave
+from typing import BinaryIO, Iterable, Iterator
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# faster-whisper expects 16 kHz mono float32 PCM
+SAMPLE_RATE = 16000
+
+# Bytes per read from the S3 body / ffmpeg stdout
+READ_CHUNK_BYTES = 64 * 1024
+
+
+def _feed_stdin(body: BinaryIO, stdin: BinaryIO, errors: list[Exception]) -> None:
+    """Copy the source stream into ffmpeg's stdin, then close it.
+
+    A read error is appended to ``errors`` for the consumer to raise;
+    ffmpeg only sees EOF, and would otherwise decode a truncated stream
+    as if it were complete.
+    """
+    try:
+        while True:
+            chunk = body.read(READ_CHUNK_BYTES)
+            if not chunk:
+                break
+            stdin.write(chunk)
+    except BrokenPipeError:
+        # ffmpeg exited early (e.g. undecodable input); stderr has the reason
+        pass
+    except Exception as e:
+        logger.error(f"Audio stream feed failed: {e}")
+        errors.append(e)
+    finally:
+        try:
+            stdin.close()
+        except OSError:
+            pass
+
+
+def _drain(stream: BinaryIO, chunks: list[bytes]) -> None:
+    """Read a pipe to EOF, so the writer never blocks on it."""
+    for chunk in iter(lambda: stream.read(READ_CHUNK_BYTES), b""):
+        chunks.append(chunk)
+
+
+def stream_pcm(body: BinaryIO, sample_rate: int = SAMPLE_RATE) -> Iterator[np.ndarray]:
+    """Decode an audio byte stream to mono float32 PCM as it arrives.
+
+    The source is piped through an ffmpeg subprocess on a feeder thread,
+    so decoded samples are yielded while the download is still running.
+    If the consumer stops early (e.g. closes the generator after an
+    error), ffmpeg is killed rather than left blocked on a full pipe.
+
+    Args:
+        body: Readable byte stream (e.g. the S3 ``get_object`` body).
+        sample_rate: Output sample rate in Hz.
+
+    Yields:
+        1-D float32 arrays of decoded samples.
+
+    Raises:
+        ConnectionError: If reading the source stream failed.
+        RuntimeError: If ffmpeg fails to decode the stream.
+    """
+    process = subprocess.Popen(
+        [
+            "ffmpeg",
+            "-nostdin",
+            "-loglevel", "error",
+            "-i", "pipe:0",
+            "-f", "f32le",
+            "-ac", "1",
+            "-ar", str(sample_rate),
+            "pipe:1",
+        ],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    feed_errors: list[Exception] = []
+    feeder = threading.Thread(
+        target=_feed_stdin, args=(body, process.stdin, feed_errors), daemon=True
+    )
+    feeder.start()
+    stderr_chunks: list[bytes] = []
+    stderr_reader = threading.Thread(
+        target=_drain, args=(process.stderr, stderr_chunks), daemon=True
+    )
+    stderr_reader.start()
+
+    # float32 samples are 4 bytes; carry partial samples to the next read
+    remainder = b""
+    finished = False
+    try:
+        while True:
+            data = process.stdout.read(READ_CHUNK_BYTES)
+            if not data:
+                break
+            data = remainder + data
+            usable = len(data) - (len(data) % 4)
+            remainder = data[usable:]
+            if usable:
+                yield np.frombuffer(data[:usable], dtype=np.float32)
+        finished = True
+    finally:
+        if not finished:
+            # Nobody reads stdout any more; unblock ffmpeg and the feeder
+            process.kill()
+        process.stdout.close()
+        feeder.join()
+        stderr_reader.join()
+        process.stderr.close()
+        returncode = process.wait()
+
+    if feed_errors:
+        raise ConnectionError(f"Audio stream read failed: {feed_errors[0]}") from feed_errors[0]
+    if returncode != 0:
+        stderr = b"".join(stderr_chunks).decode(errors="replace").strip()
+        raise RuntimeError(f"ffmpeg failed to decode audio stream: {stderr}")
+
+
+def find_quiet_cut(
+    audio: np.ndarray,
+    target: int,
+    search: int,
+    frame: int = SAMPLE_RATE // 10,
+) -> int:
+    """Find the quietest cut point at or before ``target``.
+
+    Looks back up to ``search`` samples and returns the middle of the
+    lowest-energy frame (the latest one on ties), so window cuts fall in
+    pauses, not mid-word.
+
+    Args:
+        audio: PCM samples.
+        target: Latest acceptable cut position (sample index).
+        search: How far back from ``target`` to search (samples).
+        frame: Frame length used for energy measurement (samples).
+
+    Returns:
+        Sample index to cut at.
+    """
+    target = min(target, len(audio))
+    start = max(0, target - search)
+    n_frames = (target - start) // frame
+    if n_frames < 1:
+        return target
+
+    region = audio[start : start + n_frames * frame].reshape(n_frames, frame)
+    energy = np.mean(region**2, axis=1)
+    quietest = n_frames - 1 - int(np.argmin(energy[::-1]))
+    return start + quietest * frame + frame // 2
+
+
+def iter_windows(
+    blocks: Iterable[np.ndarray],
+    window_seconds: float,
+    search_seconds: float = 5.0,
+    sample_rate: int = SAMPLE_RATE,
+) -> Iterator[tuple[float, np.ndarray]]:
+    """Regroup a PCM block stream into transcription windows.
+
+    Each window is at most ``window_seconds`` long and is cut at the
+    quietest point within its final ``search_seconds``.
+
+    Args:
+        blocks: Iterable of PCM arrays, e.g. from :func:`stream_pcm`.
+        window_seconds: Maximum window length in seconds.
+        search_seconds: Look-back for the quiet cut point in seconds.
+        sample_rate: Sample rate of the PCM stream.
+
+    Yields:
+        (offset_seconds, samples) tuples in stream order.
+    """
+    window = int(window_seconds * sample_rate)
+    search = int(search_seconds * sample_rate)
+    buffer = np.empty(0, dtype=np.float32)
+    offset = 0
+
+    for block in blocks:
+        buffer = np.concatenate((buffer, block))
+        while len(buffer) >= window:
+            cut = find_quiet_cut(buffer, window, search) or window
+            yield offset / sample_rate, buffer[:cut]
+            buffer = buffer[cut:]
+            offset += cut
+
+    if len(buffer):
+        yield offset / sample_rate, buffer
+
+
+def probe_duration(audio_path: str) -> float:
+    """Read an audio file's duration from its container metadata.
+
+    Args:
+        audio_path: Path to the audio file.
+
+    Returns:
+        Duration in seconds (0.0 if the container does not record it).
+    """
+    import av
+
+    with av.open(audio_path) as container:
+        if container.duration is None:
+            return 0.0
+        return container.duration / av.time_base
+
+
+def split_by_duration(
+    audio: np.ndarray,
+    segment_seconds: float,
+    search_seconds: float = 10.0,
+    sample_rate: int = SAMPLE_RATE,
+) -> list[tuple[int, np.ndarray]]:
+    """Split PCM into consecutive parts of roughly ``segment_seconds``.
+
+    Each cut is moved back to the quietest point within ``search_seconds``.
+
+    Returns:
+        (offset_samples, samples) tuples covering the audio in order.
+    """
+    return [
+        (round(offset * sample_rate), samples)
+        for offset, samples in iter_windows(
+            [audio], segment_seconds, search_seconds, sample_rate
+        )
+    ]
+
+
+def encode_wav(samples: np.ndarray, sample_rate: int = SAMPLE_RATE) -> bytes:
+    """Encode float32 PCM as a 16-bit mono WAV file.
+
+    Args:
+        samples: PCM samples in [-1, 1].
+        sample_rate: Sample rate in Hz.
+
+    Returns:
+        WAV file bytes.
+    """
+    pcm16 = (np.clip(samples, -1.0, 1.0) * 32767).astype("<i2")
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(pcm16.tobytes())
+    return buffer.getvalue()
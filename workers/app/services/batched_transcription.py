@@ -0,0 +1,276 @@
+"""Batched Whisper inference shared by concurrent transcription requests."""
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Optional
+
+import numpy as np
+
+from app.services.audio import SAMPLE_RATE
+from app.services.transcription import TranscriptResult, TranscriptionService, segment_dict
+
+logger = logging.getLogger(__name__)
+
+# Whisper's native input length; every window is padded to exactly this
+WINDOW_SAMPLES = 30 * SAMPLE_RATE
+
+
+def speech_windows(speech: list[dict], max_samples: int = WINDOW_SAMPLES) -> list[tuple[int, int]]:
+    """Group VAD speech spans into windows no longer than ``max_samples``.
+
+    Args:
+        speech: VAD speech spans as ``{"start": int, "end": int}`` sample dicts.
+        max_samples: Maximum window length.
+
+    Returns:
+        (start, end) sample ranges, in order.
+    """
+    spans = []
+    for span in speech:
+        # Speech longer than one window is split evenly at the limit
+        for start in range(span["start"], span["end"], max_samples):
+            spans.append((start, min(start + max_samples, span["end"])))
+
+    windows: list[tuple[int, int]] = []
+    for start, end in spans:
+        if windows and end - windows[-1][0] <= max_samples:
+            windows[-1] = (windows[-1][0], end)
+        else:
+            windows.append((start, end))
+    return windows
+
+
+@dataclass
+class _Request:
+    """One submitted recording, completed once all its windows are decoded."""
+
+    future: Future
+    pending: int
+    language: str
+    duration: float
+    segments: list[dict] = field(default_factory=list)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+@dataclass
+class _Window:
+    """A <=30 s slice of one request's audio awaiting a batch slot."""
+
+    request: _Request
+    offset: float  # Seconds from the start of the request's audio
+    samples: np.ndarray
+    language: str
+
+
+class BatchedTranscriptionEngine:
+    """Gathers speech windows from many requests into fixed-size batches.
+
+    Callers submit whole recordings; each is VAD-segmented into windows
+    that join a shared queue. A background thread drains the queue into
+    batches of up to ``batch_size`` windows (waiting at most
+    ``max_wait_ms`` for a batch to fill), runs them through faster-whisper's
+    batched pipeline in one call, and routes the segments back to their
+    owners.
+
+    Windows from one long recording fill batches on their own; windows
+    from concurrent requests in the same process share batches.
+    """
+
+    def __init__(
+        self,
+        service: TranscriptionService,
+        batch_size: int = 16,
+        max_wait_ms: int = 50,
+    ):
+        """Initialize the engine and start its batching thread.
+
+        Args:
+            service: Transcription service whose model is used.
+            batch_size: Maximum windows per inference call.
+            max_wait_ms: Longest wait for a batch to fill once one window
+                is queued.
+        """
+        self.service = service
+        self.batch_size = batch_size
+        self.max_wait_ms = max_wait_ms
+        self._pipeline = None
+        self._queue: queue.Queue[_Window] = queue.Queue()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        logger.info(
+            f"BatchedTranscriptionEngine started: batch_size={batch_size}, "
+            f"max_wait_ms={max_wait_ms}"
+        )
+
+    def _load_pipeline(self):
+        """Lazy-load the batched inference pipeline around the service model."""
+        if self._pipeline is None:
+            from faster_whisper import BatchedInferencePipeline
+
+            self._pipeline = BatchedInferencePipeline(model=self.service._load_model())
+        return self._pipeline
+
+    def submit(self, audio: np.ndarray, language: Optional[str] = None) -> Future:
+        """Queue a recording for batched transcription.
+
+        Args:
+            audio: 16 kHz mono float32 samples.
+            language: Language code; detected on the first 30 s if None.
+
+        Returns:
+            Future resolving to a TranscriptResult.
+        """
+        from faster_whisper.vad import VadOptions, get_speech_timestamps
+
+        future: Future = Future()
+        duration = len(audio) / SAMPLE_RATE
+        windows = speech_windows(get_speech_timestamps(audio, VadOptions()))
+        if not windows:
+            future.set_result(
+                TranscriptResult(
+                    segments=[],
+                    language=language,
+                    duration=duration,
+                    model=self.service.model_size,
+                )
+            )
+            return future
+
+        if language is None:
+            language = self.service.detect_language(audio[windows[0][0] :])
+        if self.service.model_for(language) != self.service.model_size:
+            # Other languages go to the multilingual model, outside the batches
+            future.set_result(self.service.transcribe_result(audio, language))
+            return future
+
+        request = _Request(
+            future=future, pending=len(windows), language=language, duration=duration
+        )
+        for start, end in windows:
+            self._queue.put(
+                _Window(request, start / SAMPLE_RATE, audio[start:end], language)
+            )
+        return future
+
+    def transcribe(
+        self, audio_path: str, language: Optional[str] = None
+    ) -> TranscriptResult:
+        """Decode an audio file and transcribe it through the shared batches.
+
+        Args:
+            audio_path: Path to the audio file.
+            language: Language code; auto-detected if None.
+
+        Returns:
+            TranscriptResult for the recording.
+        """
+        from faster_whisper import decode_audio
+
+        logger.info(f"Transcribing audio file in shared batches: {audio_path}")
+        audio = decode_audio(audio_path, sampling_rate=SAMPLE_RATE)
+        result = self.submit(audio, language).result()
+        logger.info(f"Transcription complete: {len(result.segments)} segments")
+        return result
+
+    def _next_batch(self) -> list[_Window]:
+        """Block for one window, then gather more until full or timed out."""
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.max_wait_ms / 1000
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        """Batching loop: one inference call per language group per batch."""
+        while True:
+            batch = self._next_batch()
+            groups: dict[str, list[_Window]] = {}
+            for window in batch:
+                groups.setdefault(window.language, []).append(window)
+
+            for language, windows in groups.items():
+                try:
+                    results = self._transcribe_batch(windows, language)
+                except Exception as e:
+                    logger.error(f"Batched transcription failed: {e}")
+                    for window in windows:
+                        if not window.request.future.done():
+                            window.request.future.set_exception(e)
+                    continue
+                for window, segments in zip(windows, results):
+                    self._complete(window, segments)
+
+    def _transcribe_batch(self, windows: list[_Window], language: str) -> list[list[dict]]:
+        """Run one batched inference call over windows from any requests.
+
+        Each window is zero-padded into its own 30 s slot of one
+        concatenated buffer, with one clip per slot, so the pipeline can
+        never merge two owners' audio into one decoding chunk. Whisper
+        pads every input to 30 s anyway, so the padding costs nothing.
+
+        Returns:
+            Segments per window, with times relative to the window start.
+        """
+        pipeline = self._load_pipeline()
+
+        buffer = np.zeros(len(windows) * WINDOW_SAMPLES, dtype=np.float32)
+        for slot, window in enumerate(windows):
+            start = slot * WINDOW_SAMPLES
+            buffer[start : start + len(window.samples)] = window.samples
+        clips = [
+            {"start": slot * WINDOW_SAMPLES, "end": (slot + 1) * WINDOW_SAMPLES}
+            for slot in range(len(windows))
+        ]
+
+        segments, _ = pipeline.transcribe(
+            buffer,
+            language=language,
+            beam_size=self.service.beam_size,
+            # The pipeline defaults to True, which stretches every segment
+            # over its whole 30 s slot; keep the speech timing unless the
+            # service trades it away
+            without_timestamps=self.service.without_timestamps,
+            clip_timestamps=clips,
+            batch_size=len(windows),
+        )
+
+        results: list[list[dict]] = [[] for _ in windows]
+        for segment in segments:
+            slot = min(int(segment.start // 30), len(windows) - 1)
+            base = slot * 30
+            results[slot].append(segment_dict(segment, -base))
+        return results
+
+    def _complete(self, window: _Window, segments: list[dict]) -> None:
+        """Attach a window's segments to its request; resolve when all are in."""
+        request = window.request
+        with request.lock:
+            request.segments.extend(
+                {
+                    **segment,
+                    "start": window.offset + segment["start"],
+                    "end": window.offset + segment["end"],
+                }
+                for segment in segments
+            )
+            request.pending -= 1
+            done = request.pending == 0
+        if done and not request.future.done():
+            request.future.set_result(
+                TranscriptResult(
+                    segments=sorted(request.segments, key=lambda segment: segment["start"]),
+                    language=request.language,
+                    duration=request.duration,
+                    model=self.service.model_size,
+                )
+            )
@@ -0,0 +1,124 @@
+"""Chunk planning and stitching for parallel transcription."""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Chunk:
+    """A slice of audio to transcribe independently.
+
+    ``start``/``end`` bound the audio handed to the model. ``own_start`` is
+    where this chunk's authoritative region begins; anything before it is
+    overlap with the previous chunk, present only for context.
+    All positions are sample indices.
+    """
+
+    start: int
+    end: int
+    own_start: int
+
+
+def plan_chunks(
+    speech: list[dict],
+    total_samples: int,
+    min_samples: int,
+    max_samples: int,
+    overlap_samples: int = 0,
+) -> list[Chunk]:
+    """Cut audio into chunks at silence boundaries.
+
+    Chunks grow speech span by speech span and are cut in the middle of
+    the next silence once they reach ``min_samples``. Speech that runs
+    past ``max_samples`` without a pause is force-split with
+    ``overlap_samples`` of shared context on each side of the cut.
+
+    Args:
+        speech: VAD speech spans as ``{"start": int, "end": int}`` sample
+            dicts, sorted and non-overlapping.
+        total_samples: Length of the audio.
+        min_samples: Minimum chunk length before cutting at a pause.
+        max_samples: Maximum chunk length.
+        overlap_samples: Context shared across forced (mid-speech) cuts.
+
+    Returns:
+        Chunks covering the audio in order.
+    """
+    if not speech:
+        return []
+
+    # Candidate cut points: midpoints of the silences between speech spans
+    cuts = [
+        (prev["end"] + nxt["start"]) // 2
+        for prev, nxt in zip(speech, speech[1:])
+    ]
+    chunks: list[Chunk] = []
+    own_start = 0
+    start = 0
+
+    def close(end: int, overlap: int) -> None:
+        nonlocal own_start, start
+        chunks.append(Chunk(start=start, end=min(end + overlap, total_samples), own_start=own_start))
+        own_start = end
+        start = max(0, end - overlap)
+
+    for cut in cuts + [total_samples]:
+        # Force-split speech that does not pause within max_samples
+        while cut - own_start > max_samples:
+            close(own_start + max_samples, overlap_samples)
+        if cut - own_start >= min_samples or cut == total_samples:
+            close(cut, 0)
+
+    return chunks
+
+
+def _dedupe_boundary(prev_text: str, next_text: str, max_words: int = 8) -> str:
+    """Drop words at the start of ``next_text`` that repeat the end of ``prev_text``."""
+    prev_words = prev_text.split()
+    next_words = next_text.split()
+
+    def norm(words: list[str]) -> list[str]:
+        return [w.lower().strip(".,!?;:\"'") for w in words]
+
+    for size in range(min(max_words, len(prev_words), len(next_words)), 0, -1):
+        if norm(prev_words[-size:]) == norm(next_words[:size]):
+            return " ".join(next_words[size:])
+    return next_text
+
+
+def stitch_segments(
+    chunk_segments: list[tuple[Chunk, list[dict]]],
+    sample_rate: int,
+) -> list[dict]:
+    """Merge per-chunk segments into one ordered, de-duplicated list.
+
+    Segments must already carry absolute times. A segment is kept by the
+    chunk whose authoritative region contains its midpoint, and words
+    repeated across a chunk boundary are dropped from the later segment.
+
+    Args:
+        chunk_segments: (chunk, segments) pairs in chunk order.
+        sample_rate: Sample rate used for the chunk sample positions.
+
+    Returns:
+        Segments with start, end and text, in time order.
+    """
+    merged: list[dict] = []
+    for index, (chunk, segments) in enumerate(chunk_segments):
+        own_start = chunk.own_start / sample_rate
+        own_end = (
+            chunk_segments[index + 1][0].own_start / sample_rate
+            if index + 1 < len(chunk_segments)
+            else float("inf")
+        )
+        first = True
+        for segment in segments:
+            midpoint = (segment["start"] + segment["end"]) / 2
+            if not own_start <= midpoint < own_end:
+                continue
+            if first and merged and chunk.start < chunk.own_start:
+                text = _dedupe_boundary(merged[-1]["text"], segment["text"])
+                segment = {**segment, "text": text}
+            first = False
+            if segment["text"]:
+                merged.append(segment)
+    return merged
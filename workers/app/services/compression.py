@@ -0,0 +1,103 @@
+"""Extractive transcript compression ahead of summarization.
+
+Sentences are scored by TextRank over TF-IDF cosine similarity, all in
+NumPy, and the top-ranked ones are kept in their original order up to a
+target share of the transcript's words. Greetings, filler and small talk
+share few terms with the rest of the interview, so they rank low and
+are dropped first.
+"""
+
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+# TextRank damping factor and power-iteration limits
+DAMPING = 0.85
+MAX_ITERATIONS = 100
+TOLERANCE = 1e-6
+
+
+def split_sentences(text: str) -> list[str]:
+    """Split text into sentences at terminal punctuation."""
+    return [sentence for sentence in re.split(r"(?<=[.!?])\s+", text.strip()) if sentence]
+
+
+def _terms(sentence: str) -> list[str]:
+    """Lowercased words of three or more letters."""
+    return [word for word in re.findall(r"[^\W\d_]+", sentence.lower()) if len(word) > 2]
+
+
+def rank_sentences(sentences: list[str]):
+    """TextRank score of each sentence (scores sum to 1).
+
+    Returns:
+        float64 array with one score per sentence.
+    """
+    import numpy as np
+
+    sentence_terms = [_terms(sentence) for sentence in sentences]
+    vocabulary = {term: i for i, term in enumerate(sorted({t for ts in sentence_terms for t in ts}))}
+    n = len(sentences)
+    if not vocabulary:
+        return np.full(n, 1.0 / n)
+
+    rows = np.repeat(np.arange(n), [len(terms) for terms in sentence_terms])
+    cols = np.fromiter(
+        (vocabulary[term] for terms in sentence_terms for term in terms), dtype=np.int64
+    )
+    tf = np.zeros((n, len(vocabulary)))
+    np.add.at(tf, (rows, cols), 1.0)
+
+    document_frequency = np.count_nonzero(tf, axis=0)
+    tfidf = tf * (np.log((1 + n) / (1 + document_frequency)) + 1)
+    norms = np.linalg.norm(tfidf, axis=1, keepdims=True)
+    tfidf = np.divide(tfidf, norms, out=np.zeros_like(tfidf), where=norms > 0)
+
+    similarity = tfidf @ tfidf.T
+    np.fill_diagonal(similarity, 0.0)
+    out_weight = similarity.sum(axis=1, keepdims=True)
+    # Sentences sharing no terms link to every sentence equally
+    transition = np.divide(
+        similarity, out_weight, out=np.full_like(similarity, 1.0 / n), where=out_weight > 0
+    )
+
+    scores = np.full(n, 1.0 / n)
+    for _ in range(MAX_ITERATIONS):
+        updated = (1 - DAMPING) / n + DAMPING * (transition.T @ scores)
+        if np.abs(updated - scores).sum() < TOLERANCE:
+            scores = updated
+            break
+        scores = updated
+    return scores
+
+
+def compress_transcript(transcript: str, ratio: float) -> str:
+    """Keep the top-ranked sentences, in order, up to ``ratio`` of the words.
+
+    Args:
+        transcript: Transcript text.
+        ratio: Share of the transcript's words to keep, in (0, 1].
+            1 returns the transcript unchanged.
+
+    Returns:
+        The kept sentences joined in their original order.
+    """
+    import numpy as np
+
+    sentences = split_sentences(transcript)
+    if ratio >= 1 or len(sentences) < 3:
+        return transcript
+
+    lengths = np.array([len(sentence.split()) for sentence in sentences])
+    target = ratio * lengths.sum()
+    order = np.argsort(-rank_sentences(sentences), kind="stable")
+    # Take sentences best-first until the target word count is reached
+    kept_count = int(np.searchsorted(np.cumsum(lengths[order]), target)) + 1
+    kept = np.sort(order[:kept_count])
+
+    logger.info(
+        f"Compressed transcript to {lengths[kept].sum()} of {lengths.sum()} words "
+        f"({len(kept)} of {len(sentences)} sentences)"
+    )
+    return " ".join(sentences[i] for i in kept)
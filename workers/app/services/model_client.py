@@ -0,0 +1,243 @@
+"""Thin clients for the node-local model server (see ``app.model_server``)."""
+
+import http.client
+import json
+import logging
+import socket
+from typing import Iterable, Iterator, Optional
+from urllib.parse import urlsplit
+
+from app.services.transcription import TranscriptResult
+
+logger = logging.getLogger(__name__)
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTPConnection over a Unix domain socket."""
+
+    def __init__(self, socket_path: str, timeout: float):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self) -> None:
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+
+class ModelServerClient:
+    """JSON-over-HTTP client for the model server.
+
+    Connection failures surface as ``OSError`` (retried by the pipeline
+    tasks); errors reported by the server raise ``RuntimeError``.
+    """
+
+    def __init__(self, url: str, timeout: float = 1800.0):
+        """Initialize the client.
+
+        Args:
+            url: ``http://host:port`` or ``unix:///path/to/socket``.
+            timeout: Seconds to wait for a response.
+        """
+        self.url = url
+        self.timeout = timeout
+        parts = urlsplit(url)
+        if parts.scheme == "unix":
+            self._socket_path = parts.path
+        elif parts.scheme == "http":
+            self._socket_path = None
+            self._host = parts.hostname or "127.0.0.1"
+            self._port = parts.port or 80
+        else:
+            raise ValueError(f"Unsupported model server URL: {url}")
+
+    def _connection(self) -> http.client.HTTPConnection:
+        if self._socket_path:
+            return _UnixHTTPConnection(self._socket_path, self.timeout)
+        return http.client.HTTPConnection(self._host, self._port, timeout=self.timeout)
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        body: Optional[bytes] = None,
+        headers: Optional[dict] = None,
+    ) -> dict:
+        """Send one request and decode the JSON response."""
+        connection = self._connection()
+        try:
+            connection.request(method, path, body=body, headers=headers or {})
+            response = connection.getresponse()
+            data = json.loads(response.read() or b"{}")
+        finally:
+            connection.close()
+        if response.status >= 400:
+            raise RuntimeError(f"Model server {path} failed: {data.get('error', response.reason)}")
+        return data
+
+    def post_json(self, path: str, payload: dict) -> dict:
+        """POST a JSON payload."""
+        return self.request(
+            "POST", path, json.dumps(payload).encode(), {"Content-Type": "application/json"}
+        )
+
+    def post_bytes(self, path: str, data: bytes, language: Optional[str] = None) -> dict:
+        """POST raw bytes (audio file or float32 PCM)."""
+        headers = {"Content-Type": "application/octet-stream"}
+        if language:
+            headers["X-Language"] = language
+        return self.request("POST", path, data, headers)
+
+
+class RemoteTranscriptionService:
+    """TranscriptionService stand-in that runs Whisper on the model server.
+
+    The server decodes with its shared batched engine, so concurrent jobs
+    on the node share inference batches without loading their own model.
+    """
+
+    def __init__(self, client: ModelServerClient):
+        self.client = client
+        self._info: Optional[dict] = None
+
+    def _server_info(self) -> dict:
+        if self._info is None:
+            self._info = self.client.request("GET", "/health")
+        return self._info
+
+    @property
+    def model_size(self) -> str:
+        return self._server_info()["model_size"]
+
+    @property
+    def compute_type(self) -> str:
+        return self._server_info()["compute_type"]
+
+    @property
+    def model_key(self) -> str:
+        info = self._server_info()
+        return info.get("model_key", info["model_size"])
+
+    def transcribe_result(
+        self, audio_path: str, language: Optional[str] = None
+    ) -> TranscriptResult:
+        """Upload an audio file for transcription."""
+        logger.info(f"Transcribing on model server: {audio_path}")
+        with open(audio_path, "rb") as f:
+            data = f.read()
+        return TranscriptResult.from_dict(self.client.post_bytes("/transcribe", data, language))
+
+    def transcribe_with_timestamps(
+        self, audio_path: str, language: Optional[str] = None
+    ) -> list[dict]:
+        """Upload an audio file for transcription.
+
+        Returns:
+            List of segments with start, end, text and confidences.
+        """
+        return self.transcribe_result(audio_path, language).segments
+
+    def transcribe(self, audio_path: str) -> str:
+        """Transcribe an audio file to text."""
+        return self.transcribe_result(audio_path).text
+
+    def transcribe_chunked(
+        self, audio_path: str, language: Optional[str] = None, **kwargs
+    ) -> TranscriptResult:
+        """Transcribe a long recording; the server batches its windows."""
+        return self.transcribe_result(audio_path, language)
+
+    def detect_language(self, audio) -> str:
+        """Detect the spoken language of 16 kHz mono float32 samples."""
+        return self.client.post_bytes("/detect-language", audio.tobytes())["language"]
+
+    def iter_stream_segments(
+        self,
+        pcm_blocks: Iterable,
+        window_seconds: float = 30.0,
+        language: Optional[str] = None,
+    ) -> Iterator[dict]:
+        """Transcribe a PCM stream window by window on the server.
+
+        Yields:
+            Segments with start, end (stream-relative seconds) and text.
+        """
+        for _, _, _, segments, _ in self._transcribe_windows(
+            pcm_blocks, window_seconds, language
+        ):
+            yield from segments
+
+    def transcribe_stream(
+        self,
+        pcm_blocks: Iterable,
+        window_seconds: float = 30.0,
+        language: Optional[str] = None,
+    ) -> TranscriptResult:
+        """Transcribe a whole PCM stream on the server, window by window."""
+        result = TranscriptResult(segments=[], language=language)
+        for offset, length, language, segments, model in self._transcribe_windows(
+            pcm_blocks, window_seconds, language
+        ):
+            result.segments.extend(segments)
+            result.language = language
+            result.duration = offset + length
+            result.model = model
+        return result
+
+    def _transcribe_windows(
+        self, pcm_blocks: Iterable, window_seconds: float, language: Optional[str] = None
+    ) -> Iterator[tuple[float, float, str, list[dict], Optional[str]]]:
+        """(offset, window length in seconds, language, segments, model) per window."""
+        from app.services.audio import SAMPLE_RATE, iter_windows
+
+        # Detected on the first window unless given, then reused
+        for offset, window in iter_windows(pcm_blocks, window_seconds):
+            result = self.client.post_bytes("/transcribe-pcm", window.tobytes(), language)
+            language = result["language"]
+            yield (
+                offset,
+                len(window) / SAMPLE_RATE,
+                language,
+                [
+                    {
+                        **segment,
+                        "start": offset + segment["start"],
+                        "end": offset + segment["end"],
+                    }
+                    for segment in result["segments"]
+                ],
+                result.get("model"),
+            )
+
+
+class RemoteSummarizationService:
+    """SummarizationService stand-in that runs the LLM on the model server."""
+
+    def __init__(self, client: ModelServerClient):
+        self.client = client
+        self._info: Optional[dict] = None
+
+    def _server_info(self) -> dict:
+        if self._info is None:
+            self._info = self.client.request("GET", "/health")
+        return self._info
+
+    @property
+    def model_name(self) -> str:
+        return self._server_info()["summarization_model"]
+
+    @property
+    def fingerprint(self) -> str:
+        return self._server_info()["summarization_fingerprint"]
+
+    def summarize(self, transcript: str) -> dict:
+        """Summarize an interview transcript on the server."""
+        logger.info(f"Summarizing on model server ({len(transcript)} chars)")
+        return self.client.post_json("/summarize", {"transcript": transcript})["summary"]
+
+    def summarize_batch(self, transcripts: list[str]) -> list[dict]:
+        """Summarize several transcripts in one request; the server batches them."""
+        logger.info(f"Summarizing {len(transcripts)} transcripts on model server")
+        return self.client.post_json("/summarize-batch", {"transcripts": transcripts})[
+            "summaries"
+        ]
@@ -0,0 +1,142 @@
+"""Whisper models pinned to fixed partitions of a node's CPU cores."""
+
+import logging
+import multiprocessing
+import os
+import queue
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Optional
+
+from app.services.transcription import TranscriptResult, TranscriptionService
+
+logger = logging.getLogger(__name__)
+
+# Service owned by each partition process
+_partition_service: Optional[TranscriptionService] = None
+
+
+def partition_cores(cores: list[int], partitions: int) -> list[list[int]]:
+    """Split cores into contiguous, near-equal slices.
+
+    Contiguous slices keep a partition on neighbouring cores (usually
+    one socket or CCX, sharing cache). Extra cores go to the first
+    slices.
+
+    Args:
+        cores: Usable core ids.
+        partitions: Number of slices; capped at the number of cores.
+
+    Returns:
+        One list of core ids per partition.
+    """
+    cores = sorted(cores)
+    partitions = max(1, min(partitions, len(cores)))
+    size, extra = divmod(len(cores), partitions)
+    slices = []
+    start = 0
+    for index in range(partitions):
+        end = start + size + (index < extra)
+        slices.append(cores[start:end])
+        start = end
+    return slices
+
+
+def _init_partition(cores: list[int], options: dict[str, Any]) -> None:
+    """Pin a partition process to its cores and load its models there."""
+    global _partition_service
+
+    os.sched_setaffinity(0, cores)
+    _partition_service = TranscriptionService(cpu_threads=len(cores), num_workers=1, **options)
+    _partition_service._load_model()
+
+
+def _partition_cores() -> list[int]:
+    """Cores a partition process is pinned to (loads it on first call)."""
+    return sorted(os.sched_getaffinity(0))
+
+
+def _transcribe_in_partition(audio_path: str, language: Optional[str]) -> TranscriptResult:
+    """Transcribe one recording with the partition's service."""
+    return _partition_service.transcribe_result(audio_path, language)
+
+
+class PartitionedTranscriptionEngine:
+    """Runs concurrent transcriptions on dedicated slices of the CPU.
+
+    One transcription alone leaves cores idle on a large node, while
+    several sharing one model's thread pool (or several models with
+    default thread counts) oversubscribe the cores and thrash. This
+    engine splits the usable cores into ``partitions`` fixed slices and
+    starts one process per slice, pinned to it, with its own models
+    using exactly one thread per core.
+
+    Each call takes a free partition, waiting for one if all are busy,
+    so a thread-pool worker with ``partitions`` threads keeps every
+    slice busy without oversubscribing any.
+    """
+
+    def __init__(self, service: TranscriptionService, partitions: int):
+        """Start the partition processes and load their models.
+
+        Args:
+            service: Service whose models and decoding options each
+                partition copies; its thread settings are replaced by the
+                partition's core count.
+            partitions: Number of core slices (and model instances).
+        """
+        options = {
+            "model_size": service.model_size,
+            "device": service.device,
+            "compute_type": service.compute_type,
+            "multilingual_model_size": service.multilingual_model_size,
+            "memory_budget_mb": service.memory_budget_mb,
+            "beam_size": service.beam_size,
+            "without_timestamps": service.without_timestamps,
+        }
+        self.cores = partition_cores(list(os.sched_getaffinity(0)), partitions)
+        self._pools = [
+            ProcessPoolExecutor(
+                max_workers=1,
+                # Spawn, not fork: never copy a parent holding model threads
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_partition,
+                initargs=(cores, options),
+            )
+            for cores in self.cores
+        ]
+        # Load every partition up front rather than on its first job
+        for pool in self._pools:
+            pool.submit(_partition_cores).result()
+        self._free: queue.Queue[int] = queue.Queue()
+        for index in range(len(self._pools)):
+            self._free.put(index)
+        logger.info(
+            f"PartitionedTranscriptionEngine started: {len(self.cores)} partitions x "
+            f"{[len(cores) for cores in self.cores]} cores"
+        )
+
+    def transcribe(self, audio_path: str, language: Optional[str] = None) -> TranscriptResult:
+        """Transcribe an audio file on the next free partition.
+
+        Args:
+            audio_path: Path to the audio file.
+            language: Language code; auto-detected if None.
+
+        Returns:
+            TranscriptResult for the recording.
+        """
+        index = self._free.get()
+        try:
+            logger.info(
+                f"Transcribing on partition {index} (cores {self.cores[index]}): {audio_path}"
+            )
+            return self._pools[index].submit(
+                _transcribe_in_partition, audio_path, language
+            ).result()
+        finally:
+            self._free.put(index)
+
+    def shutdown(self) -> None:
+        """Stop every partition process."""
+        for pool in self._pools:
+            pool.shutdown()
@@ -1,8 +1,9 @@
 """S3 service for downloading audio files."""
 
+import hashlib
 import logging
 import os
-from typing import Optional
+from typing import BinaryIO, Optional
 
 import boto3
 from botocore.exceptions import ClientError
@@ -11,6 +12,29 @@ from app.core.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Bytes per read when streaming an object body
+STREAM_CHUNK_BYTES = 1024 * 1024
+
+
+class HashingStream:
+    """Readable stream wrapper that SHA-256 hashes bytes as they are read."""
+
+    def __init__(self, stream: BinaryIO):
+        self._stream = stream
+        self._sha256 = hashlib.sha256()
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._stream.read(size)
+        self._sha256.update(data)
+        return data
+
+    def hexdigest(self) -> str:
+        """Hash of all bytes read so far."""
+        return self._sha256.hexdigest()
+
+    def close(self) -> None:
+        self._stream.close()
+
 
 class S3Service:
     """Service for S3/MinIO file operations."""
@@ -53,6 +77,90 @@ class S3Service:
             logger.error(f"Failed to download file: {e}")
             raise
 
+    def download_file_with_hash(self, s3_key: str, local_path: str) -> str:
+        """Download a file from S3, hashing its content on the way.
+
+        Args:
+            s3_key: The S3 object key.
+            local_path: The local file path to save to.
+
+        Returns:
+            Hex SHA-256 digest of the object content.
+
+        Raises:
+            ClientError: If the download fails.
+        """
+        os.makedirs(os.path.dirname(local_path), exist_ok=True)
+
+        body = HashingStream(self.open_stream(s3_key))
+        try:
+            with open(local_path, "wb") as f:
+                while chunk := body.read(STREAM_CHUNK_BYTES):
+                    f.write(chunk)
+        finally:
+            body.close()
+
+        digest = body.hexdigest()
+        logger.info(f"Download complete: {local_path} (sha256={digest[:12]})")
+        return digest
+
+    def open_stream(self, s3_key: str):
+        """Open a streaming read of an S3 object.
+
+        Args:
+            s3_key: The S3 object key.
+
+        Returns:
+            The ``get_object`` body, a readable stream of the object bytes.
+
+        Raises:
+            ClientError: If the object cannot be opened.
+        """
+        logger.info(f"Streaming s3://{self._bucket}/{s3_key}")
+        try:
+            response = self._client.get_object(Bucket=self._bucket, Key=s3_key)
+            return response["Body"]
+        except ClientError as e:
+            logger.error(f"Failed to open stream: {e}")
+            raise
+
+    def upload_bytes(self, s3_key: str, data: bytes, content_type: str) -> None:
+        """Upload bytes to S3.
+
+        Args:
+            s3_key: The S3 object key.
+            data: Object content.
+            content_type: MIME type of the content.
+
+        Raises:
+            ClientError: If the upload fails.
+        """
+        logger.info(f"Uploading s3://{self._bucket}/{s3_key} ({len(data)} bytes)")
+        try:
+            self._client.put_object(
+                Bucket=self._bucket, Key=s3_key, Body=data, ContentType=content_type
+            )
+        except ClientError as e:
+            logger.error(f"Failed to upload file: {e}")
+            raise
+
+    def delete_files(self, s3_keys: list[str]) -> None:
+        """Delete objects from S3, logging (not raising) on failure.
+
+        Args:
+            s3_keys: The S3 object keys.
+        """
+        if not s3_keys:
+            return
+        try:
+            self._client.delete_objects(
+                Bucket=self._bucket,
+                Delete={"Objects": [{"Key": key} for key in s3_keys], "Quiet": True},
+            )
+            logger.info(f"Deleted {len(s3_keys)} objects from s3://{self._bucket}")
+        except ClientError as e:
+            logger.warning(f"Failed to delete files: {e}")
+
     def file_exists(self, s3_key: str) -> bool:
         """Check if a file exists in S3.
 
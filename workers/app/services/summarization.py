@@ -1,9 +1,18 @@
 """Summarization service using Llama 3.3 8B."""
 
+import hashlib
 import json
 import logging
 import re
-from typing import Any, Optional
+from dataclasses import dataclass
+from typing import Any, Optional, Sequence
+
+from app.services.summarization_backends import (
+    GENERATION_KWARGS,
+    SummarizationBackend,
+    TransformersBackend,
+    create_backend,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +32,111 @@ USER_PROMPT_TEMPLATE = """Transcript:
 
 Provide your analysis as JSON:"""
 
+# Map step: each token-bounded window of a long transcript is analyzed alone
+MAP_SYSTEM_PROMPT = """You are an expert interview analyst. You will receive one section of a longer interview transcript.
+
+Analyze only this section and provide a JSON response with these exact keys:
+- "section_summary": A 1-2 sentence summary of this section
+- "key_topics": An array of the main topics discussed in this section
+- "strengths": An array of positive observations about the interviewee (may be empty)
+- "areas_for_improvement": An array of constructive feedback points (may be empty)
+- "sentiment_score": A float between -1.0 (very negative) and 1.0 (very positive) representing the tone of this section
+
+Respond ONLY with valid JSON. No additional text or explanation."""
+
+MAP_USER_PROMPT_TEMPLATE = """Transcript section {index} of {total}:
+{transcript}
+
+Provide your analysis of this section as JSON:"""
+
+# Combine step: merges a group of section analyses into one section analysis
+COMBINE_USER_PROMPT_TEMPLATE = """Analyses of consecutive sections of one interview, in order:
+{partials}
+
+Merge them into a single analysis of these sections, using the same JSON keys:"""
+
+# Reduce step: turns the section analyses into the final analysis
+REDUCE_USER_PROMPT_TEMPLATE = """The interview transcript was too long to read at once, so it was analyzed in sections. Section analyses, in order:
+{partials}
+
+Provide your analysis of the whole interview as JSON:"""
+
+# Returned when the model output cannot be parsed
+FALLBACK_SUMMARY = {
+    "executive_summary": "Analysis could not be completed.",
+    "key_topics": [],
+    "strengths": [],
+    "areas_for_improvement": [],
+    "sentiment_score": 0.0,
+}
+
+MAP_REQUIRED_KEYS = [
+    "section_summary",
+    "key_topics",
+    "strengths",
+    "areas_for_improvement",
+    "sentiment_score",
+]
+
+# JSON schemas enforced token by token in constrained-decoding mode
+_STRING_ARRAY = {"type": "array", "items": {"type": "string"}}
+
+ANALYSIS_JSON_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "executive_summary": {"type": "string"},
+        "key_topics": _STRING_ARRAY,
+        "strengths": _STRING_ARRAY,
+        "areas_for_improvement": _STRING_ARRAY,
+        "sentiment_score": {"type": "number", "minimum": -1.0, "maximum": 1.0},
+    },
+    "required": [
+        "executive_summary",
+        "key_topics",
+        "strengths",
+        "areas_for_improvement",
+        "sentiment_score",
+    ],
+    "additionalProperties": False,
+}
+
+SECTION_JSON_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "section_summary": {"type": "string"},
+        "key_topics": _STRING_ARRAY,
+        "strengths": _STRING_ARRAY,
+        "areas_for_improvement": _STRING_ARRAY,
+        "sentiment_score": {"type": "number", "minimum": -1.0, "maximum": 1.0},
+    },
+    "required": MAP_REQUIRED_KEYS,
+    "additionalProperties": False,
+}
+
+
+LIST_KEYS = ["key_topics", "strengths", "areas_for_improvement"]
+
+# Stands in for sections left out of an over-budget transcript
+OMISSION_MARKER = "[...]"
+
+# Chat-template tokens around the prompts (role headers, end-of-turn)
+CHAT_TEMPLATE_TOKENS = 32
+
+
+def _information_density(text: str) -> float:
+    """Share of distinct content words in text (fillers and repeats score low)."""
+    words = [word for word in re.findall(r"[^\W\d_]+", text.lower()) if len(word) > 3]
+    return len(set(words)) / len(words) if words else 0.0
+
+
+@dataclass
+class CascadeTier:
+    """A cheaper model tried before the service's own backend."""
+
+    name: str  # Recorded as the summary's model_tier when this tier succeeds
+    backend: SummarizationBackend
+    max_input_tokens: int  # Longer transcripts skip straight past this tier
+
 
 class SummarizationService:
     """Service for summarizing interview transcripts using Llama 3.3 8B."""
@@ -32,6 +146,18 @@ class SummarizationService:
         model_name: str = "meta-llama/Llama-3.3-8B-Instruct",
         device: Optional[str] = None,
         load_in_4bit: bool = True,
+        map_reduce: bool = True,
+        max_input_tokens: int = 24000,
+        window_tokens: int = 6000,
+        reduce_fan_in: int = 8,
+        batch_size: int = 4,
+        reuse_prompt_cache: bool = True,
+        constrained_decoding: bool = False,
+        draft_model_name: str = "",
+        cascade: Sequence[CascadeTier] = (),
+        min_list_items: int = 1,
+        compression_ratio: float = 1.0,
+        backend: Optional[SummarizationBackend] = None,
     ):
         """Initialize the summarization service.
 
@@ -39,66 +165,117 @@ class SummarizationService:
             model_name: HuggingFace model name
             device: Device to use ('cuda' or 'cpu'). Auto-detected if None.
             load_in_4bit: Whether to load model with 4-bit quantization
+            map_reduce: Summarize transcripts over max_input_tokens by
+                map-reduce over windows (otherwise they are cut down
+                to their most informative sections)
+            max_input_tokens: Longest transcript summarized in one pass
+            window_tokens: Transcript tokens per map-step window
+            reduce_fan_in: Most section analyses merged by one generation
+            batch_size: Conversations per batched generation
+            reuse_prompt_cache: Prefill each system prompt once and reuse
+                its KV cache for every single-conversation generation
+            constrained_decoding: Restrict generation to the output JSON
+                schema (transformers backend requires lm-format-enforcer)
+            draft_model_name: Small model from model_name's tokenizer family
+                used for assisted (speculative) decoding; empty = off
+            cascade: Cheaper tiers tried in order before the backend. A
+                tier's summary is kept only if it parses, validates and
+                passes the quality checks; otherwise the next tier runs.
+            min_list_items: Quality check for cascade tiers: fewest items
+                in key_topics, strengths and areas_for_improvement
+            compression_ratio: Share of each transcript's words kept by
+                extractive compression before summarizing; 1 = off
+            backend: Inference backend. Defaults to a TransformersBackend
+                built from model_name, device, load_in_4bit,
+                reuse_prompt_cache and draft_model_name.
         """
-        self.model_name = model_name
-        self.load_in_4bit = load_in_4bit
-        self._pipeline = None
-
-        # Auto-detect device
-        if device is None:
-            try:
-                import torch
-
-                self.device = "cuda" if torch.cuda.is_available() else "cpu"
-            except ImportError:
-                self.device = "cpu"
-        else:
-            self.device = device
-
-        # 4-bit quantization requires CUDA
-        if self.device == "cpu" and self.load_in_4bit:
-            logger.warning("4-bit quantization requires CUDA. Disabling.")
-            self.load_in_4bit = False
+        self.backend = backend or TransformersBackend(
+            model_name=model_name,
+            device=device,
+            load_in_4bit=load_in_4bit,
+            reuse_prompt_cache=reuse_prompt_cache,
+            draft_model_name=draft_model_name,
+        )
+        self.map_reduce = map_reduce
+        self.max_input_tokens = max_input_tokens
+        self.window_tokens = window_tokens
+        self.reduce_fan_in = reduce_fan_in
+        self.batch_size = batch_size
+        self.constrained_decoding = constrained_decoding
+        self.cascade = list(cascade)
+        self.min_list_items = min_list_items
+        self.compression_ratio = compression_ratio
+        self._prompt_overhead: Optional[int] = None
 
         logger.info(
-            f"SummarizationService initialized: model={model_name}, "
-            f"device={self.device}, 4bit={self.load_in_4bit}"
+            f"SummarizationService initialized: backend={type(self.backend).__name__}, "
+            f"cascade={[tier.name for tier in self.cascade]}"
         )
 
-    def _load_pipeline(self):
-        """Lazy-load the LLM pipeline."""
-        if self._pipeline is None:
-            import torch
-            from transformers import pipeline, BitsAndBytesConfig
+    @classmethod
+    def from_settings(
+        cls, settings, backend: Optional[SummarizationBackend] = None
+    ) -> "SummarizationService":
+        """Build the service from worker settings.
 
-            logger.info(f"Loading LLM model: {self.model_name}")
+        Args:
+            settings: Worker Settings.
+            backend: Backend to use instead of the configured one.
+        """
+        return cls(
+            backend=backend or create_backend(settings),
+            cascade=[
+                CascadeTier(
+                    name=model,
+                    backend=create_backend(settings, model=model),
+                    max_input_tokens=settings.summarization_cascade_max_input_tokens,
+                )
+                for model in settings.summarization_cascade_models
+            ],
+            min_list_items=settings.summarization_min_list_items,
+            compression_ratio=settings.summarization_compression_ratio,
+            map_reduce=settings.summarization_map_reduce,
+            max_input_tokens=settings.summarization_max_input_tokens,
+            window_tokens=settings.summarization_window_tokens,
+            reduce_fan_in=settings.summarization_reduce_fan_in,
+            batch_size=settings.summarization_batch_size,
+            constrained_decoding=settings.summarization_constrained_decoding,
+        )
 
-            model_kwargs = {"torch_dtype": torch.float16}
+    @property
+    def model_name(self) -> str:
+        """Model identifier of the final backend."""
+        return self.backend.name
 
-            if self.load_in_4bit:
-                quantization_config = BitsAndBytesConfig(
-                    load_in_4bit=True,
-                    bnb_4bit_compute_dtype=torch.float16,
-                    bnb_4bit_use_double_quant=True,
-                    bnb_4bit_quant_type="nf4",
-                )
-                model_kwargs["quantization_config"] = quantization_config
-                model_kwargs["device_map"] = "auto"
-            else:
-                model_kwargs["device_map"] = self.device
-
-            self._pipeline = pipeline(
-                "text-generation",
-                model=self.model_name,
-                model_kwargs=model_kwargs,
-                max_new_tokens=1024,
-                do_sample=True,
-                temperature=0.1,
-                top_p=0.9,
-            )
-            logger.info("LLM model loaded successfully")
+    @property
+    def fingerprint(self) -> str:
+        """Hash of everything besides the transcript that shapes a summary.
 
-        return self._pipeline
+        Covers the prompts, the models, the generation parameters and the
+        input settings, so summaries cached under one fingerprint are only
+        reused while all of them stay the same.
+        """
+        config = {
+            "prompts": [
+                SYSTEM_PROMPT,
+                USER_PROMPT_TEMPLATE,
+                MAP_SYSTEM_PROMPT,
+                MAP_USER_PROMPT_TEMPLATE,
+                COMBINE_USER_PROMPT_TEMPLATE,
+                REDUCE_USER_PROMPT_TEMPLATE,
+            ],
+            "model": self.backend.name,
+            "generation": GENERATION_KWARGS,
+            "constrained_decoding": self.constrained_decoding,
+            "map_reduce": self.map_reduce,
+            "max_input_tokens": self.max_input_tokens,
+            "window_tokens": self.window_tokens,
+            "reduce_fan_in": self.reduce_fan_in,
+            "compression_ratio": self.compression_ratio,
+            "cascade": [[tier.name, tier.max_input_tokens] for tier in self.cascade],
+            "min_list_items": self.min_list_items,
+        }
+        return hashlib.sha256(json.dumps(config, sort_keys=True).encode()).hexdigest()
 
     def _extract_json(self, text: str) -> dict[str, Any]:
         """Extract JSON from model output, handling markdown code blocks."""
@@ -140,49 +317,384 @@ class SummarizationService:
 
         return data
 
-    def summarize(self, transcript: str) -> dict[str, Any]:
-        """Summarize an interview transcript.
+    def _quality_problem(self, data: dict[str, Any]) -> Optional[str]:
+        """Why a validated summary is not good enough to keep, or None."""
+        if not str(data["executive_summary"]).strip():
+            return "empty executive_summary"
+        for key in LIST_KEYS:
+            if len(data[key]) < self.min_list_items:
+                return f"{key} has fewer than {self.min_list_items} items"
+        return None
 
-        Args:
-            transcript: The interview transcript text.
+    def _count_tokens(self, text: str) -> int:
+        """Count tokens in text with the backend's tokenizer."""
+        return self.backend.count_tokens(text)
 
-        Returns:
-            Dictionary with executive_summary, key_topics, strengths,
-            areas_for_improvement, and sentiment_score.
+    def _input_budget(self, backend: SummarizationBackend, limit: int) -> int:
+        """Transcript tokens a single-pass prompt on backend can hold.
+
+        At most ``limit``, and small enough that the prompts and a
+        full-length reply fit the model's context window.
+        """
+        context_tokens = backend.context_tokens
+        if not context_tokens:
+            return limit
+        if self._prompt_overhead is None:
+            self._prompt_overhead = (
+                self._count_tokens(SYSTEM_PROMPT)
+                + self._count_tokens(USER_PROMPT_TEMPLATE.format(transcript=""))
+                + CHAT_TEMPLATE_TOKENS
+            )
+        available = context_tokens - self._prompt_overhead - GENERATION_KWARGS["max_new_tokens"]
+        return max(1, min(limit, available))
+
+    def load(self) -> None:
+        """Load the backend and every cascade tier."""
+        self.backend.load()
+        for tier in self.cascade:
+            tier.backend.load()
+
+    def _generate(
+        self,
+        messages: list[dict],
+        schema: Optional[dict] = None,
+        backend: Optional[SummarizationBackend] = None,
+        **generate_kwargs,
+    ) -> str:
+        """Run one chat generation and return the assistant reply text.
+
+        With constrained_decoding, the reply is forced to match ``schema``.
+        ``backend`` defaults to the service's own.
         """
-        pipe = self._load_pipeline()
+        return (backend or self.backend).generate(
+            messages,
+            schema=schema if self.constrained_decoding else None,
+            **generate_kwargs,
+        )
+
+    def _generate_batch(
+        self,
+        conversations: list[list[dict]],
+        schema: Optional[dict] = None,
+        backend: Optional[SummarizationBackend] = None,
+        **generate_kwargs,
+    ) -> list[str]:
+        """Run chat generations in batches of batch_size; replies in input order."""
+        return (backend or self.backend).generate_batch(
+            conversations,
+            schema=schema if self.constrained_decoding else None,
+            batch_size=self.batch_size,
+            **generate_kwargs,
+        )
+
+    def _split_windows(self, transcript: str, max_tokens: int) -> list[str]:
+        """Split a transcript into consecutive windows of at most max_tokens.
 
-        # Truncate very long transcripts to fit context window
-        max_chars = 100000  # ~25k tokens, safe for 128k context
-        if len(transcript) > max_chars:
-            logger.warning(
-                f"Transcript too long ({len(transcript)} chars), truncating"
+        Windows end on sentence boundaries; a sentence longer than a
+        whole window is cut by tokens.
+        """
+        windows: list[str] = []
+        current: list[str] = []
+        current_tokens = 0
+
+        for sentence in re.split(r"(?<=[.!?])\s+", transcript):
+            ids = self.backend.encode(sentence)
+            pieces = (
+                [
+                    self.backend.decode(ids[i : i + max_tokens])
+                    for i in range(0, len(ids), max_tokens)
+                ]
+                if len(ids) > max_tokens
+                else [sentence]
             )
-            transcript = transcript[:max_chars]
+            for piece in pieces:
+                piece_tokens = min(len(ids), max_tokens)
+                if current and current_tokens + piece_tokens > max_tokens:
+                    windows.append(" ".join(current))
+                    current, current_tokens = [], 0
+                current.append(piece)
+                current_tokens += piece_tokens
+
+        if current:
+            windows.append(" ".join(current))
+        return windows
+
+    def _parse_partials(self, responses: list[str]) -> list[dict[str, Any]]:
+        """Parse section analyses, dropping any that are not valid JSON."""
+        partials = []
+        for response in responses:
+            try:
+                data = self._extract_json(response)
+                if all(key in data for key in MAP_REQUIRED_KEYS):
+                    partials.append(data)
+                    continue
+            except (json.JSONDecodeError, ValueError):
+                pass
+            logger.warning(f"Discarding unparseable section analysis: {response[:200]}")
+        return partials
+
+    def _summarize_map_reduce(self, transcript: str) -> str:
+        """Summarize a long transcript hierarchically.
+
+        Map: analyze each token-bounded window, in batches.
+        Combine: while there are more than reduce_fan_in section analyses,
+        merge them in groups (also batched).
+        Reduce: turn the remaining analyses into the final analysis.
 
-        messages = [
+        Returns:
+            Raw text of the final generation.
+        """
+        windows = self._split_windows(
+            transcript, self._input_budget(self.backend, self.window_tokens)
+        )
+        logger.info(f"Map-reduce summarization over {len(windows)} windows")
+
+        partials = self._parse_partials(
+            self._generate_batch(
+                [
+                    [
+                        {"role": "system", "content": MAP_SYSTEM_PROMPT},
+                        {
+                            "role": "user",
+                            "content": MAP_USER_PROMPT_TEMPLATE.format(
+                                index=index + 1, total=len(windows), transcript=window
+                            ),
+                        },
+                    ]
+                    for index, window in enumerate(windows)
+                ],
+                schema=SECTION_JSON_SCHEMA,
+                max_new_tokens=512,
+            )
+        )
+        if not partials:
+            raise ValueError("No section analysis could be parsed")
+
+        while len(partials) > self.reduce_fan_in:
+            groups = [
+                partials[i : i + self.reduce_fan_in]
+                for i in range(0, len(partials), self.reduce_fan_in)
+            ]
+            logger.info(f"Combining {len(partials)} section analyses in {len(groups)} groups")
+            partials = self._parse_partials(
+                self._generate_batch(
+                    [
+                        [
+                            {"role": "system", "content": MAP_SYSTEM_PROMPT},
+                            {
+                                "role": "user",
+                                "content": COMBINE_USER_PROMPT_TEMPLATE.format(
+                                    partials=json.dumps(group, indent=1)
+                                ),
+                            },
+                        ]
+                        for group in groups
+                    ],
+                    schema=SECTION_JSON_SCHEMA,
+                    max_new_tokens=512,
+                )
+            )
+            if not partials:
+                raise ValueError("No combined section analysis could be parsed")
+
+        return self._generate(
+            [
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {
+                    "role": "user",
+                    "content": REDUCE_USER_PROMPT_TEMPLATE.format(
+                        partials=json.dumps(partials, indent=1)
+                    ),
+                },
+            ],
+            schema=ANALYSIS_JSON_SCHEMA,
+        )
+
+    def _select_windows(self, transcript: str, budget: int) -> str:
+        """Shorten an over-budget transcript to its most informative sections.
+
+        Cuts the transcript into sections of an eighth of the budget and
+        keeps the opening and closing ones, then the middle sections with
+        the highest information density while they fit. Kept sections stay
+        in order, with an omission marker wherever sections were left out.
+        """
+        sections = self._split_windows(transcript, max(1, budget // 8))
+        sizes = [self._count_tokens(section) for section in sections]
+        marker_tokens = self._count_tokens(OMISSION_MARKER)
+
+        keep = {0, len(sections) - 1}
+        used = sum(sizes[index] for index in keep) + marker_tokens
+        middle = sorted(
+            range(1, len(sections) - 1),
+            key=lambda index: _information_density(sections[index]),
+            reverse=True,
+        )
+        for index in middle:
+            if used + sizes[index] + marker_tokens <= budget:
+                keep.add(index)
+                used += sizes[index] + marker_tokens
+
+        parts = []
+        for index in sorted(keep):
+            if index > 0 and index - 1 not in keep:
+                parts.append(OMISSION_MARKER)
+            parts.append(sections[index])
+        logger.warning(
+            f"Transcript over the {budget}-token budget: kept {len(keep)} of "
+            f"{len(sections)} sections ({sum(sizes[index] for index in keep)} of "
+            f"{sum(sizes)} tokens): opening, closing and the densest middle sections"
+        )
+        return " ".join(parts)
+
+    def _summary_messages(
+        self, transcript: str, transcript_tokens: int, budget: Optional[int] = None
+    ) -> list[dict]:
+        """Single-pass prompt for a transcript.
+
+        Transcripts over ``budget`` (default: the backend's input budget)
+        are shortened to their most informative sections.
+        """
+        budget = budget or self._input_budget(self.backend, self.max_input_tokens)
+        if transcript_tokens > budget:
+            transcript = self._select_windows(transcript, budget)
+
+        return [
             {"role": "system", "content": SYSTEM_PROMPT},
             {"role": "user", "content": USER_PROMPT_TEMPLATE.format(transcript=transcript)},
         ]
 
-        logger.info(f"Generating summary for transcript ({len(transcript)} chars)")
-        outputs = pipe(messages)
-        response_text = outputs[0]["generated_text"][-1]["content"]
-
+    def _try_parse_summary(self, response_text: str) -> Optional[dict[str, Any]]:
+        """Parse and validate a final analysis; None if it does not parse."""
         logger.debug(f"Raw LLM response: {response_text[:500]}...")
-
         try:
-            result = self._extract_json(response_text)
-            result = self._validate_output(result)
-            logger.info("Summary generated successfully")
-            return result
+            return self._validate_output(self._extract_json(response_text))
         except (json.JSONDecodeError, ValueError) as e:
             logger.error(f"Failed to parse LLM output: {e}")
-            # Return a fallback structure
-            return {
-                "executive_summary": "Analysis could not be completed.",
-                "key_topics": [],
-                "strengths": [],
-                "areas_for_improvement": [],
-                "sentiment_score": 0.0,
-            }
+            return None
+
+    def _generate_summaries(
+        self, backend: SummarizationBackend, conversations: list[list[dict]]
+    ) -> list[str]:
+        """Final-analysis generations on one backend; replies in input order.
+
+        A lone conversation keeps the prompt cache; more run in padded
+        batches of batch_size.
+        """
+        if len(conversations) == 1:
+            return [self._generate(conversations[0], schema=ANALYSIS_JSON_SCHEMA, backend=backend)]
+        logger.info(f"Generating {len(conversations)} summaries in batches of {self.batch_size}")
+        return self._generate_batch(conversations, schema=ANALYSIS_JSON_SCHEMA, backend=backend)
+
+    def summarize(self, transcript: str) -> dict[str, Any]:
+        """Summarize an interview transcript.
+
+        Transcripts longer than max_input_tokens (or than the model's
+        context window leaves room for) are summarized by map-reduce over
+        token-bounded windows, so the whole interview is covered and every
+        generation has a bounded cost.
+
+        Args:
+            transcript: The interview transcript text.
+
+        Returns:
+            Dictionary with executive_summary, key_topics, strengths,
+            areas_for_improvement, and sentiment_score. With a cascade,
+            also the ``model_tier`` that produced it and the
+            ``tiers_tried`` in order.
+        """
+        logger.info(f"Generating summary for transcript ({len(transcript)} chars)")
+        return self.summarize_batch([transcript])[0]
+
+    def summarize_batch(self, transcripts: list[str]) -> list[dict[str, Any]]:
+        """Summarize several transcripts, batching their generations.
+
+        Each cascade tier first summarizes the transcripts short enough
+        for it; summaries failing validation or the quality checks move
+        on to the next tier, and whatever is left to the backend.
+
+        With a compression_ratio below 1, each transcript is first cut
+        down to its top-ranked sentences (see ``app.services.compression``).
+
+        On every tier, transcripts are sorted by length so each padded
+        batch holds prompts of similar length. Transcripts that need
+        map-reduce are summarized one by one (their windows are batched
+        already).
+
+        Args:
+            transcripts: Interview transcript texts.
+
+        Returns:
+            One summary per transcript, in input order, as from summarize().
+        """
+        self.backend.load()
+
+        if self.compression_ratio < 1:
+            from app.services.compression import compress_transcript
+
+            transcripts = [
+                compress_transcript(transcript, self.compression_ratio)
+                for transcript in transcripts
+            ]
+
+        results: list[Optional[dict[str, Any]]] = [None] * len(transcripts)
+        tiers_tried: list[list[str]] = [[] for _ in transcripts]
+        tokens = [self._count_tokens(transcript) for transcript in transcripts]
+        # Shortest first, so padded batches hold prompts of similar length
+        pending = sorted(range(len(transcripts)), key=lambda index: tokens[index])
+
+        for tier in self.cascade:
+            tier.backend.load()
+            budget = self._input_budget(tier.backend, tier.max_input_tokens)
+            eligible = [index for index in pending if tokens[index] <= budget]
+            if not eligible:
+                continue
+            replies = self._generate_summaries(
+                tier.backend,
+                [
+                    self._summary_messages(transcripts[index], tokens[index], budget)
+                    for index in eligible
+                ],
+            )
+            for index, reply in zip(eligible, replies):
+                tiers_tried[index].append(tier.name)
+                result = self._try_parse_summary(reply)
+                problem = "unparseable output" if result is None else self._quality_problem(result)
+                if problem:
+                    logger.info(f"Escalating summary past tier {tier.name}: {problem}")
+                else:
+                    results[index] = result
+                    result["model_tier"] = tier.name
+            pending = [index for index in pending if results[index] is None]
+
+        budget = self._input_budget(self.backend, self.max_input_tokens)
+        single_pass = []
+        for index in pending:
+            tiers_tried[index].append(self.backend.name)
+            if tokens[index] > budget and self.map_reduce:
+                logger.info(f"Transcript has {tokens[index]} tokens, using map-reduce")
+                try:
+                    result = self._try_parse_summary(self._summarize_map_reduce(transcripts[index]))
+                except ValueError as e:
+                    logger.error(f"Failed to parse LLM output: {e}")
+                    result = None
+                results[index] = result or dict(FALLBACK_SUMMARY)
+            else:
+                single_pass.append(index)
+
+        if single_pass:
+            replies = self._generate_summaries(
+                self.backend,
+                [
+                    self._summary_messages(transcripts[index], tokens[index], budget)
+                    for index in single_pass
+                ],
+            )
+            for index, reply in zip(single_pass, replies):
+                results[index] = self._try_parse_summary(reply) or dict(FALLBACK_SUMMARY)
+
+        if self.cascade:
+            for index in pending:
+                results[index]["model_tier"] = self.backend.name
+            for result, tried in zip(results, tiers_tried):
+                result["tiers_tried"] = tried
+        return results
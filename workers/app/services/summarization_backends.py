@@ -0,0 +1,679 @@
+"""Inference backends behind SummarizationService."""
+
+import copy
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# Sampling settings shared by every backend
+GENERATION_KWARGS = {
+    "max_new_tokens": 1024,
+    "do_sample": True,
+    "temperature": 0.1,
+    "top_p": 0.9,
+}
+
+
+class SummarizationBackend(ABC):
+    """Runs chat generations for SummarizationService.
+
+    A backend owns the model and its tokenizer; the service owns prompts,
+    windowing and output validation. ``schema`` arguments are JSON schemas
+    the reply must conform to (constrained decoding), or None for
+    free-form generation.
+    """
+
+    @property
+    def name(self) -> str:
+        """Model identifier, recorded as the summary's model tier."""
+        return type(self).__name__
+
+    @property
+    def context_tokens(self) -> Optional[int]:
+        """Context window of the loaded model in tokens, if known."""
+        return None
+
+    @abstractmethod
+    def load(self) -> None:
+        """Load the model if it is not loaded yet."""
+
+    @abstractmethod
+    def encode(self, text: str) -> list[int]:
+        """Tokenize text without special tokens."""
+
+    @abstractmethod
+    def decode(self, ids: list[int]) -> str:
+        """Turn token ids back into text."""
+
+    def count_tokens(self, text: str) -> int:
+        """Count tokens in text."""
+        return len(self.encode(text))
+
+    @abstractmethod
+    def generate(
+        self,
+        messages: list[dict],
+        schema: Optional[dict] = None,
+        max_new_tokens: Optional[int] = None,
+    ) -> str:
+        """Run one chat generation and return the assistant reply text."""
+
+    def generate_batch(
+        self,
+        conversations: list[list[dict]],
+        schema: Optional[dict] = None,
+        max_new_tokens: Optional[int] = None,
+        batch_size: int = 1,
+    ) -> list[str]:
+        """Run several chat generations; replies in input order.
+
+        The default runs them one at a time.
+        """
+        return [
+            self.generate(messages, schema=schema, max_new_tokens=max_new_tokens)
+            for messages in conversations
+        ]
+
+
+@dataclass
+class _PromptCache:
+    """Past key/values for a chat-templated system prompt."""
+
+    ids: list[int]  # Token ids of the cached prefix
+    past_key_values: Any  # transformers Cache after prefilling ``ids``
+    prefill_ms: float  # Time the prefix prefill took
+
+
+class TransformersBackend(SummarizationBackend):
+    """HuggingFace transformers text-generation pipeline (GPU, or fp16 on CPU)."""
+
+    def __init__(
+        self,
+        model_name: str = "meta-llama/Llama-3.3-8B-Instruct",
+        device: Optional[str] = None,
+        load_in_4bit: bool = True,
+        reuse_prompt_cache: bool = True,
+        draft_model_name: str = "",
+    ):
+        """Initialize the backend.
+
+        Args:
+            model_name: HuggingFace model name
+            device: Device to use ('cuda' or 'cpu'). Auto-detected if None.
+            load_in_4bit: Whether to load model with 4-bit quantization
+            reuse_prompt_cache: Prefill each system prompt once and reuse
+                its KV cache for every single-conversation generation
+            draft_model_name: Small model sharing model_name's tokenizer
+                (e.g. meta-llama/Llama-3.2-1B-Instruct). When set,
+                single-conversation generations use assisted decoding:
+                the draft proposes tokens and the main model verifies
+                them in one forward pass.
+        """
+        self.model_name = model_name
+        self.load_in_4bit = load_in_4bit
+        self.reuse_prompt_cache = reuse_prompt_cache
+        self.draft_model_name = draft_model_name
+        self._pipeline = None
+        self._draft_model = None
+        self._prompt_caches: dict[str, _PromptCache] = {}
+        self._enforcer_tokenizer_data = None
+
+        # Auto-detect device
+        if device is None:
+            try:
+                import torch
+
+                self.device = "cuda" if torch.cuda.is_available() else "cpu"
+            except ImportError:
+                self.device = "cpu"
+        else:
+            self.device = device
+
+        # 4-bit quantization requires CUDA
+        if self.device == "cpu" and self.load_in_4bit:
+            logger.warning("4-bit quantization requires CUDA. Disabling.")
+            self.load_in_4bit = False
+
+    def _load_pipeline(self):
+        """Lazy-load the LLM pipeline."""
+        if self._pipeline is None:
+            import torch
+            from transformers import pipeline, BitsAndBytesConfig
+
+            logger.info(f"Loading LLM model: {self.model_name}")
+            start = time.perf_counter()
+
+            model_kwargs = {"torch_dtype": torch.float16}
+
+            if self.load_in_4bit:
+                quantization_config = BitsAndBytesConfig(
+                    load_in_4bit=True,
+                    bnb_4bit_compute_dtype=torch.float16,
+                    bnb_4bit_use_double_quant=True,
+                    bnb_4bit_quant_type="nf4",
+                )
+                model_kwargs["quantization_config"] = quantization_config
+                model_kwargs["device_map"] = "auto"
+            else:
+                model_kwargs["device_map"] = self.device
+
+            self._pipeline = pipeline(
+                "text-generation",
+                model=self.model_name,
+                model_kwargs=model_kwargs,
+                **GENERATION_KWARGS,
+            )
+            # Batched generation pads prompts on the left; Llama has no pad token
+            tokenizer = self._pipeline.tokenizer
+            if tokenizer.pad_token_id is None:
+                tokenizer.pad_token_id = self._pipeline.model.config.eos_token_id
+            tokenizer.padding_side = "left"
+            logger.info(f"LLM model loaded in {time.perf_counter() - start:.1f}s")
+
+            if self.draft_model_name:
+                self._draft_model = self._load_draft_model(torch)
+
+        return self._pipeline
+
+    def _load_draft_model(self, torch):
+        """Load the assisted-decoding draft model next to the main model."""
+        from transformers import AutoModelForCausalLM
+
+        logger.info(f"Loading draft model: {self.draft_model_name}")
+        draft_model = AutoModelForCausalLM.from_pretrained(
+            self.draft_model_name, torch_dtype=torch.float16
+        ).to(self._pipeline.model.device)
+        draft_model.eval()
+        return draft_model
+
+    @property
+    def name(self) -> str:
+        return self.model_name
+
+    @property
+    def context_tokens(self) -> Optional[int]:
+        context_tokens = getattr(self._load_pipeline().model.config, "max_position_embeddings", None)
+        return context_tokens if isinstance(context_tokens, int) else None
+
+    def load(self) -> None:
+        """Load the pipeline."""
+        self._load_pipeline()
+
+    def encode(self, text: str) -> list[int]:
+        """Tokenize with the model's tokenizer."""
+        return self._load_pipeline().tokenizer.encode(text, add_special_tokens=False)
+
+    def decode(self, ids: list[int]) -> str:
+        """Detokenize with the model's tokenizer."""
+        return self._load_pipeline().tokenizer.decode(ids)
+
+    def _constraint_kwargs(self, schema: Optional[dict]) -> dict[str, Any]:
+        """Generate kwargs that restrict output to ``schema``.
+
+        Only tokens that keep the output a valid prefix of a schema-conforming
+        JSON document are allowed, and EOS is forced once the closing brace
+        is emitted.
+        """
+        if not schema:
+            return {}
+
+        from lmformatenforcer import JsonSchemaParser
+        from lmformatenforcer.integrations.transformers import (
+            build_token_enforcer_tokenizer_data,
+            build_transformers_prefix_allowed_tokens_fn,
+        )
+
+        if self._enforcer_tokenizer_data is None:
+            # Vocabulary analysis is slow; do it once per loaded model
+            self._enforcer_tokenizer_data = build_token_enforcer_tokenizer_data(
+                self._load_pipeline().tokenizer
+            )
+        return {
+            "prefix_allowed_tokens_fn": build_transformers_prefix_allowed_tokens_fn(
+                self._enforcer_tokenizer_data, JsonSchemaParser(schema)
+            )
+        }
+
+    def _generate_kwargs(
+        self, schema: Optional[dict], max_new_tokens: Optional[int], assisted: bool = False
+    ) -> dict[str, Any]:
+        """Per-call generate kwargs on top of the pipeline defaults.
+
+        ``assisted`` adds the draft model, if one is configured; assisted
+        decoding only supports a batch of one.
+        """
+        generate_kwargs = self._constraint_kwargs(schema)
+        if max_new_tokens is not None:
+            generate_kwargs["max_new_tokens"] = max_new_tokens
+        if assisted and self._draft_model is not None:
+            generate_kwargs["assistant_model"] = self._draft_model
+        return generate_kwargs
+
+    def _build_prompt_cache(self, system_prompt: str) -> _PromptCache:
+        """Prefill the chat-templated system prompt and keep its KV cache."""
+        import torch
+        from transformers import DynamicCache
+
+        pipe = self._load_pipeline()
+        ids = list(
+            pipe.tokenizer.apply_chat_template(
+                [{"role": "system", "content": system_prompt}], tokenize=True
+            )
+        )
+        past_key_values = DynamicCache()
+        start = time.perf_counter()
+        with torch.no_grad():
+            pipe.model(
+                torch.tensor([ids], device=pipe.model.device),
+                past_key_values=past_key_values,
+                use_cache=True,
+            )
+        prefill_ms = (time.perf_counter() - start) * 1000
+        logger.info(f"Cached prompt prefix: {len(ids)} tokens, prefill {prefill_ms:.0f} ms")
+        return _PromptCache(ids=ids, past_key_values=past_key_values, prefill_ms=prefill_ms)
+
+    def _get_prompt_cache(self, system_prompt: str) -> _PromptCache:
+        """Get or build the prompt cache for a system prompt."""
+        if system_prompt not in self._prompt_caches:
+            self._prompt_caches[system_prompt] = self._build_prompt_cache(system_prompt)
+        return self._prompt_caches[system_prompt]
+
+    def _generate_with_prompt_cache(
+        self, cache: _PromptCache, prompt_ids: list[int], **generate_kwargs
+    ) -> str:
+        """Generate from a prompt whose leading tokens are already cached.
+
+        The cached prefix is copied (generation appends to it), the rest
+        of the prompt but its last token is prefilled onto the copy, and
+        model.generate continues from there.
+        """
+        import torch
+
+        pipe = self._load_pipeline()
+        model = pipe.model
+        past_key_values = copy.deepcopy(cache.past_key_values)
+        input_ids = torch.tensor([prompt_ids], device=model.device)
+        new_tokens = len(prompt_ids) - len(cache.ids)
+
+        start = time.perf_counter()
+        if new_tokens > 1:
+            with torch.no_grad():
+                model(
+                    input_ids[:, len(cache.ids) : -1],
+                    past_key_values=past_key_values,
+                    use_cache=True,
+                )
+        prefill_ms = (time.perf_counter() - start) * 1000
+        logger.info(
+            f"Prefill: {len(cache.ids)} cached + {new_tokens} new tokens in "
+            f"{prefill_ms:.0f} ms (~{cache.prefill_ms + prefill_ms:.0f} ms without cache)"
+        )
+
+        output = model.generate(
+            input_ids,
+            attention_mask=torch.ones_like(input_ids),
+            past_key_values=past_key_values,
+            pad_token_id=pipe.tokenizer.pad_token_id,
+            **{**GENERATION_KWARGS, **generate_kwargs},
+        )
+        return pipe.tokenizer.decode(
+            output[0, len(prompt_ids) :], skip_special_tokens=True
+        )
+
+    def generate(
+        self,
+        messages: list[dict],
+        schema: Optional[dict] = None,
+        max_new_tokens: Optional[int] = None,
+    ) -> str:
+        """Run one chat generation and return the assistant reply text.
+
+        With reuse_prompt_cache, the system prompt's prefill is taken from
+        its cached KV state instead of being recomputed for every call.
+        With a draft model, decoding is assisted (speculative).
+        """
+        pipe = self._load_pipeline()
+        generate_kwargs = self._generate_kwargs(schema, max_new_tokens, assisted=True)
+
+        if self.reuse_prompt_cache and messages[0]["role"] == "system":
+            prompt_ids = list(
+                pipe.tokenizer.apply_chat_template(
+                    messages, tokenize=True, add_generation_prompt=True
+                )
+            )
+            cache = self._get_prompt_cache(messages[0]["content"])
+            if len(prompt_ids) > len(cache.ids) and prompt_ids[: len(cache.ids)] == cache.ids:
+                return self._generate_with_prompt_cache(cache, prompt_ids, **generate_kwargs)
+            logger.debug("Prompt does not start with the cached prefix, prefilling in full")
+
+        outputs = pipe(messages, **generate_kwargs)
+        return outputs[0]["generated_text"][-1]["content"]
+
+    def generate_batch(
+        self,
+        conversations: list[list[dict]],
+        schema: Optional[dict] = None,
+        max_new_tokens: Optional[int] = None,
+        batch_size: int = 1,
+    ) -> list[str]:
+        """Run chat generations in padded batches; replies in input order.
+
+        Left padding shifts each prompt by a different amount, so batches
+        do not use the prompt cache. Assisted decoding is single-sequence
+        only, so batches do not use the draft model either.
+        """
+        outputs = self._load_pipeline()(
+            conversations,
+            batch_size=batch_size,
+            **self._generate_kwargs(schema, max_new_tokens),
+        )
+        return [output[0]["generated_text"][-1]["content"] for output in outputs]
+
+
+def default_thread_count() -> int:
+    """CPUs this process may run on (respects affinity and cgroup cpusets)."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+class LlamaCppBackend(SummarizationBackend):
+    """Quantized GGUF model on llama.cpp, for CPU-only workers.
+
+    Weights are int4/int8 GGUF, memory-mapped rather than copied into the
+    process, so an 8B Q4 model needs ~5 GB instead of ~16 GB at fp16 and
+    is shared through the page cache by every worker on the host. Matmuls
+    run on llama.cpp's quantized CPU kernels across ``n_threads`` threads.
+    """
+
+    def __init__(
+        self,
+        model_path: str = "",
+        repo_id: str = "",
+        filename: str = "*Q4_K_M.gguf",
+        n_ctx: int = 32768,
+        n_threads: int = 0,
+        reuse_prompt_cache: bool = True,
+    ):
+        """Initialize the backend.
+
+        Args:
+            model_path: Local GGUF file. Takes precedence over repo_id.
+            repo_id: HuggingFace repo to download the GGUF file from
+            filename: File (or glob) within repo_id
+            n_ctx: Context window in tokens; must fit prompt plus reply
+            n_threads: Inference threads; 0 = every CPU this process may use
+            reuse_prompt_cache: Keep evaluated prompt states in RAM so
+                shared prefixes (the system prompt) are not re-evaluated
+        """
+        if not model_path and not repo_id:
+            raise ValueError("LlamaCppBackend needs a model_path or repo_id")
+        self.model_path = model_path
+        self.repo_id = repo_id
+        self.filename = filename
+        self.n_ctx = n_ctx
+        self.n_threads = n_threads or default_thread_count()
+        self.reuse_prompt_cache = reuse_prompt_cache
+        self._llm = None
+
+    def _load_llm(self):
+        """Lazy-load the GGUF model."""
+        if self._llm is None:
+            from llama_cpp import Llama, LlamaRAMCache
+
+            start = time.perf_counter()
+            llm_kwargs = {
+                "n_ctx": self.n_ctx,
+                "n_threads": self.n_threads,
+                "n_threads_batch": self.n_threads,
+                "use_mmap": True,
+                "verbose": False,
+            }
+            if self.model_path:
+                logger.info(f"Loading GGUF model: {self.model_path} ({self.n_threads} threads)")
+                self._llm = Llama(model_path=self.model_path, **llm_kwargs)
+            else:
+                logger.info(
+                    f"Loading GGUF model: {self.repo_id}/{self.filename} "
+                    f"({self.n_threads} threads)"
+                )
+                self._llm = Llama.from_pretrained(
+                    repo_id=self.repo_id, filename=self.filename, **llm_kwargs
+                )
+            if self.reuse_prompt_cache:
+                self._llm.set_cache(LlamaRAMCache())
+            logger.info(f"GGUF model loaded in {time.perf_counter() - start:.1f}s")
+
+        return self._llm
+
+    @property
+    def name(self) -> str:
+        return self.model_path or f"{self.repo_id}/{self.filename}"
+
+    @property
+    def context_tokens(self) -> Optional[int]:
+        return self.n_ctx
+
+    def load(self) -> None:
+        """Load the model."""
+        self._load_llm()
+
+    def encode(self, text: str) -> list[int]:
+        """Tokenize with the GGUF vocabulary."""
+        return self._load_llm().tokenize(text.encode(), add_bos=False, special=False)
+
+    def decode(self, ids: list[int]) -> str:
+        """Detokenize with the GGUF vocabulary."""
+        return self._load_llm().detokenize(ids).decode(errors="ignore")
+
+    def generate(
+        self,
+        messages: list[dict],
+        schema: Optional[dict] = None,
+        max_new_tokens: Optional[int] = None,
+    ) -> str:
+        """Run one chat completion.
+
+        A schema is compiled to a llama.cpp grammar, so sampling can only
+        produce conforming JSON.
+        """
+        completion_kwargs: dict[str, Any] = {
+            "max_tokens": max_new_tokens or GENERATION_KWARGS["max_new_tokens"],
+            "temperature": GENERATION_KWARGS["temperature"],
+            "top_p": GENERATION_KWARGS["top_p"],
+        }
+        if schema:
+            completion_kwargs["response_format"] = {"type": "json_object", "schema": schema}
+
+        response = self._load_llm().create_chat_completion(messages, **completion_kwargs)
+        return response["choices"][0]["message"]["content"]
+
+
+@dataclass
+class _Generation:
+    """One queued conversation awaiting a batch slot."""
+
+    future: Future
+    messages: list[dict]
+    schema: Optional[dict]
+    max_new_tokens: Optional[int]
+
+    @property
+    def group(self) -> tuple:
+        """Generations batch together only with identical decoding settings."""
+        return json.dumps(self.schema, sort_keys=True), self.max_new_tokens
+
+
+class MicroBatchingBackend(SummarizationBackend):
+    """Batches generations from concurrent callers onto one inner backend.
+
+    Every generate / generate_batch call queues its conversations; a
+    background thread drains the queue into batches of up to
+    ``batch_size`` (waiting at most ``max_wait_ms`` for a batch to fill)
+    and runs each through the inner backend's generate_batch. A lone
+    conversation goes through the inner generate, keeping its prompt cache.
+
+    The inner tokenizer is not thread-safe, so tokenizing for callers and
+    generating on the batching thread share one lock.
+    """
+
+    def __init__(
+        self,
+        inner: SummarizationBackend,
+        batch_size: int = 8,
+        max_wait_ms: int = 50,
+    ):
+        """Initialize the wrapper and start its batching thread.
+
+        Args:
+            inner: Backend that runs the batched generations.
+            batch_size: Maximum conversations per generation call.
+            max_wait_ms: Longest wait for a batch to fill once one
+                conversation is queued.
+        """
+        self.inner = inner
+        self.batch_size = batch_size
+        self.max_wait_ms = max_wait_ms
+        self._queue: queue.Queue[_Generation] = queue.Queue()
+        self._tokenizer_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    @property
+    def name(self) -> str:
+        return self.inner.name
+
+    @property
+    def context_tokens(self) -> Optional[int]:
+        return self.inner.context_tokens
+
+    def load(self) -> None:
+        self.inner.load()
+
+    def encode(self, text: str) -> list[int]:
+        with self._tokenizer_lock:
+            return self.inner.encode(text)
+
+    def decode(self, ids: list[int]) -> str:
+        with self._tokenizer_lock:
+            return self.inner.decode(ids)
+
+    def submit(
+        self,
+        messages: list[dict],
+        schema: Optional[dict] = None,
+        max_new_tokens: Optional[int] = None,
+    ) -> Future:
+        """Queue one conversation; the future resolves to its reply text."""
+        future: Future = Future()
+        self._queue.put(_Generation(future, messages, schema, max_new_tokens))
+        return future
+
+    def generate(
+        self,
+        messages: list[dict],
+        schema: Optional[dict] = None,
+        max_new_tokens: Optional[int] = None,
+    ) -> str:
+        return self.submit(messages, schema, max_new_tokens).result()
+
+    def generate_batch(
+        self,
+        conversations: list[list[dict]],
+        schema: Optional[dict] = None,
+        max_new_tokens: Optional[int] = None,
+        batch_size: int = 1,
+    ) -> list[str]:
+        futures = [
+            self.submit(messages, schema, max_new_tokens) for messages in conversations
+        ]
+        return [future.result() for future in futures]
+
+    def _next_batch(self) -> list[_Generation]:
+        """Block for one conversation, then gather more until full or timed out."""
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.max_wait_ms / 1000
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        """Batching loop: one generation call per decoding-settings group."""
+        while True:
+            groups: dict[tuple, list[_Generation]] = {}
+            for generation in self._next_batch():
+                groups.setdefault(generation.group, []).append(generation)
+
+            for generations in groups.values():
+                first = generations[0]
+                try:
+                    # Generation tokenizes prompts and decodes replies
+                    with self._tokenizer_lock:
+                        if len(generations) == 1:
+                            replies = [
+                                self.inner.generate(
+                                    first.messages, first.schema, first.max_new_tokens
+                                )
+                            ]
+                        else:
+                            replies = self.inner.generate_batch(
+                                [generation.messages for generation in generations],
+                                schema=first.schema,
+                                max_new_tokens=first.max_new_tokens,
+                                batch_size=len(generations),
+                            )
+                except Exception as e:
+                    logger.error(f"Batched generation failed: {e}")
+                    for generation in generations:
+                        generation.future.set_exception(e)
+                    continue
+                for generation, reply in zip(generations, replies):
+                    generation.future.set_result(reply)
+
+
+def create_backend(settings, model: str = "") -> SummarizationBackend:
+    """Build the backend selected by ``settings.summarization_backend``.
+
+    Args:
+        settings: Worker Settings.
+        model: Model to load instead of the configured one (a GGUF path
+            for llama_cpp, a HuggingFace name for transformers), e.g. a
+            cascade tier. Such models get no draft model.
+    """
+    if settings.summarization_backend == "llama_cpp":
+        if settings.summarization_draft_model:
+            logger.warning("Draft models are only supported by the transformers backend")
+        return LlamaCppBackend(
+            model_path=model or settings.summarization_gguf_path,
+            repo_id="" if model else settings.summarization_gguf_repo,
+            filename=settings.summarization_gguf_file,
+            n_ctx=settings.summarization_context_tokens,
+            n_threads=settings.summarization_threads,
+            reuse_prompt_cache=settings.summarization_prompt_cache,
+        )
+    if settings.summarization_backend == "transformers":
+        if model:
+            return TransformersBackend(
+                model_name=model, reuse_prompt_cache=settings.summarization_prompt_cache
+            )
+        return TransformersBackend(
+            reuse_prompt_cache=settings.summarization_prompt_cache,
+            draft_model_name=settings.summarization_draft_model,
+        )
+    raise ValueError(f"Unknown summarization backend: {settings.summarization_backend}")
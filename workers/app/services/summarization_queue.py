@@ -0,0 +1,115 @@
+"""Redis-backed queue of transcripts awaiting batched summarization."""
+
+import json
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+PENDING_SUMMARIES_KEY = "vibecheck:summarize:pending"
+
+
+class PendingSummaries:
+    """FIFO of pipeline payloads waiting for the summarize_batch dispatcher.
+
+    Payloads are stored as JSON in a Redis list on the broker's Redis, so
+    every summarization worker drains the same queue.
+
+    Draining is reliable: payloads are moved (LMOVE) into a processing
+    list owned by the dispatcher, not popped, and stay there until the
+    dispatcher completes them. Each dispatcher holds a lease; ``reap``
+    returns the payloads of dispatchers whose lease expired (killed,
+    out of memory, hard time limit) to the head of the queue.
+    """
+
+    def __init__(self, client, key: str = PENDING_SUMMARIES_KEY, lease_seconds: int = 4500):
+        """Initialize the queue.
+
+        Args:
+            client: redis.Redis client.
+            key: Redis list holding the payloads.
+            lease_seconds: How long a dispatcher's claim on its payloads
+                lasts without renewal. Must outlive the task's hard time
+                limit and its retry backoff.
+        """
+        self.client = client
+        self.key = key
+        self.lease_seconds = lease_seconds
+        self.dispatchers_key = f"{key}:dispatchers"
+
+    def _processing_key(self, dispatcher: str) -> str:
+        return f"{self.key}:processing:{dispatcher}"
+
+    def _lease_key(self, dispatcher: str) -> str:
+        return f"{self.key}:lease:{dispatcher}"
+
+    def push(self, payload: dict) -> None:
+        """Queue one payload at the tail."""
+        self.client.rpush(self.key, json.dumps(payload))
+
+    def renew(self, dispatcher: str) -> None:
+        """Start or extend a dispatcher's lease on its processing list."""
+        self.client.set(self._lease_key(dispatcher), 1, ex=self.lease_seconds)
+        self.client.sadd(self.dispatchers_key, dispatcher)
+
+    def drain(self, dispatcher: str, max_items: int, max_wait_ms: int) -> list[dict]:
+        """Claim up to max_items payloads for a dispatcher.
+
+        A dispatcher that already holds payloads (a retry of the same
+        task) gets those back and claims nothing new. Otherwise returns
+        at once if the queue is empty, or keeps claiming payloads until
+        max_items are gathered or max_wait_ms has passed.
+        """
+        processing = self._processing_key(dispatcher)
+        # Leased before the first move, so the reaper never sees an unleased list
+        self.renew(dispatcher)
+        claimed = self.client.lrange(processing, 0, -1)
+        if claimed:
+            return [json.loads(item) for item in claimed]
+
+        first = self.client.lmove(self.key, processing, "LEFT", "RIGHT")
+        if first is None:
+            self.complete(dispatcher)
+            return []
+
+        batch = [json.loads(first)]
+        deadline = time.monotonic() + max_wait_ms / 1000
+        while len(batch) < max_items:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            # Redis reads a timeout that rounds to 0 as "block forever"
+            item = self.client.blmove(
+                self.key, processing, max(remaining, 0.01), "LEFT", "RIGHT"
+            )
+            if item is None:
+                break
+            batch.append(json.loads(item))
+        return batch
+
+    def complete(self, dispatcher: str) -> None:
+        """Drop a dispatcher's processing list and lease once its jobs moved on."""
+        self.client.delete(self._processing_key(dispatcher), self._lease_key(dispatcher))
+        self.client.srem(self.dispatchers_key, dispatcher)
+
+    def reap(self) -> int:
+        """Requeue the payloads of dispatchers whose lease expired.
+
+        Payloads go back to the head of the queue in their original order.
+
+        Returns:
+            How many payloads were requeued.
+        """
+        requeued = 0
+        for member in self.client.smembers(self.dispatchers_key):
+            dispatcher = member.decode() if isinstance(member, bytes) else member
+            if self.client.exists(self._lease_key(dispatcher)):
+                continue
+            processing = self._processing_key(dispatcher)
+            # Tail to head, so the list's first payload ends up first again
+            while self.client.lmove(processing, self.key, "RIGHT", "LEFT") is not None:
+                requeued += 1
+            self.client.srem(self.dispatchers_key, dispatcher)
+        if requeued:
+            logger.warning(f"Requeued {requeued} payloads from abandoned summarization batches")
+        return requeued
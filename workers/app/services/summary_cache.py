@@ -0,0 +1,158 @@
+"""Summary cache backed by Postgres."""
+
+import hashlib
+import json
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+
+from sqlmodel import text
+
+from app.core.database import get_session
+
+logger = logging.getLogger(__name__)
+
+
+def summary_cache_key(fingerprint: str, transcript: str) -> str:
+    """Cache key of a transcript summarized under a service fingerprint.
+
+    Args:
+        fingerprint: ``SummarizationService.fingerprint`` (prompts, models
+            and generation settings).
+        transcript: Transcript text.
+
+    Returns:
+        Hex SHA-256 over both.
+    """
+    return hashlib.sha256(f"{fingerprint}\n{transcript}".encode()).hexdigest()
+
+
+class SummaryCache:
+    """Cache of summaries keyed by transcript and summarization settings.
+
+    Lets reprocessed jobs, and jobs re-run after changes that do not
+    affect summarization, skip the LLM. Any change to the prompts, model
+    or generation settings changes every key, so stale summaries are
+    never returned; they age out instead. Entries are evicted by age
+    (since last access) and by total summary size, least recently used
+    first.
+
+    Cache failures never fail a job: lookups degrade to misses and
+    writes are skipped, with a warning.
+    """
+
+    def __init__(self, max_bytes: int, max_age_days: int):
+        """Initialize the summary cache.
+
+        Args:
+            max_bytes: Total summary bytes kept before LRU eviction.
+            max_age_days: Entries not accessed for this long are evicted.
+        """
+        self.max_bytes = max_bytes
+        self.max_age_days = max_age_days
+        # Per-process counters, reported in job logs
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, cache_key: str) -> Optional[dict[str, Any]]:
+        """Look up a cached summary.
+
+        Args:
+            cache_key: Key from ``summary_cache_key``.
+
+        Returns:
+            The summary on a hit, else None.
+        """
+        row = None
+        try:
+            with get_session() as session:
+                result = session.execute(
+                    text("""
+                        UPDATE summary_cache
+                        SET hit_count = hit_count + 1, last_accessed_at = :now
+                        WHERE cache_key = :cache_key
+                        RETURNING summary
+                    """),
+                    {"cache_key": cache_key, "now": datetime.now(timezone.utc)},
+                )
+                row = result.fetchone()
+                session.commit()
+        except Exception as e:
+            logger.warning(f"Summary cache lookup failed: {e}")
+
+        if row is None:
+            self.misses += 1
+            self._log_counters("miss", cache_key)
+            return None
+
+        self.hits += 1
+        self._log_counters("hit", cache_key)
+        return row[0]
+
+    def put(self, cache_key: str, model: str, summary: dict[str, Any]) -> None:
+        """Store a summary, then apply the eviction policy.
+
+        Args:
+            cache_key: Key from ``summary_cache_key``.
+            model: Model that produced the summary, for inspection.
+            summary: Summary as returned by the summarization service.
+        """
+        summary_json = json.dumps(summary)
+        now = datetime.now(timezone.utc)
+        try:
+            with get_session() as session:
+                session.execute(
+                    text("""
+                        INSERT INTO summary_cache
+                        (cache_key, model, summary, size_bytes, hit_count, created_at, last_accessed_at)
+                        VALUES (:cache_key, :model, :summary, :size_bytes, 0, :now, :now)
+                        ON CONFLICT (cache_key) DO UPDATE SET
+                            model = EXCLUDED.model,
+                            summary = EXCLUDED.summary,
+                            size_bytes = EXCLUDED.size_bytes,
+                            last_accessed_at = EXCLUDED.last_accessed_at
+                    """),
+                    {
+                        "cache_key": cache_key,
+                        "model": model[:255],
+                        "summary": summary_json,
+                        "size_bytes": len(summary_json.encode()),
+                        "now": now,
+                    },
+                )
+                self._evict(session, now)
+                session.commit()
+        except Exception as e:
+            logger.warning(f"Summary cache write failed: {e}")
+
+    def _evict(self, session, now: datetime) -> None:
+        """Delete expired entries, then LRU entries beyond the size budget."""
+        expired = session.execute(
+            text("DELETE FROM summary_cache WHERE last_accessed_at < :cutoff"),
+            {"cutoff": now - timedelta(days=self.max_age_days)},
+        ).rowcount
+        oversize = session.execute(
+            text("""
+                DELETE FROM summary_cache
+                WHERE cache_key IN (
+                    SELECT cache_key FROM (
+                        SELECT cache_key,
+                            SUM(size_bytes) OVER (
+                                ORDER BY last_accessed_at DESC
+                                ROWS UNBOUNDED PRECEDING
+                            ) AS running_bytes
+                        FROM summary_cache
+                    ) ranked
+                    WHERE running_bytes > :max_bytes
+                )
+            """),
+            {"max_bytes": self.max_bytes},
+        ).rowcount
+        if expired or oversize:
+            logger.info(f"Summary cache evicted {expired} expired, {oversize} over budget")
+
+    def _log_counters(self, outcome: str, cache_key: str) -> None:
+        logger.info(
+            f"Summary cache {outcome} for key={cache_key[:12]} "
+            f"(hits={self.hits}, misses={self.misses})"
+        )
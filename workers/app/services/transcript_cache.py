@@ -0,0 +1,169 @@
+"""Content-addressed transcript cache backed by Postgres."""
+
+import json
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlmodel import text
+
+from app.core.database import get_session
+from app.services.transcription import TranscriptResult
+
+logger = logging.getLogger(__name__)
+
+
+class TranscriptCache:
+    """Cache of transcripts keyed by (audio SHA-256, model size, compute type).
+
+    Lets re-uploads of the same recording skip Whisper entirely. Entries
+    are evicted by age (since last access) and by total transcript size,
+    least recently used first.
+
+    Cache failures never fail a job: lookups degrade to misses and
+    writes are skipped, with a warning.
+    """
+
+    def __init__(self, max_bytes: int, max_age_days: int):
+        """Initialize the transcript cache.
+
+        Args:
+            max_bytes: Total transcript bytes kept before LRU eviction.
+            max_age_days: Entries not accessed for this long are evicted.
+        """
+        self.max_bytes = max_bytes
+        self.max_age_days = max_age_days
+        # Per-process counters, reported in job logs
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self, audio_sha256: str, model_size: str, compute_type: str
+    ) -> Optional[TranscriptResult]:
+        """Look up a cached transcript.
+
+        Args:
+            audio_sha256: Hex SHA-256 of the audio content.
+            model_size: Whisper model size used for transcription.
+            compute_type: Compute type used for transcription.
+
+        Returns:
+            The cached TranscriptResult on a hit, else None.
+        """
+        row = None
+        try:
+            with get_session() as session:
+                result = session.execute(
+                    text("""
+                        UPDATE transcript_cache
+                        SET hit_count = hit_count + 1, last_accessed_at = :now
+                        WHERE audio_sha256 = :sha AND model_size = :model_size
+                            AND compute_type = :compute_type
+                        RETURNING segments, language, duration_seconds
+                    """),
+                    {
+                        "sha": audio_sha256,
+                        "model_size": model_size,
+                        "compute_type": compute_type,
+                        "now": datetime.now(timezone.utc),
+                    },
+                )
+                row = result.fetchone()
+                session.commit()
+        except Exception as e:
+            logger.warning(f"Transcript cache lookup failed: {e}")
+
+        if row is None:
+            self.misses += 1
+            self._log_counters("miss", audio_sha256)
+            return None
+
+        self.hits += 1
+        self._log_counters("hit", audio_sha256)
+        return TranscriptResult(
+            segments=row[0] or [], language=row[1], duration=row[2] or 0.0
+        )
+
+    def put(
+        self,
+        audio_sha256: str,
+        model_size: str,
+        compute_type: str,
+        result: TranscriptResult,
+    ) -> None:
+        """Store a transcript, then apply the eviction policy.
+
+        Args:
+            audio_sha256: Hex SHA-256 of the audio content.
+            model_size: Whisper model size used for transcription.
+            compute_type: Compute type used for transcription.
+            result: The transcription to cache.
+        """
+        transcript = result.text
+        segments_json = json.dumps(result.segments)
+        now = datetime.now(timezone.utc)
+        try:
+            with get_session() as session:
+                session.execute(
+                    text("""
+                        INSERT INTO transcript_cache
+                        (audio_sha256, model_size, compute_type, transcript, segments, language, duration_seconds, size_bytes, hit_count, created_at, last_accessed_at)
+                        VALUES (:sha, :model_size, :compute_type, :transcript, :segments, :language, :duration, :size_bytes, 0, :now, :now)
+                        ON CONFLICT (audio_sha256, model_size, compute_type) DO UPDATE SET
+                            transcript = EXCLUDED.transcript,
+                            segments = EXCLUDED.segments,
+                            language = EXCLUDED.language,
+                            duration_seconds = EXCLUDED.duration_seconds,
+                            size_bytes = EXCLUDED.size_bytes,
+                            last_accessed_at = EXCLUDED.last_accessed_at
+                    """),
+                    {
+                        "sha": audio_sha256,
+                        "model_size": model_size,
+                        "compute_type": compute_type,
+                        "transcript": transcript,
+                        "segments": segments_json,
+                        "language": result.language,
+                        "duration": result.duration,
+                        "size_bytes": len(transcript.encode()) + len(segments_json),
+                        "now": now,
+                    },
+                )
+                self._evict(session, now)
+                session.commit()
+        except Exception as e:
+            logger.warning(f"Transcript cache write failed: {e}")
+
+    def _evict(self, session, now: datetime) -> None:
+        """Delete expired entries, then LRU entries beyond the size budget."""
+        expired = session.execute(
+            text("DELETE FROM transcript_cache WHERE last_accessed_at < :cutoff"),
+            {"cutoff": now - timedelta(days=self.max_age_days)},
+        ).rowcount
+        oversize = session.execute(
+            text("""
+                DELETE FROM transcript_cache
+                WHERE (audio_sha256, model_size, compute_type) IN (
+                    SELECT audio_sha256, model_size, compute_type FROM (
+                        SELECT audio_sha256, model_size, compute_type,
+                            SUM(size_bytes) OVER (
+                                ORDER BY last_accessed_at DESC
+                                ROWS UNBOUNDED PRECEDING
+                            ) AS running_bytes
+                        FROM transcript_cache
+                    ) ranked
+                    WHERE running_bytes > :max_bytes
+                )
+            """),
+            {"max_bytes": self.max_bytes},
+        ).rowcount
+        if expired or oversize:
+            logger.info(
+                f"Transcript cache evicted {expired} expired, {oversize} over budget"
+            )
+
+    def _log_counters(self, outcome: str, audio_sha256: str) -> None:
+        logger.info(
+            f"Transcript cache {outcome} for sha256={audio_sha256[:12]} "
+            f"(hits={self.hits}, misses={self.misses})"
+        )
@@ -1,10 +1,151 @@
 """Transcription service using faster-whisper."""
 
 import logging
-from typing import Optional
+import math
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator, Optional
 
 logger = logging.getLogger(__name__)
 
+# Audio used for language detection before chunks are fanned out
+LANGUAGE_DETECTION_SECONDS = 30
+
+# Read size when pulling model files into the page cache
+PREFETCH_BLOCK_BYTES = 16 * 1024 * 1024
+
+# Languages the English-only model transcribes; the rest are routed
+ENGLISH_LANGUAGES = frozenset({"en"})
+
+# Model owned by each chunked-transcription pool process, and its decoding options
+_pool_model = None
+_pool_options: dict[str, Any] = {}
+
+
+@dataclass
+class TranscriptResult:
+    """Everything one Whisper pass yields about a recording.
+
+    Segments are dicts with start and end (seconds), text, and Whisper's
+    ``avg_logprob`` and ``no_speech_prob`` for the segment.
+    """
+
+    segments: list[dict]
+    language: Optional[str] = None
+    duration: float = 0.0  # Seconds of audio, silence included
+    model: Optional[str] = None  # Whisper model that produced the segments
+    seconds: float = 0.0  # Transcription wall time, when measured
+
+    @property
+    def text(self) -> str:
+        """Full transcript text."""
+        return " ".join(segment["text"] for segment in self.segments)
+
+    @property
+    def confidence(self) -> float:
+        """Mean token probability over the speech, weighted by segment length.
+
+        0 when there are no segments (or none with probabilities).
+        """
+        weighted = total = 0.0
+        for segment in self.segments:
+            if "avg_logprob" not in segment:
+                continue
+            length = max(segment["end"] - segment["start"], 0.0)
+            weighted += length * math.exp(segment["avg_logprob"])
+            total += length
+        return round(weighted / total, 3) if total else 0.0
+
+    @property
+    def rtf(self) -> float:
+        """Real-time factor: transcription time per second of audio.
+
+        0 when the time was not measured (e.g. a cached transcript).
+        """
+        return round(self.seconds / self.duration, 4) if self.duration else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON form: language, duration, model, timing, confidence and segments.
+
+        The text is left out; it is the joined segments and is stored on
+        its own as the transcript.
+        """
+        return {
+            "language": self.language,
+            "duration": round(self.duration, 2),
+            "model": self.model,
+            "seconds": round(self.seconds, 2),
+            "confidence": self.confidence,
+            "segments": self.segments,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "TranscriptResult":
+        """Rebuild a result from ``to_dict`` output."""
+        return cls(
+            segments=data.get("segments") or [],
+            language=data.get("language"),
+            duration=data.get("duration") or 0.0,
+            model=data.get("model"),
+            seconds=data.get("seconds") or 0.0,
+        )
+
+
+def segment_dict(segment, offset: float = 0.0) -> dict:
+    """A faster-whisper segment as a dict, with times shifted by ``offset``."""
+    return {
+        "start": offset + segment.start,
+        "end": offset + segment.end,
+        "text": segment.text.strip(),
+        "avg_logprob": round(segment.avg_logprob, 3),
+        "no_speech_prob": round(segment.no_speech_prob, 3),
+    }
+
+
+def _init_pool_worker(
+    model_size: str,
+    device: str,
+    compute_type: str,
+    cpu_threads: int,
+    options: dict[str, Any],
+) -> None:
+    """Load one Whisper model per pool process."""
+    global _pool_model, _pool_options
+    from faster_whisper import WhisperModel
+
+    _pool_options = options
+    _pool_model = WhisperModel(
+        model_size,
+        device=device,
+        compute_type=compute_type,
+        cpu_threads=cpu_threads,
+    )
+
+
+def _detect_chunk_language(audio) -> str:
+    """Detect the spoken language of a PCM clip in a pool process."""
+    # Language detection runs eagerly; segments are lazy and never decoded
+    _, info = _pool_model.transcribe(audio, vad_filter=True, **_pool_options)
+    return info.language
+
+
+def _transcribe_chunk(audio, offset: float, language: Optional[str]) -> list[dict]:
+    """Transcribe one PCM chunk in a pool process.
+
+    Returns:
+        Segments with start and end shifted by ``offset`` seconds.
+    """
+    segments, _ = _pool_model.transcribe(
+        audio,
+        language=language,
+        vad_filter=True,
+        **_pool_options,
+    )
+    return [segment_dict(segment, offset) for segment in segments]
+
 
 class TranscriptionService:
     """Service for transcribing audio files using faster-whisper."""
@@ -14,6 +155,12 @@ class TranscriptionService:
         model_size: str = "distil-large-v3",
         device: Optional[str] = None,
         compute_type: str = "float16",
+        multilingual_model_size: Optional[str] = None,
+        memory_budget_mb: int = 0,
+        beam_size: int = 5,
+        without_timestamps: bool = False,
+        cpu_threads: int = 0,
+        num_workers: int = 1,
     ):
         """Initialize the transcription service.
 
@@ -21,10 +168,32 @@ class TranscriptionService:
             model_size: Whisper model size (default: distil-large-v3)
             device: Device to use ('cuda' or 'cpu'). Auto-detected if None.
             compute_type: Compute type for inference (float16, int8, etc.)
+            multilingual_model_size: Model for languages other than
+                English. When set, ``model_size`` only transcribes English
+                and the language is detected (or hinted) before decoding.
+            memory_budget_mb: Weights kept resident between jobs, in MB.
+                The English model always stays loaded; the multilingual one
+                stays too while both fit, and is released after each job
+                otherwise. 0 keeps both.
+            beam_size: Decoding beam width; 1 is greedy.
+            without_timestamps: Skip timestamp tokens; each segment then
+                spans its whole 30 s decoding window.
+            cpu_threads: CTranslate2 threads per model on CPU; 0 = default.
+            num_workers: Transcriptions a model runs in parallel, for
+                callers sharing it across threads.
         """
         self.model_size = model_size
         self.compute_type = compute_type
-        self._model = None
+        self.multilingual_model_size = multilingual_model_size
+        self.memory_budget_mb = memory_budget_mb
+        self.beam_size = beam_size
+        self.without_timestamps = without_timestamps
+        self.cpu_threads = cpu_threads
+        self.num_workers = num_workers
+        self._models: dict[str, Any] = {}
+        self._footprints_mb: dict[str, float] = {}
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_workers = 0
 
         # Auto-detect device
         if device is None:
@@ -37,28 +206,200 @@ class TranscriptionService:
         else:
             self.device = device
 
-        # Adjust compute type for CPU
-        if self.device == "cpu":
+        # Adjust compute type for CPU, which has no fast float16 path
+        if self.device == "cpu" and self.compute_type == "float16":
             self.compute_type = "int8"
 
         logger.info(
             f"TranscriptionService initialized: model={model_size}, "
-            f"device={self.device}, compute_type={self.compute_type}"
+            f"multilingual_model={multilingual_model_size}, "
+            f"device={self.device}, compute_type={self.compute_type}, "
+            f"beam_size={beam_size}"
         )
 
-    def _load_model(self):
-        """Lazy-load the Whisper model."""
-        if self._model is None:
+    @property
+    def decode_options(self) -> dict[str, Any]:
+        """Decoding options passed to every transcription call."""
+        return {"beam_size": self.beam_size, "without_timestamps": self.without_timestamps}
+
+    @property
+    def model_key(self) -> str:
+        """Every model a transcript may come from, and how it was decoded.
+
+        Keys the transcript cache, so jobs at different quality tiers do
+        not share transcripts.
+        """
+        key = self.model_size
+        if self.multilingual_model_size:
+            key += f"+{self.multilingual_model_size}"
+        if self.beam_size != 5:
+            key += f":beam{self.beam_size}"
+        if self.without_timestamps:
+            key += ":notimestamps"
+        return key
+
+    def model_for(self, language: Optional[str]) -> str:
+        """Model that transcribes a language.
+
+        English (and everything, without a multilingual model) goes to
+        ``model_size``; other languages to ``multilingual_model_size``.
+        """
+        if not self.multilingual_model_size or language in ENGLISH_LANGUAGES:
+            return self.model_size
+        return self.multilingual_model_size
+
+    def _load_model(self, model_size: Optional[str] = None):
+        """Lazy-load a Whisper model (the English one by default)."""
+        model_size = model_size or self.model_size
+        if model_size not in self._models:
             from faster_whisper import WhisperModel
 
-            logger.info(f"Loading Whisper model: {self.model_size}")
-            self._model = WhisperModel(
-                self.model_size,
+            logger.info(f"Loading Whisper model: {model_size}")
+            start = time.perf_counter()
+            self._models[model_size] = WhisperModel(
+                model_size,
                 device=self.device,
                 compute_type=self.compute_type,
+                cpu_threads=self.cpu_threads,
+                num_workers=self.num_workers,
+            )
+            logger.info(f"Whisper model loaded in {time.perf_counter() - start:.1f}s")
+        return self._models[model_size]
+
+    def _enforce_memory_budget(self) -> None:
+        """Unload the multilingual model if keeping it exceeds the memory budget."""
+        model_size = self.multilingual_model_size
+        if not self.memory_budget_mb or model_size not in self._models:
+            return
+        resident_mb = sum(self._footprint_mb(size) for size in self._models)
+        if resident_mb > self.memory_budget_mb:
+            del self._models[model_size]
+            logger.info(
+                f"Released Whisper model {model_size}: {resident_mb:.0f} MB resident "
+                f"exceeds the {self.memory_budget_mb} MB budget"
+            )
+
+    def _footprint_mb(self, model_size: str) -> float:
+        """Size of a model's files in MB, an upper bound on its weights in memory."""
+        if model_size not in self._footprints_mb:
+            path = self._model_path(model_size)
+            self._footprints_mb[model_size] = sum(
+                os.path.getsize(os.path.join(path, name))
+                for name in os.listdir(path)
+                if os.path.isfile(os.path.join(path, name))
+            ) / (1024 * 1024)
+        return self._footprints_mb[model_size]
+
+    @staticmethod
+    def _model_path(model_size: str) -> str:
+        """Local directory of a model, downloading it if needed."""
+        from faster_whisper.utils import download_model
+
+        if os.path.isdir(model_size):
+            return model_size
+        return download_model(model_size)
+
+    def prefetch_model(self) -> str:
+        """Download the model files and read them into the page cache.
+
+        Does not build the model, so it is safe before a fork; a later
+        load reads the weights from memory instead of disk or network.
+
+        Returns:
+            Local model directory.
+        """
+        path = self._model_path(self.model_size)
+
+        for name in os.listdir(path):
+            file_path = os.path.join(path, name)
+            if os.path.isfile(file_path):
+                with open(file_path, "rb") as f:
+                    while f.read(PREFETCH_BLOCK_BYTES):
+                        pass
+        logger.info(f"Prefetched Whisper model files: {path}")
+        return path
+
+    def _get_pool(self, workers: int) -> ProcessPoolExecutor:
+        """Lazy-create the chunked-transcription process pool.
+
+        Each process loads its own model with an even share of the CPU
+        threads, so the pool together uses every core without
+        oversubscribing.
+        """
+        if self._pool is None or self._pool_workers != workers:
+            if self._pool is not None:
+                self._pool.shutdown()
+            cpu_threads = max(1, (os.cpu_count() or 1) // workers)
+            logger.info(
+                f"Starting transcription pool: {workers} processes x "
+                f"{cpu_threads} threads"
+            )
+            self._pool = ProcessPoolExecutor(
+                max_workers=workers,
+                # Spawn, not fork: never copy a parent holding model threads
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_pool_worker,
+                initargs=(
+                    self.model_size,
+                    self.device,
+                    self.compute_type,
+                    cpu_threads,
+                    self.decode_options,
+                ),
+            )
+            self._pool_workers = workers
+        return self._pool
+
+    def transcribe_result(self, audio, language: Optional[str] = None) -> TranscriptResult:
+        """Transcribe an audio file in a single pass.
+
+        With a multilingual model configured, the language (unless given)
+        is detected once on the first 30 s and the audio is decoded by
+        the model for that language.
+
+        Args:
+            audio: Path to the audio file, or 16 kHz mono float32 samples.
+            language: Language code; auto-detected if None.
+
+        Returns:
+            TranscriptResult with the segments, language, duration and model.
+        """
+        model_size = self.model_size
+        if self.multilingual_model_size:
+            if isinstance(audio, str):
+                from faster_whisper import decode_audio
+
+                from app.services.audio import SAMPLE_RATE
+
+                audio = decode_audio(audio, sampling_rate=SAMPLE_RATE)
+            language = language or self.detect_language(audio)
+            model_size = self.model_for(language)
+        model = self._load_model(model_size)
+
+        logger.info(f"Transcribing audio with {model_size} (language={language})")
+        try:
+            segments, info = model.transcribe(
+                audio,
+                language=language,
+                vad_filter=True,  # Filter out non-speech
+                **self.decode_options,
             )
-            logger.info("Whisper model loaded successfully")
-        return self._model
+
+            logger.info(
+                f"Detected language: {info.language} "
+                f"(probability: {info.language_probability:.2f})"
+            )
+
+            result = TranscriptResult(
+                segments=[segment_dict(segment) for segment in segments],
+                language=info.language,
+                duration=info.duration,
+                model=model_size,
+            )
+        finally:
+            self._enforce_memory_budget()
+        logger.info(f"Transcription complete: {len(result.segments)} segments")
+        return result
 
     def transcribe(self, audio_path: str) -> str:
         """Transcribe an audio file to text.
@@ -69,59 +410,227 @@ class TranscriptionService:
         Returns:
             Full transcript text.
         """
-        model = self._load_model()
+        return self.transcribe_result(audio_path).text
 
-        logger.info(f"Transcribing audio file: {audio_path}")
-        segments, info = model.transcribe(
-            audio_path,
-            beam_size=5,
-            language=None,  # Auto-detect language
-            vad_filter=True,  # Filter out non-speech
+    def _transcribe_windows(
+        self, pcm_blocks: Iterable, window_seconds: float, language: Optional[str] = None
+    ) -> Iterator[tuple[float, float, str, list[dict]]]:
+        """Transcribe a PCM stream window by window as it is decoded.
+
+        Yields:
+            (offset, window length in seconds, language, segments) per window.
+        """
+        from app.services.audio import SAMPLE_RATE, iter_windows
+
+        logger.info(f"Transcribing audio stream in {window_seconds:.0f}s windows")
+        model = None
+        try:
+            for offset, window in iter_windows(pcm_blocks, window_seconds):
+                if model is None:
+                    # Route on the first window, unless the language was given
+                    if self.multilingual_model_size:
+                        language = language or self.detect_language(window)
+                    model = self._load_model(self.model_for(language))
+                segments, info = model.transcribe(
+                    window,
+                    language=language,
+                    vad_filter=True,
+                    **self.decode_options,
+                )
+                if language is None:
+                    # Detected on the first window, then reused
+                    language = info.language
+                    logger.info(
+                        f"Detected language: {info.language} "
+                        f"(probability: {info.language_probability:.2f})"
+                    )
+                yield (
+                    offset,
+                    len(window) / SAMPLE_RATE,
+                    language,
+                    [segment_dict(segment, offset) for segment in segments],
+                )
+        finally:
+            self._enforce_memory_budget()
+
+    def iter_stream_segments(
+        self,
+        pcm_blocks: Iterable,
+        window_seconds: float = 30.0,
+        language: Optional[str] = None,
+    ) -> Iterator[dict]:
+        """Transcribe a PCM stream window by window as it is decoded.
+
+        Each window is transcribed as soon as enough audio has arrived, so
+        the first segments are produced before the download finishes.
+
+        Args:
+            pcm_blocks: Iterable of 16 kHz mono float32 arrays
+                (see ``app.services.audio.stream_pcm``).
+            window_seconds: Audio length transcribed per model call.
+            language: Language code; detected on the first window if None.
+
+        Yields:
+            Segments with start, end (stream-relative seconds) and text.
+        """
+        for _, _, _, segments in self._transcribe_windows(
+            pcm_blocks, window_seconds, language
+        ):
+            yield from segments
+
+    def transcribe_stream(
+        self,
+        pcm_blocks: Iterable,
+        window_seconds: float = 30.0,
+        language: Optional[str] = None,
+    ) -> TranscriptResult:
+        """Transcribe a whole PCM stream, window by window.
+
+        Args:
+            pcm_blocks: Iterable of 16 kHz mono float32 arrays.
+            window_seconds: Audio length transcribed per model call.
+            language: Language code; detected on the first window if None.
+
+        Returns:
+            TranscriptResult for the stream.
+        """
+        result = TranscriptResult(segments=[], language=language)
+        for offset, length, language, segments in self._transcribe_windows(
+            pcm_blocks, window_seconds, language
+        ):
+            result.segments.extend(segments)
+            result.language = language
+            result.duration = offset + length
+        result.model = self.model_for(result.language)
+        logger.info(f"Transcription complete: {len(result.text)} characters")
+        return result
+
+    def transcribe_chunked(
+        self,
+        audio_path: str,
+        min_chunk_seconds: float = 60.0,
+        max_chunk_seconds: float = 120.0,
+        workers: Optional[int] = None,
+        language: Optional[str] = None,
+    ) -> TranscriptResult:
+        """Transcribe a long recording in parallel chunks.
+
+        Runs a VAD pre-pass over the decoded audio, cuts it at silences
+        into chunks, transcribes the chunks across a process pool and
+        stitches the segments back in order.
+
+        Args:
+            audio_path: Path to the audio file.
+            min_chunk_seconds: Minimum chunk length before cutting at a pause.
+            max_chunk_seconds: Maximum chunk length; longer unbroken speech
+                is force-split with a short overlap.
+            workers: Pool processes. Defaults to a quarter of the CPU count.
+            language: Language code; detected on the first speech if None.
+
+        Returns:
+            TranscriptResult with the stitched segments.
+        """
+        from faster_whisper import decode_audio
+        from faster_whisper.vad import VadOptions, get_speech_timestamps
+
+        from app.services.audio import SAMPLE_RATE
+        from app.services.chunking import plan_chunks, stitch_segments
+
+        workers = workers or max(1, (os.cpu_count() or 1) // 4)
+
+        logger.info(f"Transcribing audio file in chunks: {audio_path}")
+        audio = decode_audio(audio_path, sampling_rate=SAMPLE_RATE)
+        speech = get_speech_timestamps(audio, VadOptions())
+        chunks = plan_chunks(
+            speech,
+            total_samples=len(audio),
+            min_samples=int(min_chunk_seconds * SAMPLE_RATE),
+            max_samples=int(max_chunk_seconds * SAMPLE_RATE),
+            overlap_samples=SAMPLE_RATE,
         )
+        duration = len(audio) / SAMPLE_RATE
+        if not chunks:
+            logger.info("No speech detected")
+            return TranscriptResult(
+                segments=[], language=language, duration=duration, model=self.model_size
+            )
 
         logger.info(
-            f"Detected language: {info.language} "
-            f"(probability: {info.language_probability:.2f})"
+            f"Split {len(audio) / SAMPLE_RATE:.0f}s of audio into "
+            f"{len(chunks)} chunks across {workers} processes"
         )
+        # Detect once so every chunk decodes in the same language
+        first_speech = speech[0]["start"]
+        if self.multilingual_model_size:
+            language = language or self.detect_language(audio[first_speech:])
+            if self.model_for(language) != self.model_size:
+                # The pool holds the English model; the multilingual one
+                # transcribes in a single pass instead
+                return self.transcribe_result(audio, language)
+        pool = self._get_pool(workers)
+        if language is None:
+            language = pool.submit(
+                _detect_chunk_language,
+                audio[first_speech : first_speech + LANGUAGE_DETECTION_SECONDS * SAMPLE_RATE],
+            ).result()
+        logger.info(f"Detected language: {language}")
 
-        # Combine all segments into full transcript
-        transcript_parts = []
-        for segment in segments:
-            transcript_parts.append(segment.text.strip())
+        futures = [
+            pool.submit(
+                _transcribe_chunk,
+                audio[chunk.start : chunk.end],
+                chunk.start / SAMPLE_RATE,
+                language,
+            )
+            for chunk in chunks
+        ]
+        segments = stitch_segments(
+            [(chunk, future.result()) for chunk, future in zip(chunks, futures)],
+            SAMPLE_RATE,
+        )
 
-        transcript = " ".join(transcript_parts)
-        logger.info(f"Transcription complete: {len(transcript)} characters")
+        logger.info(f"Transcription complete: {len(segments)} segments")
+        return TranscriptResult(
+            segments=segments, language=language, duration=duration, model=self.model_size
+        )
 
-        return transcript
+    def detect_language(self, audio) -> str:
+        """Detect the spoken language of a PCM clip.
 
-    def transcribe_with_timestamps(self, audio_path: str) -> list[dict]:
-        """Transcribe audio with timestamp information.
+        Uses the multilingual model when there is one; the English-only
+        distilled model is unreliable on other languages.
 
         Args:
-            audio_path: Path to the audio file.
+            audio: 16 kHz mono float32 samples (the first 30 s are used).
 
         Returns:
-            List of segments with start, end, and text.
+            Language code, e.g. "en".
         """
-        model = self._load_model()
+        from app.services.audio import SAMPLE_RATE
 
-        logger.info(f"Transcribing audio with timestamps: {audio_path}")
-        segments, info = model.transcribe(
-            audio_path,
+        model = self._load_model(self.multilingual_model_size)
+        # Language detection runs eagerly; segments are lazy and never decoded
+        _, info = model.transcribe(
+            audio[: LANGUAGE_DETECTION_SECONDS * SAMPLE_RATE],
             beam_size=5,
-            language=None,
             vad_filter=True,
         )
+        logger.info(
+            f"Detected language: {info.language} "
+            f"(probability: {info.language_probability:.2f})"
+        )
+        return info.language
 
-        result = []
-        for segment in segments:
-            result.append(
-                {
-                    "start": segment.start,
-                    "end": segment.end,
-                    "text": segment.text.strip(),
-                }
-            )
+    def transcribe_with_timestamps(
+        self, audio_path: str, language: Optional[str] = None
+    ) -> list[dict]:
+        """Transcribe audio with timestamp information.
 
-        logger.info(f"Transcription complete: {len(result)} segments")
-        return result
+        Args:
+            audio_path: Path to the audio file.
+            language: Language code; auto-detected if None.
+
+        Returns:
+            List of segments with start, end, text and confidences.
+        """
+        return self.transcribe_result(audio_path, language).segments
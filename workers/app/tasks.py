@@ -3,19 +3,49 @@
 import json
 import logging
 import os
+import random
 import tempfile
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from enum import Enum
+from typing import Any, Generator
 from uuid import uuid4
 
-from celery.exceptions import SoftTimeLimitExceeded
+from celery import Task, chain, chord
+from celery.exceptions import Ignore, SoftTimeLimitExceeded, TaskPredicate
 from sqlmodel import text
 
+from app.autotune import tuned_options
+from app.core.config import get_settings
+from app.core.quality import QualityTier, parse_tier, tier_queue, tier_settings
 from app.core.database import get_session
-from app.main import celery_app
+from app.main import (
+    TASK_BACKFILL_SUMMARIES,
+    TASK_FETCH_AUDIO,
+    TASK_MERGE_PARTS,
+    TASK_PERSIST,
+    TASK_PROCESS_INTERVIEW,
+    TASK_SUMMARIZE,
+    TASK_SUMMARIZE_BATCH,
+    TASK_TRANSCRIBE,
+    TASK_TRANSCRIBE_PART,
+    QUEUE_SUMMARIZATION,
+    QUEUE_TRANSCRIPTION,
+    celery_app,
+)
+from app.services.model_client import (
+    ModelServerClient,
+    RemoteSummarizationService,
+    RemoteTranscriptionService,
+)
 from app.services.s3 import S3Service
-from app.services.transcription import TranscriptionService
-from app.services.summarization import SummarizationService
+from app.services.transcription import TranscriptResult, TranscriptionService
+from app.services.summarization import FALLBACK_SUMMARY, SummarizationService
+from app.services.summarization_queue import PendingSummaries
+from app.services.summary_cache import SummaryCache, summary_cache_key
+from app.services.transcript_cache import TranscriptCache
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -23,26 +53,81 @@ logger = logging.getLogger(__name__)
 # Transient errors that should trigger retries (keep PROCESSING status)
 TRANSIENT_ERRORS = (ConnectionError, TimeoutError, OSError)
 
-# Lazy-initialized service instances (loaded once per worker)
-_transcription_service: TranscriptionService | None = None
-_summarization_service: SummarizationService | None = None
+# Lazy-initialized service instances (loaded once per worker, per quality tier)
+_transcription_services: dict[QualityTier, TranscriptionService] = {}
+_summarization_services: dict[QualityTier, SummarizationService] = {}
 _s3_service: S3Service | None = None
+_transcript_cache: TranscriptCache | None = None
+_summary_cache: SummaryCache | None = None
+_pending_summaries: PendingSummaries | None = None
+# BatchedTranscriptionEngine; imported lazily since it needs the ML extra
+_batched_engine = None
+_partitioned_engine = None
+_partitioned_engine_lock = threading.Lock()
+
+
+def _model_server_client() -> ModelServerClient | None:
+    """Client for the node-local model server, if one is configured."""
+    settings = get_settings()
+    if not settings.model_server_url:
+        return None
+    return ModelServerClient(
+        settings.model_server_url, timeout=settings.model_server_timeout_seconds
+    )
 
 
-def get_transcription_service() -> TranscriptionService:
-    """Get or create the transcription service singleton."""
-    global _transcription_service
-    if _transcription_service is None:
-        _transcription_service = TranscriptionService()
-    return _transcription_service
+def get_transcription_service(
+    tier: QualityTier = QualityTier.BALANCED,
+) -> TranscriptionService:
+    """Get or create the transcription service singleton for a quality tier.
+
+    With a model server configured this is a thin client, so the worker
+    process never loads Whisper itself; the server's settings then apply
+    to every tier, so run one server per tier's nodes.
+    """
+    if tier not in _transcription_services:
+        client = _model_server_client()
+        if client:
+            _transcription_services[tier] = RemoteTranscriptionService(client)
+        else:
+            settings = tier_settings(get_settings(), tier)
+            _transcription_services[tier] = TranscriptionService(
+                model_size=settings.transcription_model,
+                compute_type=settings.transcription_compute_type,
+                multilingual_model_size=settings.transcription_multilingual_model or None,
+                memory_budget_mb=settings.transcription_memory_budget_mb,
+                beam_size=settings.transcription_beam_size,
+                without_timestamps=settings.transcription_without_timestamps,
+                cpu_threads=settings.transcription_cpu_threads,
+                num_workers=settings.transcription_num_workers,
+            )
+            service = _transcription_services[tier]
+            if settings.transcription_autotune and service.device == "cpu":
+                # Parallel transcriptions on one model only pay off when
+                # the batched engine's callers share it
+                shared = settings.batched_transcription and tier == QualityTier.BALANCED
+                # Before the first model load, so the tuned options apply
+                for option, value in tuned_options(settings, service.model_size, shared).items():
+                    setattr(service, option, value)
+    return _transcription_services[tier]
+
 
+def get_summarization_service(
+    tier: QualityTier = QualityTier.BALANCED,
+) -> SummarizationService:
+    """Get or create the summarization service singleton for a quality tier.
 
-def get_summarization_service() -> SummarizationService:
-    """Get or create the summarization service singleton."""
-    global _summarization_service
-    if _summarization_service is None:
-        _summarization_service = SummarizationService()
-    return _summarization_service
+    With a model server configured this is a thin client, so the worker
+    process never loads the LLM itself.
+    """
+    if tier not in _summarization_services:
+        client = _model_server_client()
+        _summarization_services[tier] = (
+            RemoteSummarizationService(client)
+            if client
+            else SummarizationService.from_settings(tier_settings(get_settings(), tier))
+        )
+    return _summarization_services[tier]
 
 
 def get_s3_service() -> S3Service:
@@ -53,6 +138,81 @@ def get_s3_service() -> S3Service:
     return _s3_service
 
 
+def get_transcript_cache() -> TranscriptCache | None:
+    """Get or create the transcript cache singleton (None if disabled)."""
+    global _transcript_cache
+    settings = get_settings()
+    if not settings.transcript_cache_enabled:
+        return None
+    if _transcript_cache is None:
+        _transcript_cache = TranscriptCache(
+            max_bytes=settings.transcript_cache_max_bytes,
+            max_age_days=settings.transcript_cache_max_age_days,
+        )
+    return _transcript_cache
+
+
+def get_summary_cache() -> SummaryCache | None:
+    """Get or create the summary cache singleton (None if disabled)."""
+    global _summary_cache
+    settings = get_settings()
+    if not settings.summary_cache_enabled:
+        return None
+    if _summary_cache is None:
+        _summary_cache = SummaryCache(
+            max_bytes=settings.summary_cache_max_bytes,
+            max_age_days=settings.summary_cache_max_age_days,
+        )
+    return _summary_cache
+
+
+def get_pending_summaries() -> PendingSummaries:
+    """Get or create the batched-summarization queue singleton."""
+    global _pending_summaries
+    if _pending_summaries is None:
+        from redis import Redis
+
+        settings = get_settings()
+        _pending_summaries = PendingSummaries(
+            Redis.from_url(settings.get_redis_url()),
+            lease_seconds=settings.summarization_dispatch_lease_seconds,
+        )
+    return _pending_summaries
+
+
+def get_batched_engine():
+    """Get or create the batched transcription engine singleton."""
+    global _batched_engine
+    if _batched_engine is None:
+        from app.services.batched_transcription import BatchedTranscriptionEngine
+
+        settings = get_settings()
+        _batched_engine = BatchedTranscriptionEngine(
+            get_transcription_service(),
+            batch_size=settings.transcription_batch_size,
+            max_wait_ms=settings.transcription_batch_max_wait_ms,
+        )
+    return _batched_engine
+
+
+def get_partitioned_engine():
+    """Get or create the partitioned transcription engine singleton.
+
+    Partitioned workers run a thread pool, so concurrent first jobs must
+    not each start a set of pinned partition processes.
+    """
+    global _partitioned_engine
+    with _partitioned_engine_lock:
+        if _partitioned_engine is None:
+            from app.services.partitioned_transcription import PartitionedTranscriptionEngine
+
+            _partitioned_engine = PartitionedTranscriptionEngine(
+                get_transcription_service(),
+                partitions=get_settings().transcription_partitions,
+            )
+    return _partitioned_engine
+
+
 class JobStatus(str, Enum):
     """Processing job status - must match API enum."""
 
@@ -85,37 +245,333 @@ def _update_job_failed(job_id: str, error_message: str) -> None:
         logger.error(f"Failed to update job status: {db_exc}")
 
 
+def _retry_countdown(retries: int) -> float:
+    """Exponential backoff with jitter for the given retry number.
+
+    The delay doubles per attempt up to the configured cap; the upper
+    half is randomized so retries of many jobs do not arrive in lockstep.
+    """
+    settings = get_settings()
+    delay = min(
+        settings.retry_backoff_max_seconds,
+        settings.retry_backoff_base_seconds * (2**retries),
+    )
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+def _load_checkpoints(job_id: str) -> dict[str, Any]:
+    """Load the stage checkpoints recorded for a job."""
+    with get_session() as session:
+        result = session.execute(
+            text("SELECT checkpoints FROM processing_jobs WHERE id = :job_id"),
+            {"job_id": job_id},
+        )
+        return result.scalar() or {}
+
+
+def _load_quality_tier(job_id: str) -> QualityTier:
+    """Load the quality tier chosen for a job at upload."""
+    with get_session() as session:
+        result = session.execute(
+            text("SELECT quality_tier FROM processing_jobs WHERE id = :job_id"),
+            {"job_id": job_id},
+        )
+        return parse_tier(result.scalar())
+
+
+def _save_checkpoint(job_id: str, stage: str, output: dict[str, Any]) -> None:
+    """Record a completed stage's output so retries can resume after it."""
+    with get_session() as session:
+        session.execute(
+            text("""
+                UPDATE processing_jobs
+                SET checkpoints = COALESCE(checkpoints, '{}'::jsonb)
+                        || jsonb_build_object(:stage, CAST(:output AS jsonb)),
+                    updated_at = :updated_at
+                WHERE id = :job_id
+            """),
+            {
+                "stage": stage,
+                "output": json.dumps(output),
+                "updated_at": datetime.now(timezone.utc),
+                "job_id": job_id,
+            },
+        )
+        session.commit()
+    logger.info(f"Job {job_id} checkpoint saved: {stage}")
+
+
+@contextmanager
+def _pipeline_stage(task: Task, job_id: str, stage: str) -> Generator[None, None, None]:
+    """Apply the shared error policy to one pipeline stage.
+
+    - Soft time limit: permanent failure, mark FAILED.
+    - Transient errors: keep PROCESSING and retry this stage only, with
+      exponential backoff and jitter.
+    - Anything else: permanent failure, mark FAILED.
+
+    Permanent failures raise ``Ignore`` so the rest of the chain is not run.
+    """
+    try:
+        yield
+    except TaskPredicate:
+        # Celery control flow (retry / replace / ignore) - not an error
+        raise
+    except SoftTimeLimitExceeded:
+        # Task timed out - permanent failure, do not retry
+        logger.error(f"Job {job_id} timed out in {stage} (soft time limit exceeded)")
+        _update_job_failed(job_id, "Processing timed out after 55 minutes")
+        raise Ignore()
+    except TRANSIENT_ERRORS as exc:
+        # Transient error - keep PROCESSING status and retry
+        logger.warning(
+            f"Job {job_id} encountered transient error in {stage}: {exc}. "
+            f"Retry {task.request.retries + 1}/{task.max_retries}"
+        )
+        # Do NOT update status to FAILED - keep as PROCESSING for retry
+        raise task.retry(exc=exc, countdown=_retry_countdown(task.request.retries))
+    except Exception as exc:
+        # Permanent error - mark as FAILED, do not retry
+        logger.error(f"Job {job_id} failed in {stage} with permanent error: {exc}")
+        _update_job_failed(job_id, str(exc))
+        raise Ignore()
+
+
+def _temp_audio_path(job_id: str) -> str:
+    """Unique local path for a job's downloaded audio."""
+    return os.path.join(
+        tempfile.gettempdir(),
+        f"vibecheck_{job_id}_{uuid4().hex[:8]}.audio"
+    )
+
+
+def _remove_temp_file(path: str | None) -> None:
+    """Delete a temp file if it exists, logging (not raising) on failure."""
+    if path and os.path.exists(path):
+        try:
+            os.remove(path)
+            logger.info(f"Cleaned up temp file: {path}")
+        except OSError as e:
+            logger.warning(f"Failed to cleanup temp file: {e}")
+
+
+def _transcribe_output(
+    job_id: str, audio_sha256: str, result: TranscriptResult
+) -> dict[str, Any]:
+    """Checkpoint a transcription as the transcribe stage output.
+
+    Returns:
+        The stage output: ``audio_sha256``, the ``transcript`` text and
+        the rest of the result as ``transcription`` (language, duration,
+        confidence, segments), so no later stage re-runs Whisper.
+    """
+    output = {
+        "audio_sha256": audio_sha256,
+        "transcript": result.text,
+        "transcription": result.to_dict(),
+    }
+    _save_checkpoint(job_id, "transcribe", output)
+    return output
+
+
+def _complete_transcription(
+    job_id: str, audio_sha256: str, result: TranscriptResult, tier: QualityTier
+) -> dict[str, Any]:
+    """Cache a fresh transcription and checkpoint it.
+
+    Returns:
+        The transcribe stage output (see ``_transcribe_output``).
+    """
+    logger.info(
+        f"Transcription complete: {len(result.text)} characters, "
+        f"language={result.language}, model={result.model}, "
+        f"rtf={result.rtf:.3f}, confidence={result.confidence:.2f}"
+    )
+
+    cache = get_transcript_cache()
+    if cache:
+        transcription_service = get_transcription_service(tier)
+        cache.put(
+            audio_sha256,
+            transcription_service.model_key,
+            transcription_service.compute_type,
+            result,
+        )
+
+    return _transcribe_output(job_id, audio_sha256, result)
+
+
+def _should_fan_out(local_audio_path: str) -> bool:
+    """Whether a recording is long enough to fan out across the fleet."""
+    settings = get_settings()
+    if not settings.fanout_enabled:
+        return False
+
+    from app.services.audio import probe_duration
+
+    return probe_duration(local_audio_path) >= settings.fanout_min_audio_seconds
+
+
+def _fan_out_transcription(payload: dict, local_audio_path: str, audio_sha256: str):
+    """Split a long recording into S3 parts and build a transcription chord.
+
+    Parts are cut by duration at quiet points and uploaded as 16 kHz WAV
+    under ``fanout_s3_prefix``; the merge callback deletes them. Configure
+    an S3 lifecycle rule on that prefix to catch parts of abandoned jobs.
+
+    Returns:
+        A chord of transcribe_part tasks with merge_parts as its callback.
+    """
+    from faster_whisper import decode_audio
+
+    from app.services.audio import SAMPLE_RATE, encode_wav, split_by_duration
+
+    settings = get_settings()
+    job_id = payload["job_id"]
+    tier = parse_tier(payload.get("quality_tier"))
+
+    audio = decode_audio(local_audio_path, sampling_rate=SAMPLE_RATE)
+    duration = len(audio) / SAMPLE_RATE
+    # Detect once (unless hinted) so every part decodes in the same language
+    language = payload.get("language") or get_transcription_service(tier).detect_language(audio)
+    parts = split_by_duration(audio, settings.fanout_segment_seconds)
+
+    s3_service = get_s3_service()
+    part_keys = []
+    header = []
+    for index, (offset, samples) in enumerate(parts):
+        key = f"{settings.fanout_s3_prefix}/{job_id}/{index:04d}.wav"
+        s3_service.upload_bytes(key, encode_wav(samples), "audio/wav")
+        part_keys.append(key)
+        header.append(
+            transcribe_part.s(job_id, key, offset / SAMPLE_RATE, language, tier.value).set(
+                queue=tier_queue(QUEUE_TRANSCRIPTION, tier)
+            )
+        )
+
+    logger.info(f"Job {job_id} fanned out: {duration:.0f}s of audio in {len(parts)} parts")
+    return chord(
+        header,
+        merge_parts.s(
+            {**payload, "audio_sha256": audio_sha256}, part_keys, language, duration
+        ),
+    )
+
+
+def _cache_summary(
+    transcript: str, summary: dict[str, Any], tier: QualityTier = QualityTier.BALANCED
+) -> None:
+    """Store a fresh summary in the summary cache, if enabled.
+
+    Fallback summaries (unparseable model output) are not cached, so the
+    next attempt on the same transcript runs the model again.
+    """
+    cache = get_summary_cache()
+    if not cache or summary.get("executive_summary") == FALLBACK_SUMMARY["executive_summary"]:
+        return
+    summarization_service = get_summarization_service(tier)
+    cache.put(
+        summary_cache_key(summarization_service.fingerprint, transcript),
+        summarization_service.model_name,
+        summary,
+    )
+
+
+def transcription_metrics(transcription: dict[str, Any]) -> dict[str, Any]:
+    """Language, model and real-time factor of a job's transcription.
+
+    Stored under ``transcription`` in ``metrics_json`` so RTF can be
+    compared per language and model. The RTF is 0 for cached transcripts.
+    """
+    result = TranscriptResult.from_dict(transcription)
+    return {"language": result.language, "model": result.model, "rtf": result.rtf}
+
+
+def analysis_metrics(summary: dict[str, Any]) -> dict[str, Any]:
+    """The ``metrics_json`` stored on an InterviewAnalysis for a summary."""
+    metrics_json = {
+        "executive_summary": summary["executive_summary"],
+        "key_topics": summary["key_topics"],
+        "strengths": summary["strengths"],
+        "areas_for_improvement": summary["areas_for_improvement"],
+    }
+    # Summarization cascade: which model answered, after which attempts
+    for key in ("model_tier", "tiers_tried"):
+        if key in summary:
+            metrics_json[key] = summary[key]
+    return metrics_json
+
+
+@celery_app.task(name=TASK_PROCESS_INTERVIEW, bind=True, max_retries=3)
+def process_interview(self, job_id: str) -> dict:
+    """Process an interview recording.
+
+    Dispatches the per-stage pipeline as a Celery chain, each stage on its
+    own queue (see ``app.main``):
+    1. fetch_audio - load job, mark PROCESSING, locate audio in S3
+    2. transcribe - transcribe using faster-whisper
+    3. summarize - summarize using Llama 3.3 8B
+    4. persist - upsert InterviewAnalysis and mark job COMPLETED
+
+    Stages whose output is already checkpointed on the job (from an
+    earlier attempt) are left out of the chain. Transcription and
+    summarization go to the queues of the job's quality tier.
+
+    Reading the job follows the stage error policy, so a database outage
+    retries the dispatch instead of leaving the job QUEUED.
+
+    Args:
+        job_id: UUID string of the ProcessingJob.
+
+    Returns:
+        Dict with the dispatch status and the chain's final task ID.
+    """
+    logger.info(f"Dispatching processing pipeline for job {job_id}")
+    with _pipeline_stage(self, job_id, "dispatch"):
+        checkpoints = _load_checkpoints(job_id)
+        tier = _load_quality_tier(job_id)
+
+    stages = [fetch_audio.s(job_id)]
+    for name, stage, queue in (
+        ("transcribe", transcribe, QUEUE_TRANSCRIPTION),
+        ("summarize", summarize, QUEUE_SUMMARIZATION),
+    ):
+        if name in checkpoints:
+            logger.info(f"Job {job_id} resuming after checkpoint: {name}")
+        else:
+            stages.append(stage.s().set(queue=tier_queue(queue, tier)))
+    stages.append(persist.s())
+
+    result = chain(*stages).apply_async()
+    return {"status": "dispatched", "job_id": job_id, "task_id": result.id}
+
+
 @celery_app.task(
-    name="vibecheck.tasks.process_interview",
+    name=TASK_FETCH_AUDIO,
     bind=True,
     max_retries=3,
-    default_retry_delay=60,
 )
-def process_interview(self, job_id: str) -> dict:
-    """Process an interview recording.
+def fetch_audio(self, job_id: str) -> dict:
+    """Load the job, mark it PROCESSING and locate its audio.
 
-    Pipeline:
-    1. Download audio from S3
-    2. Transcribe using faster-whisper
-    3. Summarize using Llama 3.3 8B
-    4. Create InterviewAnalysis record
-    5. Update job with analysis_id
+    The audio bytes themselves are read by the transcribe stage, so the
+    stages can run on different hosts without a shared filesystem. Outputs
+    of already-checkpointed stages are merged into the payload.
 
     Args:
         job_id: UUID string of the ProcessingJob.
 
     Returns:
-        Dict with processing result status.
+        Pipeline payload for the next stage.
     """
     logger.info(f"Starting processing for job {job_id}")
-    local_audio_path = None
 
-    try:
-        # Get job details
+    with _pipeline_stage(self, job_id, "fetch_audio"):
         with get_session() as session:
             result = session.execute(
                 text("""
-                    SELECT s3_audio_key, user_id, interviewer_id
+                    SELECT s3_audio_key, user_id, interviewer_id, checkpoints, language,
+                        quality_tier
                     FROM processing_jobs
                     WHERE id = :job_id
                 """),
@@ -128,6 +584,9 @@ def process_interview(self, job_id: str) -> dict:
             s3_audio_key = row[0]
             user_id = row[1]
             interviewer_id = row[2]
+            checkpoints = row[3] or {}
+            language = row[4]
+            tier = parse_tier(row[5])
 
             if not interviewer_id:
                 raise ValueError(f"Job {job_id} missing interviewer_id")
@@ -148,58 +607,435 @@ def process_interview(self, job_id: str) -> dict:
             session.commit()
             logger.info(f"Job {job_id} status updated to PROCESSING")
 
-        # Step 1: Download audio from S3
-        logger.info(f"Downloading audio: {s3_audio_key}")
-        s3_service = get_s3_service()
-        local_audio_path = os.path.join(
-            tempfile.gettempdir(),
-            f"vibecheck_{job_id}_{uuid4().hex[:8]}.audio"
+        if "fetch_audio" in checkpoints:
+            audio_size = checkpoints["fetch_audio"]["audio_size"]
+        else:
+            audio_size = get_s3_service().get_file_size(s3_audio_key)
+            if audio_size is None:
+                raise ValueError(f"Audio not found in S3: {s3_audio_key}")
+            _save_checkpoint(
+                job_id,
+                "fetch_audio",
+                {"s3_audio_key": s3_audio_key, "audio_size": audio_size},
+            )
+        logger.info(f"Located audio {s3_audio_key} ({audio_size} bytes)")
+
+    payload = {
+        "job_id": job_id,
+        "user_id": str(user_id),
+        "interviewer_id": str(interviewer_id),
+        "s3_audio_key": s3_audio_key,
+        # Language hint from the upload; None = detect
+        "language": language,
+        "quality_tier": tier.value,
+    }
+    for stage in ("transcribe", "summarize"):
+        payload.update(checkpoints.get(stage, {}))
+    return payload
+
+
+@celery_app.task(
+    name=TASK_TRANSCRIBE,
+    bind=True,
+    max_retries=3,
+)
+def transcribe(self, payload: dict) -> dict:
+    """Read the job's audio from S3 and transcribe it.
+
+    Args:
+        payload: Pipeline payload from fetch_audio.
+
+    Returns:
+        Payload with ``audio_sha256``, ``transcript`` and
+        ``transcription`` added.
+    """
+    job_id = payload["job_id"]
+    s3_audio_key = payload["s3_audio_key"]
+    language = payload.get("language")
+    tier = parse_tier(payload.get("quality_tier"))
+    local_audio_path = None
+
+    if "transcript" in payload:
+        logger.info(f"Job {job_id} transcript checkpointed, skipping transcription")
+        return payload
+
+    try:
+        with _pipeline_stage(self, job_id, "transcribe"):
+            settings = get_settings()
+            s3_service = get_s3_service()
+            transcription_service = get_transcription_service(tier)
+            cache = get_transcript_cache()
+
+            if settings.streaming_ingest:
+                # Stream audio from S3 through ffmpeg into Whisper, hashing
+                # as it goes. Transcription starts before the hash is known,
+                # so the cache is only written on this path.
+                from app.services.audio import stream_pcm
+                from app.services.s3 import HashingStream
+
+                logger.info(f"Streaming audio: {s3_audio_key}")
+                body = HashingStream(s3_service.open_stream(s3_audio_key))
+                start = time.perf_counter()
+                try:
+                    result = transcription_service.transcribe_stream(
+                        stream_pcm(body),
+                        window_seconds=settings.stream_window_seconds,
+                        language=language,
+                    )
+                finally:
+                    body.close()
+                result.seconds = time.perf_counter() - start
+                audio_sha256 = body.hexdigest()
+                cached = None
+            else:
+                # Download audio from S3 (hashing on the way), then
+                # transcribe unless the same audio was transcribed before
+                logger.info(f"Downloading audio: {s3_audio_key}")
+                local_audio_path = _temp_audio_path(job_id)
+                audio_sha256 = s3_service.download_file_with_hash(
+                    s3_audio_key, local_audio_path
+                )
+                cached = None
+                if cache:
+                    cached = cache.get(
+                        audio_sha256,
+                        transcription_service.model_key,
+                        transcription_service.compute_type,
+                    )
+
+                start = time.perf_counter()
+                if cached:
+                    result = cached
+                elif _should_fan_out(local_audio_path):
+                    # Very long recording: hand transcription to the fleet.
+                    # The chord's merge callback continues the chain.
+                    raise self.replace(
+                        _fan_out_transcription(payload, local_audio_path, audio_sha256)
+                    )
+                # A model server batches across jobs by itself; the shared
+                # engine runs the balanced tier's models
+                elif (
+                    settings.batched_transcription
+                    and not settings.model_server_url
+                    and tier == QualityTier.BALANCED
+                ):
+                    logger.info("Starting batched transcription...")
+                    result = get_batched_engine().transcribe(local_audio_path, language)
+                elif (
+                    settings.partitioned_transcription
+                    and not settings.model_server_url
+                    and tier == QualityTier.BALANCED
+                ):
+                    logger.info("Starting partitioned transcription...")
+                    result = get_partitioned_engine().transcribe(local_audio_path, language)
+                elif settings.chunked_transcription:
+                    logger.info("Starting chunked transcription...")
+                    result = transcription_service.transcribe_chunked(
+                        local_audio_path,
+                        min_chunk_seconds=settings.chunk_min_seconds,
+                        max_chunk_seconds=settings.chunk_max_seconds,
+                        workers=settings.chunk_pool_workers or None,
+                        language=language,
+                    )
+                else:
+                    logger.info("Starting transcription...")
+                    result = transcription_service.transcribe_result(local_audio_path, language)
+                if not cached:
+                    result.seconds = time.perf_counter() - start
+
+            if cached:
+                logger.info("Reusing cached transcript, transcription skipped")
+                output = _transcribe_output(job_id, audio_sha256, result)
+            else:
+                output = _complete_transcription(job_id, audio_sha256, result, tier)
+    finally:
+        _remove_temp_file(local_audio_path)
+
+    return {**payload, **output}
+
+
+@celery_app.task(
+    name=TASK_TRANSCRIBE_PART,
+    bind=True,
+    max_retries=3,
+)
+def transcribe_part(
+    self,
+    job_id: str,
+    s3_key: str,
+    offset: float,
+    language: str,
+    quality_tier: str = QualityTier.BALANCED.value,
+) -> list[dict]:
+    """Transcribe one fanned-out part of a long recording.
+
+    Args:
+        job_id: UUID string of the ProcessingJob.
+        s3_key: S3 key of the part's WAV file.
+        offset: Start of the part within the recording, in seconds.
+        language: Language detected on the full recording.
+        quality_tier: The job's quality tier.
+
+    Returns:
+        Segments with start and end relative to the full recording.
+    """
+    local_audio_path = None
+    try:
+        with _pipeline_stage(self, job_id, "transcribe_part"):
+            local_audio_path = _temp_audio_path(job_id)
+            get_s3_service().download_file(s3_key, local_audio_path)
+            transcription_service = get_transcription_service(parse_tier(quality_tier))
+            segments = transcription_service.transcribe_with_timestamps(
+                local_audio_path, language=language
+            )
+    finally:
+        _remove_temp_file(local_audio_path)
+
+    return [
+        {**segment, "start": offset + segment["start"], "end": offset + segment["end"]}
+        for segment in segments
+    ]
+
+
+@celery_app.task(
+    name=TASK_MERGE_PARTS,
+    bind=True,
+    max_retries=3,
+)
+def merge_parts(
+    self,
+    part_segments: list[list[dict]],
+    payload: dict,
+    part_keys: list[str],
+    language: str | None = None,
+    duration: float = 0.0,
+) -> dict:
+    """Merge fanned-out part transcripts by timestamp (chord callback).
+
+    Args:
+        part_segments: Segments returned by each transcribe_part task.
+        payload: Pipeline payload from the transcribe stage.
+        part_keys: S3 keys of the temporary parts, deleted here.
+        language: Language detected on the full recording.
+        duration: Length of the full recording in seconds.
+
+    Returns:
+        Payload with ``audio_sha256``, ``transcript`` and
+        ``transcription`` for summarize.
+    """
+    job_id = payload["job_id"]
+
+    with _pipeline_stage(self, job_id, "merge_parts"):
+        segments = sorted(
+            (segment for part in part_segments for segment in part),
+            key=lambda segment: segment["start"],
         )
-        s3_service.download_file(s3_audio_key, local_audio_path)
+        output = _complete_transcription(
+            job_id,
+            payload["audio_sha256"],
+            TranscriptResult(segments=segments, language=language, duration=duration),
+            parse_tier(payload.get("quality_tier")),
+        )
+        get_s3_service().delete_files(part_keys)
+
+    return {**payload, **output}
 
-        # Step 2: Transcribe audio
-        logger.info("Starting transcription...")
-        transcription_service = get_transcription_service()
-        transcript = transcription_service.transcribe(local_audio_path)
-        logger.info(f"Transcription complete: {len(transcript)} characters")
 
-        # Step 3: Summarize transcript
-        logger.info("Starting summarization...")
-        summarization_service = get_summarization_service()
-        summary = summarization_service.summarize(transcript)
-        logger.info("Summarization complete")
+@celery_app.task(
+    name=TASK_SUMMARIZE,
+    bind=True,
+    max_retries=3,
+)
+def summarize(self, payload: dict) -> dict:
+    """Summarize the job's transcript.
+
+    Args:
+        payload: Pipeline payload from transcribe.
+
+    Summaries are looked up in the summary cache first, keyed by the
+    transcript and the service's prompts, models and generation settings.
+    The job's quality tier picks the service.
+
+    Returns:
+        Payload with ``summary`` added.
+    """
+    job_id = payload["job_id"]
+    tier = parse_tier(payload.get("quality_tier"))
+
+    if "summary" in payload:
+        logger.info(f"Job {job_id} summary checkpointed, skipping summarization")
+        return payload
 
-        # Step 4: Create InterviewAnalysis record (idempotent via job_id)
+    with _pipeline_stage(self, job_id, "summarize"):
+        cache = get_summary_cache()
+        summary = None
+        if cache:
+            summary = cache.get(
+                summary_cache_key(
+                    get_summarization_service(tier).fingerprint, payload["transcript"]
+                )
+            )
+
+        if summary:
+            logger.info("Reusing cached summary, summarization skipped")
+        # The batch dispatcher runs the balanced tier's service
+        elif get_settings().batched_summarization and tier == QualityTier.BALANCED:
+            # summarize_batch continues the pipeline with persist
+            get_pending_summaries().push(payload)
+            summarize_batch.delay()
+            logger.info(f"Job {job_id} queued for batched summarization")
+            raise Ignore()
+        else:
+            logger.info("Starting summarization...")
+            summarization_service = get_summarization_service(tier)
+            summary = summarization_service.summarize(payload["transcript"])
+            logger.info("Summarization complete")
+            _cache_summary(payload["transcript"], summary, tier)
+
+        _save_checkpoint(job_id, "summarize", {"summary": summary})
+
+    return {**payload, "summary": summary}
+
+
+@celery_app.task(
+    name=TASK_SUMMARIZE_BATCH,
+    bind=True,
+    max_retries=3,
+)
+def summarize_batch(self) -> dict:
+    """Summarize queued transcripts together (batched summarization).
+
+    In batched mode each summarize stage queues its payload and sends one
+    of these. A dispatcher claims up to ``summarization_batch_size``
+    payloads, waiting at most ``summarization_dispatch_max_wait_ms`` for
+    them, summarizes them in batched generations, then checkpoints each
+    summary and sends each job on to persist. Dispatchers that find the
+    queue already drained return at once.
+
+    Claimed payloads stay in the dispatcher's processing list until the
+    jobs have moved on, and a retry resumes the same batch. Every
+    dispatcher first requeues batches abandoned by dead dispatchers, and
+    each claimed batch schedules one more dispatcher for after its lease,
+    so an abandoned batch is picked up even if no new jobs arrive.
+
+    Returns:
+        Dict with the dispatch status and the number of jobs summarized.
+    """
+    settings = get_settings()
+    pending = get_pending_summaries()
+    dispatcher = self.request.id or uuid4().hex
+    pending.reap()
+    payloads = pending.drain(
+        dispatcher,
+        settings.summarization_batch_size,
+        settings.summarization_dispatch_max_wait_ms,
+    )
+    if not payloads:
+        return {"status": "empty", "jobs": 0}
+    summarize_batch.apply_async(countdown=settings.summarization_dispatch_lease_seconds + 60)
+
+    def fail_batch(message: str) -> None:
+        for payload in payloads:
+            _update_job_failed(payload["job_id"], message)
+        pending.complete(dispatcher)
+
+    logger.info(f"Summarizing a batch of {len(payloads)} transcripts")
+    try:
+        summaries = get_summarization_service().summarize_batch(
+            [payload["transcript"] for payload in payloads]
+        )
+    except SoftTimeLimitExceeded:
+        logger.error(f"Summarization batch of {len(payloads)} timed out")
+        fail_batch("Processing timed out after 55 minutes")
+        raise Ignore()
+    except TRANSIENT_ERRORS as exc:
+        if self.request.retries >= self.max_retries:
+            logger.error(f"Summarization batch failed after {self.max_retries} retries: {exc}")
+            fail_batch(str(exc))
+            raise Ignore()
+        # Keep the jobs PROCESSING and claimed; the retry resumes this batch
+        logger.warning(
+            f"Summarization batch hit a transient error: {exc}. "
+            f"Retry {self.request.retries + 1}/{self.max_retries}"
+        )
+        pending.renew(dispatcher)
+        raise self.retry(exc=exc, countdown=_retry_countdown(self.request.retries))
+    except Exception as exc:
+        logger.error(f"Summarization batch failed with permanent error: {exc}")
+        fail_batch(str(exc))
+        raise Ignore()
+    logger.info("Batched summarization complete")
+
+    for payload, summary in zip(payloads, summaries):
+        job_id = payload["job_id"]
+        _cache_summary(payload["transcript"], summary)
+        try:
+            _save_checkpoint(job_id, "summarize", {"summary": summary})
+        except Exception as exc:
+            # Only a resume shortcut; persist still gets the summary
+            logger.warning(f"Job {job_id} summarize checkpoint not saved: {exc}")
+        persist.delay({**payload, "summary": summary})
+    pending.complete(dispatcher)
+
+    return {"status": "dispatched", "jobs": len(payloads)}
+
+
+@celery_app.task(
+    name=TASK_PERSIST,
+    bind=True,
+    max_retries=3,
+)
+def persist(self, payload: dict) -> dict:
+    """Upsert the InterviewAnalysis record and mark the job COMPLETED.
+
+    The upsert is idempotent on ``job_id``, so retries and reprocessing
+    update the existing analysis instead of creating duplicates.
+
+    Args:
+        payload: Pipeline payload from summarize.
+
+    Returns:
+        Dict with processing result status.
+    """
+    job_id = payload["job_id"]
+    summary = payload["summary"]
+
+    with _pipeline_stage(self, job_id, "persist"):
+        # Create InterviewAnalysis record (idempotent via job_id)
         analysis_id = str(uuid4())
-        metrics_json = {
-            "executive_summary": summary["executive_summary"],
-            "key_topics": summary["key_topics"],
-            "strengths": summary["strengths"],
-            "areas_for_improvement": summary["areas_for_improvement"],
-        }
+        metrics_json = analysis_metrics(summary)
+        if "transcription" in payload:
+            metrics_json["transcription"] = transcription_metrics(payload["transcription"])
 
         with get_session() as session:
             session.execute(
                 text("""
                     INSERT INTO interview_analyses
-                    (id, job_id, user_id, interviewer_id, sentiment_score, summary, metrics_json, transcript_redacted, created_at, updated_at)
-                    VALUES (:id, :job_id, :user_id, :interviewer_id, :sentiment_score, :summary, :metrics_json, :transcript, :now, :now)
+                    (id, job_id, user_id, interviewer_id, sentiment_score, summary, metrics_json, transcript_redacted, transcript_json, created_at, updated_at)
+                    VALUES (:id, :job_id, :user_id, :interviewer_id, :sentiment_score, :summary, :metrics_json, :transcript, :transcript_json, :now, :now)
                     ON CONFLICT (job_id) DO UPDATE SET
                         sentiment_score = EXCLUDED.sentiment_score,
                         summary = EXCLUDED.summary,
                         metrics_json = EXCLUDED.metrics_json,
                         transcript_redacted = EXCLUDED.transcript_redacted,
+                        transcript_json = EXCLUDED.transcript_json,
                         updated_at = EXCLUDED.updated_at
                 """),
                 {
                     "id": analysis_id,
                     "job_id": job_id,
-                    "user_id": str(user_id),
-                    "interviewer_id": str(interviewer_id),
+                    "user_id": payload["user_id"],
+                    "interviewer_id": payload["interviewer_id"],
                     "sentiment_score": summary["sentiment_score"],
                     "summary": summary["executive_summary"],
                     "metrics_json": json.dumps(metrics_json),
-                    "transcript": transcript,
+                    "transcript": payload["transcript"],
+                    # Absent for jobs checkpointed before transcription details
+                    "transcript_json": (
+                        json.dumps(payload["transcription"])
+                        if "transcription" in payload
+                        else None
+                    ),
                     "now": datetime.now(timezone.utc),
                 },
             )
@@ -213,12 +1049,14 @@ def process_interview(self, job_id: str) -> dict:
             analysis_id = str(result.scalar())
             logger.info(f"Created/updated InterviewAnalysis: {analysis_id}")
 
-        # Step 5: Update job with analysis_id and mark COMPLETED
+        # Update job with analysis_id, mark COMPLETED and drop checkpoints
+        # (their outputs now live on the analysis)
         with get_session() as session:
             session.execute(
                 text("""
                     UPDATE processing_jobs
-                    SET status = :status, analysis_id = :analysis_id, updated_at = :updated_at
+                    SET status = :status, analysis_id = :analysis_id,
+                        checkpoints = NULL, updated_at = :updated_at
                     WHERE id = :job_id
                 """),
                 {
@@ -231,35 +1069,40 @@ def process_interview(self, job_id: str) -> dict:
             session.commit()
             logger.info(f"Job {job_id} completed successfully")
 
-        return {"status": "completed", "job_id": job_id, "analysis_id": analysis_id}
+    return {"status": "completed", "job_id": job_id, "analysis_id": analysis_id}
 
-    except SoftTimeLimitExceeded:
-        # Task timed out - permanent failure, do not retry
-        logger.error(f"Job {job_id} timed out (soft time limit exceeded)")
-        _update_job_failed(job_id, "Processing timed out after 55 minutes")
-        return {"status": "failed", "job_id": job_id, "error": "timeout"}
 
+@celery_app.task(
+    name=TASK_BACKFILL_SUMMARIES,
+    bind=True,
+    max_retries=3,
+)
+def backfill_summaries(self) -> dict:
+    """Re-summarize the next slice of stored transcripts (see ``app.backfill``).
+
+    Each task handles up to ``backfill_rows_per_task`` rows, well inside
+    the task time limit, then sends the next one; progress is kept in
+    Redis, so a retried or restarted slice resumes after its last write.
+
+    Returns:
+        Dict with the backfill status and the number of rows re-summarized.
+    """
+    from app.backfill import run_backfill
+
+    settings = get_settings()
+    try:
+        stats = run_backfill(
+            batch_size=settings.backfill_batch_size,
+            concurrency=settings.backfill_concurrency,
+            limit=settings.backfill_rows_per_task,
+        )
     except TRANSIENT_ERRORS as exc:
-        # Transient error - keep PROCESSING status and retry
         logger.warning(
-            f"Job {job_id} encountered transient error: {exc}. "
+            f"Summary backfill hit a transient error: {exc}. "
             f"Retry {self.request.retries + 1}/{self.max_retries}"
         )
-        # Do NOT update status to FAILED - keep as PROCESSING for retry
-        raise self.retry(exc=exc)
+        raise self.retry(exc=exc, countdown=_retry_countdown(self.request.retries))
 
-    except Exception as exc:
-        # Permanent error - mark as FAILED, do not retry
-        logger.error(f"Job {job_id} failed with permanent error: {exc}")
-        _update_job_failed(job_id, str(exc))
-        # Do not retry permanent errors
-        return {"status": "failed", "job_id": job_id, "error": str(exc)}
-
-    finally:
-        # Cleanup temp file
-        if local_audio_path and os.path.exists(local_audio_path):
-            try:
-                os.remove(local_audio_path)
-                logger.info(f"Cleaned up temp file: {local_audio_path}")
-            except OSError as e:
-                logger.warning(f"Failed to cleanup temp file: {e}")
+    if not stats.done:
+        backfill_summaries.delay()
+    return {"status": "done" if stats.done else "continued", "rows": stats.rows}
@@ -0,0 +1,9 @@
+"""Performance benchmarks for the worker pipeline.
+
+Run from the ``workers`` directory, e.g.::
+
+    python -m benchmarks.streaming_ingest path/to/interview.mp3
+
+Benchmarks need the ``ml`` extra installed; the audio ones also need
+ffmpeg on PATH.
+"""
@@ -0,0 +1,61 @@
+"""Throughput in audio-hours per wall-hour: per-job vs. batched inference.
+
+Transcribes the given files as concurrent jobs, first one model call per
+job in series (the default path), then through the shared batching
+engine at each requested batch size.
+
+Usage:
+    python -m benchmarks.batched_throughput a.mp3 b.mp3 c.mp3 --batch-sizes 8 16
+"""
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from faster_whisper import decode_audio
+
+from app.services.audio import SAMPLE_RATE
+from app.services.batched_transcription import BatchedTranscriptionEngine
+from app.services.transcription import TranscriptionService
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("audio", nargs="+", help="Local audio files, one per job")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[8, 16])
+    parser.add_argument("--max-wait-ms", type=int, default=50)
+    parser.add_argument("--model-size", default="distil-large-v3")
+    args = parser.parse_args()
+
+    audio_seconds = sum(
+        len(decode_audio(path, sampling_rate=SAMPLE_RATE)) / SAMPLE_RATE
+        for path in args.audio
+    )
+    service = TranscriptionService(model_size=args.model_size)
+    service._load_model()  # Exclude model load from every timing
+
+    print(f"jobs: {len(args.audio)}, audio: {audio_seconds / 3600:.2f}h")
+    print(f"{'mode':<14}{'wall (s)':>10}{'audio-h / wall-h':>18}")
+
+    start = time.perf_counter()
+    for path in args.audio:
+        service.transcribe_with_timestamps(path)
+    elapsed = time.perf_counter() - start
+    print(f"{'per-job':<14}{elapsed:>10.1f}{audio_seconds / elapsed:>18.1f}")
+
+    for batch_size in args.batch_sizes:
+        engine = BatchedTranscriptionEngine(
+            service, batch_size=batch_size, max_wait_ms=args.max_wait_ms
+        )
+        engine._load_pipeline()
+        start = time.perf_counter()
+        # Concurrent jobs, as in a thread-pool worker
+        with ThreadPoolExecutor(max_workers=len(args.audio)) as jobs:
+            list(jobs.map(engine.transcribe, args.audio))
+        elapsed = time.perf_counter() - start
+        label = f"batched x{batch_size}"
+        print(f"{label:<14}{elapsed:>10.1f}{audio_seconds / elapsed:>18.1f}")
+
+
+if __name__ == "__main__":
+    main()
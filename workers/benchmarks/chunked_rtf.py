@@ -0,0 +1,58 @@
+"""Real-time factor: serial vs. chunked parallel transcription.
+
+RTF = processing seconds / audio seconds (lower is faster). Runs the
+serial path once, then the chunked path at each requested pool width.
+
+Usage:
+    python -m benchmarks.chunked_rtf long_interview.mp3 --workers 2 4 8
+"""
+
+import argparse
+import time
+
+from faster_whisper import decode_audio
+
+from app.services.audio import SAMPLE_RATE
+from app.services.transcription import TranscriptionService
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("audio", help="Local audio file")
+    parser.add_argument("--workers", type=int, nargs="+", default=[2, 4])
+    parser.add_argument("--min-chunk-seconds", type=float, default=60.0)
+    parser.add_argument("--max-chunk-seconds", type=float, default=120.0)
+    parser.add_argument("--model-size", default="distil-large-v3")
+    args = parser.parse_args()
+
+    duration = len(decode_audio(args.audio, sampling_rate=SAMPLE_RATE)) / SAMPLE_RATE
+    service = TranscriptionService(model_size=args.model_size)
+    service._load_model()  # Exclude model load from the serial timing
+
+    print(f"audio: {duration:.0f}s")
+    print(f"{'mode':<14}{'seconds':>10}{'RTF':>8}{'segments':>10}")
+
+    start = time.perf_counter()
+    segments = service.transcribe_with_timestamps(args.audio)
+    elapsed = time.perf_counter() - start
+    print(f"{'serial':<14}{elapsed:>10.1f}{elapsed / duration:>8.3f}{len(segments):>10}")
+
+    for workers in args.workers:
+        # Warm every pool process so per-process model loads are not timed
+        pool = service._get_pool(workers)
+        for future in [pool.submit(time.sleep, 1) for _ in range(workers)]:
+            future.result()
+        start = time.perf_counter()
+        segments = service.transcribe_chunked(
+            args.audio,
+            min_chunk_seconds=args.min_chunk_seconds,
+            max_chunk_seconds=args.max_chunk_seconds,
+            workers=workers,
+        ).segments
+        elapsed = time.perf_counter() - start
+        label = f"chunked x{workers}"
+        print(f"{label:<14}{elapsed:>10.1f}{elapsed / duration:>8.3f}{len(segments):>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Prefill tokens and summarization latency at several compression ratios.
+
+Summarizes each transcript once per ratio, with extractive compression
+keeping that share of its words (1.0 = uncompressed), and reports the
+transcript tokens left for prefill and the end-to-end summarize() time.
+
+Usage:
+    python -m benchmarks.compression_ratio transcripts/*.txt --ratios 1.0 0.7 0.5 0.3
+"""
+
+import argparse
+import time
+
+from app.core.config import get_settings
+from app.services.compression import compress_transcript
+from app.services.summarization import SummarizationService
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("transcripts", nargs="+", help="Transcript text files, one per job")
+    parser.add_argument("--ratios", type=float, nargs="+", default=[1.0, 0.7, 0.5, 0.3])
+    args = parser.parse_args()
+
+    transcripts = []
+    for path in args.transcripts:
+        with open(path) as f:
+            transcripts.append(f.read())
+
+    service = SummarizationService.from_settings(get_settings())
+    service.backend.load()  # Exclude model load from every timing
+
+    jobs = len(transcripts)
+    print(f"jobs: {jobs}, backend: {type(service.backend).__name__}")
+    print(f"{'ratio':<8}{'prefill tokens/job':>20}{'s/job':>8}")
+
+    for ratio in args.ratios:
+        service.compression_ratio = ratio
+        tokens = sum(
+            service._count_tokens(compress_transcript(transcript, ratio))
+            for transcript in transcripts
+        )
+        start = time.perf_counter()
+        for transcript in transcripts:
+            service.summarize(transcript)
+        elapsed = time.perf_counter() - start
+        print(f"{ratio:<8.2f}{tokens / jobs:>20.0f}{elapsed / jobs:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
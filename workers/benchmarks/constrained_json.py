@@ -0,0 +1,68 @@
+"""JSON-valid rate and tokens per job: free-form vs. constrained decoding.
+
+Summarizes each transcript with the final-analysis prompt, once with
+free-form generation and once with the output schema enforced, and
+reports how many replies parse and validate on the first try and how
+many tokens each job generated.
+
+Usage:
+    python -m benchmarks.constrained_json transcripts/*.txt --runs 3
+"""
+
+import argparse
+import json
+import time
+
+from app.services.summarization import (
+    ANALYSIS_JSON_SCHEMA,
+    SYSTEM_PROMPT,
+    USER_PROMPT_TEMPLATE,
+    SummarizationService,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("transcripts", nargs="+", help="Transcript text files, one per job")
+    parser.add_argument("--runs", type=int, default=3, help="Generations per transcript")
+    parser.add_argument("--model-name", default="meta-llama/Llama-3.3-8B-Instruct")
+    args = parser.parse_args()
+
+    transcripts = []
+    for path in args.transcripts:
+        with open(path) as f:
+            transcripts.append(f.read())
+
+    service = SummarizationService(model_name=args.model_name)
+    service.backend.load()  # Exclude model load from every timing
+
+    jobs = len(transcripts) * args.runs
+    print(f"jobs: {jobs}")
+    print(f"{'mode':<14}{'valid %':>10}{'tokens/job':>12}{'s/job':>8}")
+
+    for mode, constrained in (("free-form", False), ("constrained", True)):
+        service.constrained_decoding = constrained
+        valid = tokens = 0
+        start = time.perf_counter()
+        for transcript in transcripts:
+            messages = [
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": USER_PROMPT_TEMPLATE.format(transcript=transcript)},
+            ]
+            for _ in range(args.runs):
+                reply = service._generate(messages, schema=ANALYSIS_JSON_SCHEMA)
+                tokens += service._count_tokens(reply)
+                try:
+                    service._validate_output(service._extract_json(reply))
+                    valid += 1
+                except (json.JSONDecodeError, ValueError):
+                    pass
+        elapsed = time.perf_counter() - start
+        print(
+            f"{mode:<14}{100 * valid / jobs:>10.1f}{tokens / jobs:>12.0f}"
+            f"{elapsed / jobs:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Throughput in audio-hours per wall-hour: one model vs. pinned core partitions.
+
+Transcribes the given files as concurrent jobs, first on one model using
+every core, one job at a time (the default single-model worker), then
+through the partitioned engine at each requested partition count, with
+as many jobs in flight as partitions.
+
+Usage:
+    python -m benchmarks.partitioned_throughput a.mp3 b.mp3 c.mp3 d.mp3 --partitions 2 4 8
+"""
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from faster_whisper import decode_audio
+
+from app.services.audio import SAMPLE_RATE
+from app.services.partitioned_transcription import PartitionedTranscriptionEngine
+from app.services.transcription import TranscriptionService
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("audio", nargs="+", help="Local audio files, one per job")
+    parser.add_argument("--partitions", type=int, nargs="+", default=[2, 4, 8])
+    parser.add_argument("--model-size", default="distil-large-v3")
+    parser.add_argument("--compute-type", default="int8")
+    args = parser.parse_args()
+
+    audio_seconds = sum(
+        len(decode_audio(path, sampling_rate=SAMPLE_RATE)) / SAMPLE_RATE
+        for path in args.audio
+    )
+    service = TranscriptionService(
+        model_size=args.model_size, device="cpu", compute_type=args.compute_type
+    )
+    service._load_model()  # Exclude model load from every timing
+
+    print(f"jobs: {len(args.audio)}, audio: {audio_seconds / 3600:.2f}h")
+    print(f"{'mode':<16}{'wall (s)':>10}{'audio-h / wall-h':>18}")
+
+    start = time.perf_counter()
+    for path in args.audio:
+        service.transcribe_result(path)
+    elapsed = time.perf_counter() - start
+    print(f"{'single model':<16}{elapsed:>10.1f}{audio_seconds / elapsed:>18.1f}")
+
+    for partitions in args.partitions:
+        # Loads every partition's model before returning
+        engine = PartitionedTranscriptionEngine(service, partitions)
+        start = time.perf_counter()
+        # One job per partition in flight, as in a thread-pool worker
+        with ThreadPoolExecutor(max_workers=len(engine.cores)) as jobs:
+            list(jobs.map(engine.transcribe, args.audio))
+        elapsed = time.perf_counter() - start
+        engine.shutdown()
+        label = f"partitioned x{len(engine.cores)}"
+        print(f"{label:<16}{elapsed:>10.1f}{audio_seconds / elapsed:>18.1f}")
+
+
+if __name__ == "__main__":
+    main()
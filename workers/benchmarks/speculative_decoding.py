@@ -0,0 +1,110 @@
+"""Latency, tokens/s and draft acceptance: single-model vs. assisted decoding.
+
+Summarizes each transcript in a single pass, once with the main model
+alone and once with a draft model proposing tokens for it to verify.
+Forward passes of both models are counted with hooks:
+
+- acceptance = accepted draft tokens / proposed draft tokens, where each
+  verification pass yields its accepted tokens plus one of its own;
+- output match = replies identical to the single-model path (sampling
+  runs at temperature 0.1, so a few differ even without a draft);
+- valid = replies that parse and validate as an analysis.
+
+The prompt cache is off in both modes so its prefill is not counted.
+
+Usage:
+    python -m benchmarks.speculative_decoding transcripts/*.txt \
+        --draft-model meta-llama/Llama-3.2-1B-Instruct
+"""
+
+import argparse
+import json
+import time
+
+from app.services.summarization import (
+    ANALYSIS_JSON_SCHEMA,
+    SYSTEM_PROMPT,
+    USER_PROMPT_TEMPLATE,
+    SummarizationService,
+)
+
+
+class _ForwardCounter:
+    """Counts forward passes of a model."""
+
+    def __init__(self, model):
+        self.count = 0
+        model.register_forward_hook(self._hook)
+
+    def _hook(self, module, inputs, output):
+        self.count += 1
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("transcripts", nargs="+", help="Transcript text files, one per job")
+    parser.add_argument("--draft-model", default="meta-llama/Llama-3.2-1B-Instruct")
+    parser.add_argument("--model-name", default="meta-llama/Llama-3.3-8B-Instruct")
+    args = parser.parse_args()
+
+    conversations = []
+    for path in args.transcripts:
+        with open(path) as f:
+            conversations.append(
+                [
+                    {"role": "system", "content": SYSTEM_PROMPT},
+                    {"role": "user", "content": USER_PROMPT_TEMPLATE.format(transcript=f.read())},
+                ]
+            )
+
+    service = SummarizationService(
+        model_name=args.model_name,
+        draft_model_name=args.draft_model,
+        reuse_prompt_cache=False,
+    )
+    backend = service.backend
+    backend.load()  # Exclude model loads from every timing
+    draft_model = backend._draft_model
+    main_forwards = _ForwardCounter(backend._pipeline.model)
+    draft_forwards = _ForwardCounter(draft_model)
+
+    jobs = len(conversations)
+    print(f"jobs: {jobs}, draft: {args.draft_model}")
+    print(
+        f"{'mode':<14}{'s/job':>8}{'tokens/s':>10}{'acceptance':>12}"
+        f"{'match %':>9}{'valid %':>9}"
+    )
+
+    baseline = None
+    for mode, draft in (("single-model", None), ("assisted", draft_model)):
+        backend._draft_model = draft
+        main_forwards.count = draft_forwards.count = 0
+        replies = []
+        start = time.perf_counter()
+        for messages in conversations:
+            replies.append(service._generate(messages, schema=ANALYSIS_JSON_SCHEMA))
+        elapsed = time.perf_counter() - start
+
+        tokens = sum(service._count_tokens(reply) for reply in replies)
+        valid = 0
+        for reply in replies:
+            try:
+                service._validate_output(service._extract_json(reply))
+                valid += 1
+            except (json.JSONDecodeError, ValueError):
+                pass
+        if draft is None:
+            baseline = replies
+            acceptance = "-"
+        else:
+            accepted = tokens - main_forwards.count
+            acceptance = f"{accepted / max(draft_forwards.count, 1):.2f}"
+        match = sum(reply == base for reply, base in zip(replies, baseline))
+        print(
+            f"{mode:<14}{elapsed / jobs:>8.1f}{tokens / elapsed:>10.1f}{acceptance:>12}"
+            f"{100 * match / jobs:>9.1f}{100 * valid / jobs:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Time-to-first-segment: download-then-transcribe vs. streaming ingest.
+
+Serves a local audio file through a bandwidth-throttled stand-in for the
+S3 client, then measures how long each ingest path takes to produce its
+first transcript segment and to finish.
+
+Usage:
+    python -m benchmarks.streaming_ingest audio.mp3 --bandwidth-mbps 20
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+from app.services.audio import stream_pcm
+from app.services.transcription import TranscriptionService
+
+
+class ThrottledBody:
+    """File-backed stream that emulates a network read at a fixed rate."""
+
+    def __init__(self, path: str, bytes_per_second: float):
+        self._file = open(path, "rb")
+        self._rate = bytes_per_second
+        self._start = time.perf_counter()
+        self._sent = 0
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._file.read(size)
+        self._sent += len(data)
+        # Sleep until the emulated link would have delivered these bytes
+        due = self._start + self._sent / self._rate
+        delay = due - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        return data
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class LocalS3StandIn:
+    """Minimal stand-in for the boto3 S3 client backed by local files."""
+
+    def __init__(self, bytes_per_second: float):
+        self._rate = bytes_per_second
+
+    def get_object(self, Bucket: str, Key: str) -> dict:
+        return {"Body": ThrottledBody(Key, self._rate)}
+
+    def download_file(self, bucket: str, key: str, local_path: str) -> None:
+        body = ThrottledBody(key, self._rate)
+        try:
+            with open(local_path, "wb") as out:
+                shutil.copyfileobj(body, out, 64 * 1024)
+        finally:
+            body.close()
+
+
+def bench_download(client, service, audio_path: str) -> tuple[float, float]:
+    start = time.perf_counter()
+    first = None
+    local_path = os.path.join(tempfile.gettempdir(), "vibecheck_bench.audio")
+    try:
+        client.download_file("bench", audio_path, local_path)
+        segments, _ = service._load_model().transcribe(
+            local_path, beam_size=5, language=None, vad_filter=True
+        )
+        for _ in segments:
+            if first is None:
+                first = time.perf_counter() - start
+    finally:
+        if os.path.exists(local_path):
+            os.remove(local_path)
+    return first or float("nan"), time.perf_counter() - start
+
+
+def bench_stream(client, service, audio_path: str, window: float) -> tuple[float, float]:
+    start = time.perf_counter()
+    first = None
+    body = client.get_object(Bucket="bench", Key=audio_path)["Body"]
+    try:
+        for _ in service.iter_stream_segments(stream_pcm(body), window):
+            if first is None:
+                first = time.perf_counter() - start
+    finally:
+        body.close()
+    return first or float("nan"), time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("audio", help="Local audio file served as the S3 object")
+    parser.add_argument("--bandwidth-mbps", type=float, default=20.0)
+    parser.add_argument("--window-seconds", type=float, default=30.0)
+    parser.add_argument("--model-size", default="distil-large-v3")
+    args = parser.parse_args()
+
+    client = LocalS3StandIn(args.bandwidth_mbps * 1_000_000 / 8)
+    service = TranscriptionService(model_size=args.model_size)
+    service._load_model()  # Exclude model load from both timings
+
+    print(f"{'mode':<12}{'first segment (s)':>20}{'total (s)':>12}")
+    first, total = bench_download(client, service, args.audio)
+    print(f"{'download':<12}{first:>20.2f}{total:>12.2f}")
+    first, total = bench_stream(client, service, args.audio, args.window_seconds)
+    print(f"{'stream':<12}{first:>20.2f}{total:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
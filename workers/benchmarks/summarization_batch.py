@@ -0,0 +1,57 @@
+"""Generated tokens per second: one summary per call vs. batched summaries.
+
+Summarizes the given transcripts first one summarize() call per job (the
+default path), then with summarize_batch() at each requested batch size.
+Output tokens are counted on the JSON summaries with the model's
+tokenizer.
+
+Usage:
+    python -m benchmarks.summarization_batch a.txt b.txt c.txt d.txt --batch-sizes 2 4 8
+"""
+
+import argparse
+import json
+import time
+
+from app.core.config import get_settings
+from app.services.summarization import SummarizationService
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("transcripts", nargs="+", help="Transcript text files, one per job")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[2, 4, 8])
+    args = parser.parse_args()
+
+    transcripts = []
+    for path in args.transcripts:
+        with open(path) as f:
+            transcripts.append(f.read())
+
+    service = SummarizationService.from_settings(get_settings())
+    service.backend.load()  # Exclude model load from every timing
+
+    def output_tokens(summaries: list[dict]) -> int:
+        return sum(service._count_tokens(json.dumps(summary)) for summary in summaries)
+
+    print(f"jobs: {len(transcripts)}, backend: {type(service.backend).__name__}")
+    print(f"{'mode':<14}{'wall (s)':>10}{'tokens':>10}{'tokens/s':>10}")
+
+    start = time.perf_counter()
+    summaries = [service.summarize(transcript) for transcript in transcripts]
+    elapsed = time.perf_counter() - start
+    tokens = output_tokens(summaries)
+    print(f"{'per-job':<14}{elapsed:>10.1f}{tokens:>10}{tokens / elapsed:>10.1f}")
+
+    for batch_size in args.batch_sizes:
+        service.batch_size = batch_size
+        start = time.perf_counter()
+        summaries = service.summarize_batch(transcripts)
+        elapsed = time.perf_counter() - start
+        tokens = output_tokens(summaries)
+        label = f"batched x{batch_size}"
+        print(f"{label:<14}{elapsed:>10.1f}{tokens:>10}{tokens / elapsed:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""Unit tests for streaming audio helpers."""
+
+import io
+import os
+import threading
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from app.services.audio import (  # noqa: E402
+    SAMPLE_RATE,
+    encode_wav,
+    find_quiet_cut,
+    iter_windows,
+    split_by_duration,
+    stream_pcm,
+)
+
+
+@pytest.fixture
+def fake_ffmpeg(tmp_path, monkeypatch):
+    """An ``ffmpeg`` on PATH that passes stdin through unchanged."""
+    script = tmp_path / "ffmpeg"
+    script.write_text("#!/bin/sh\nexec cat\n")
+    script.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+
+
+class _FailingBody(io.BytesIO):
+    """A stream that fails partway, like a dropped S3 connection."""
+
+    def read(self, size=-1):
+        if self.tell() >= 128 * 1024:
+            raise TimeoutError("read timed out")
+        return super().read(size)
+
+
+class TestStreamPcm:
+    """Tests for stream_pcm."""
+
+    def test_yields_stream_samples(self, fake_ffmpeg):
+        samples = np.arange(100_000, dtype=np.float32)
+
+        blocks = list(stream_pcm(io.BytesIO(samples.tobytes())))
+
+        assert np.array_equal(np.concatenate(blocks), samples)
+
+    def test_closing_early_does_not_hang(self, fake_ffmpeg):
+        """A consumer that stops mid-stream leaves no blocked ffmpeg behind."""
+        stream = stream_pcm(io.BytesIO(bytes(20 * 1024 * 1024)))
+        next(stream)
+
+        closer = threading.Thread(target=stream.close, daemon=True)
+        closer.start()
+        closer.join(timeout=10)
+
+        assert not closer.is_alive()
+
+    def test_source_read_error_is_raised(self, fake_ffmpeg):
+        """A failed download raises instead of ending as a short transcript."""
+        with pytest.raises(ConnectionError, match="read timed out"):
+            list(stream_pcm(_FailingBody(bytes(1024 * 1024))))
+
+
+class TestFindQuietCut:
+    """Tests for find_quiet_cut."""
+
+    def test_cuts_at_silence(self):
+        """Cut lands on the silent frame within the search region."""
+        audio = np.ones(SAMPLE_RATE * 2, dtype=np.float32)
+        audio[20800:22400] = 0.0  # Silent 0.1s frame starting at 1.3s
+
+        cut = find_quiet_cut(audio, target=len(audio), search=SAMPLE_RATE)
+
+        assert cut == 21600  # Middle of the silent frame
+
+    def test_short_region_returns_target(self):
+        """Search region shorter than one frame falls back to target."""
+        audio = np.ones(100, dtype=np.float32)
+
+        assert find_quiet_cut(audio, target=50, search=10) == 50
+
+
+class TestIterWindows:
+    """Tests for iter_windows."""
+
+    def test_windows_cover_stream_in_order(self):
+        """Windows reassemble to the input and carry correct offsets."""
+        rng = np.random.default_rng(0)
+        audio = rng.standard_normal(SAMPLE_RATE * 7).astype(np.float32)
+        blocks = np.array_split(audio, 13)
+
+        windows = list(iter_windows(blocks, window_seconds=2.0, search_seconds=0.5))
+
+        assert np.array_equal(np.concatenate([w for _, w in windows]), audio)
+        position = 0
+        for offset, window in windows:
+            assert offset == position / SAMPLE_RATE
+            assert len(window) <= 2 * SAMPLE_RATE
+            position += len(window)
+
+
+class TestSplitByDuration:
+    """Tests for split_by_duration and encode_wav."""
+
+    def test_parts_cover_audio_with_sample_offsets(self):
+        """Parts are contiguous and offsets are sample indices."""
+        audio = np.ones(SAMPLE_RATE * 25, dtype=np.float32)
+
+        parts = split_by_duration(audio, segment_seconds=10.0, search_seconds=1.0)
+
+        offsets = [offset / SAMPLE_RATE for offset, _ in parts]
+        assert offsets == pytest.approx([0.0, 10.0, 20.0], abs=0.2)
+        assert sum(len(samples) for _, samples in parts) == len(audio)
+
+    def test_encode_wav_roundtrip(self):
+        """Encoded WAV is 16-bit mono at the requested rate."""
+        import io
+        import wave
+
+        samples = np.linspace(-1.0, 1.0, SAMPLE_RATE, dtype=np.float32)
+
+        with wave.open(io.BytesIO(encode_wav(samples))) as wav:
+            assert wav.getnchannels() == 1
+            assert wav.getsampwidth() == 2
+            assert wav.getframerate() == SAMPLE_RATE
+            assert wav.getnframes() == SAMPLE_RATE
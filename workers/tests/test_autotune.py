@@ -0,0 +1,114 @@
+"""Tests for CPU autotuning of the Whisper configuration."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app import autotune
+from app.autotune import TuneResult
+
+
+@pytest.fixture
+def settings(tmp_path):
+    settings = MagicMock()
+    settings.transcription_autotune_cache_path = str(tmp_path / "autotune.json")
+    settings.transcription_autotune_clip = "clip.wav"
+    settings.transcription_autotune_wer_tolerance = 0.02
+    settings.transcription_beam_size = 5
+    return settings
+
+
+def _result(compute_type, throughput, wer, cpu_threads=8, num_workers=1):
+    return TuneResult(compute_type, cpu_threads, num_workers, throughput, wer)
+
+
+class TestWordErrorRate:
+    """Tests for word_error_rate."""
+
+    def test_identical(self):
+        assert autotune.word_error_rate("Hello there world", "hello there world") == 0.0
+
+    def test_substitution_insertion_deletion(self):
+        assert autotune.word_error_rate("a b c d", "a x c") == 0.5
+        assert autotune.word_error_rate("a b", "a b c d") == 1.0
+
+    def test_empty_reference(self):
+        assert autotune.word_error_rate("", "") == 0.0
+        assert autotune.word_error_rate("", "noise") == 1.0
+
+
+class TestSelection:
+    """Tests for thread_splits and choose."""
+
+    def test_splits_use_every_core(self):
+        assert autotune.thread_splits(8) == [(8, 1), (4, 2), (2, 4)]
+        assert autotune.thread_splits(2) == [(2, 1), (1, 2)]
+
+    def test_fastest_within_tolerance(self):
+        """A faster but inaccurate configuration is passed over."""
+        results = [
+            _result("int8", 40.0, 0.05),
+            _result("int8_float32", 30.0, 0.01),
+            _result("float32", 20.0, 0.0),
+        ]
+        assert autotune.choose(results, 0.02).compute_type == "int8_float32"
+
+    def test_multi_worker_splits_only_for_shared_models(self):
+        """A model used by one transcription at a time keeps every core."""
+        results = [
+            _result("int8", 20.0, 0.0, cpu_threads=32, num_workers=1),
+            _result("int8", 50.0, 0.0, cpu_threads=8, num_workers=4),
+        ]
+        assert autotune.choose(results, 0.02).num_workers == 1
+        assert autotune.choose(results, 0.02, shared=True).num_workers == 4
+
+    def test_tune_compares_against_float32(self):
+        """Every compute type and split is measured against a float32 reference."""
+        calls = []
+
+        def measure(model_size, audio, compute_type, cpu_threads, num_workers, beam_size):
+            calls.append((compute_type, cpu_threads, num_workers))
+            text = "the quick brown fox" if compute_type != "int8" else "the quick brown box"
+            return text, {"int8": 30.0, "int8_float32": 25.0, "float32": 10.0}[compute_type]
+
+        with patch.object(autotune, "_measure", side_effect=measure), patch(
+            "faster_whisper.decode_audio", return_value=[0.0] * 16000, create=True
+        ), patch("os.sched_getaffinity", return_value=set(range(4))):
+            results = autotune.tune("distil-large-v3", "clip.wav")
+
+        assert calls[0] == ("float32", 4, 1)
+        assert len(results) == 3 * 3
+        result = autotune.choose(results, wer_tolerance=0.1)
+        assert (result.compute_type, result.wer) == ("int8_float32", 0.0)
+
+
+class TestResultCache:
+    """Tests for the on-disk measurement cache."""
+
+    def test_round_trip_keyed_by_cpu(self, settings):
+        """Measurements are kept per CPU model; another CPU does not reuse them."""
+        path = settings.transcription_autotune_cache_path
+        with patch.object(autotune, "cpu_model", return_value="CPU A"):
+            autotune.save_results(path, "distil-large-v3", [_result("int8", 30.0, 0.0, 16)])
+            assert autotune.load_results(path, "distil-large-v3")[0].cpu_threads == 16
+            assert autotune.load_results(path, "large-v3") is None
+        with patch.object(autotune, "cpu_model", return_value="CPU B"):
+            assert autotune.load_results(path, "distil-large-v3") is None
+
+    def test_tuned_options_uses_cache_without_tuning(self, settings):
+        autotune.save_results(
+            settings.transcription_autotune_cache_path,
+            "distil-large-v3",
+            [_result("int8", 20.0, 0.0, 8, 1), _result("int8_float32", 30.0, 0.0, 4, 2)],
+        )
+        with patch.object(autotune, "tune") as mock_tune:
+            single = autotune.tuned_options(settings, "distil-large-v3")
+            shared = autotune.tuned_options(settings, "distil-large-v3", shared=True)
+
+        mock_tune.assert_not_called()
+        assert single == {"compute_type": "int8", "cpu_threads": 8, "num_workers": 1}
+        assert shared == {"compute_type": "int8_float32", "cpu_threads": 4, "num_workers": 2}
+
+    def test_tuned_options_without_clip_keeps_defaults(self, settings):
+        settings.transcription_autotune_clip = ""
+        assert autotune.tuned_options(settings, "distil-large-v3") == {}
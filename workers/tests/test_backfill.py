@@ -0,0 +1,124 @@
+"""Tests for the re-summarization backfill."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app import backfill
+from app.services.summarization import FALLBACK_SUMMARY
+
+SUMMARY = {
+    "executive_summary": "Good.",
+    "key_topics": ["Python"],
+    "strengths": ["Clear"],
+    "areas_for_improvement": ["Depth"],
+    "sentiment_score": 0.5,
+}
+
+
+def _rows(count):
+    """(id, transcript) rows with ids in ascending order."""
+    return [
+        (f"00000000-0000-0000-0000-{index:012d}", f"Transcript {index}.")
+        for index in range(1, count + 1)
+    ]
+
+
+@pytest.fixture
+def env():
+    """Backfill with a mock service, cache, Redis and database."""
+    redis = MagicMock()
+    redis.get.return_value = None
+    service = MagicMock()
+    service.fingerprint = "f" * 64
+    service.summarize_batch.side_effect = lambda transcripts: [dict(SUMMARY) for _ in transcripts]
+
+    with patch("app.tasks.get_summarization_service", return_value=service), patch(
+        "app.tasks.get_summary_cache", return_value=None
+    ), patch("redis.Redis.from_url", return_value=redis), patch(
+        "app.backfill.get_settings"
+    ) as mock_settings, patch("app.backfill._stream_rows") as mock_stream, patch(
+        "app.backfill._write_summaries"
+    ) as mock_write, patch("app.backfill._count_rows", return_value=100):
+        mock_settings.return_value.model_server_url = "unix:///run/vibecheck/models.sock"
+        yield {"redis": redis, "service": service, "stream": mock_stream, "write": mock_write}
+
+
+class TestBackfill:
+    """Tests for run_backfill."""
+
+    def test_writes_batches_and_advances_progress_in_order(self, env):
+        """Every batch is written, and the marker follows the last row written."""
+        rows = _rows(5)
+        env["stream"].return_value = iter([rows[:2], rows[2:4], rows[4:]])
+
+        stats = backfill.run_backfill(batch_size=2, concurrency=2)
+
+        assert (stats.rows, stats.failed, stats.done) == (5, 0, True)
+        written = [call.args[0] for call in env["write"].call_args_list]
+        assert written == [rows[:2], rows[2:4], rows[4:]]
+        markers = [call.args[1] for call in env["redis"].set.call_args_list]
+        assert markers == [rows[1][0], rows[3][0], rows[4][0]]
+        assert env["redis"].set.call_args.args[0] == f"vibecheck:backfill:{'f' * 64}"
+
+    def test_resumes_after_saved_progress(self, env):
+        """A run continues after the id recorded by the previous one."""
+        env["redis"].get.return_value = b"00000000-0000-0000-0000-000000000002"
+        env["stream"].return_value = iter([])
+
+        backfill.run_backfill(batch_size=2, concurrency=1)
+
+        assert env["stream"].call_args.args == ("00000000-0000-0000-0000-000000000002", 2)
+
+    def test_limit_stops_between_batches(self, env):
+        """A limited run stops on a batch boundary and reports it is not done."""
+        rows = _rows(6)
+        env["stream"].return_value = iter([rows[:2], rows[2:4], rows[4:]])
+
+        stats = backfill.run_backfill(batch_size=2, concurrency=1, limit=3)
+
+        assert (stats.rows, stats.done) == (4, False)
+
+    def test_unparseable_summaries_are_not_written(self, env):
+        """Fallback summaries leave the stored analysis unchanged."""
+        rows = _rows(2)
+        env["stream"].return_value = iter([rows])
+        env["service"].summarize_batch.side_effect = None
+        env["service"].summarize_batch.return_value = [dict(SUMMARY), dict(FALLBACK_SUMMARY)]
+
+        stats = backfill.run_backfill(batch_size=2, concurrency=1)
+
+        assert (stats.rows, stats.failed) == (1, 1)
+        assert env["write"].call_args.args[1] == [SUMMARY, None]
+
+    def test_dry_run_writes_nothing(self, env):
+        """A dry run summarizes its sample but writes no rows or progress."""
+        env["stream"].return_value = iter([_rows(2)])
+
+        stats = backfill.run_backfill(batch_size=2, concurrency=1, dry_run=True)
+
+        assert stats.rows == 2
+        env["write"].assert_not_called()
+        env["redis"].set.assert_not_called()
+
+
+class TestWriteSummaries:
+    """Tests for _write_summaries."""
+
+    @patch("app.backfill.get_session")
+    def test_keeps_transcription_metrics(self, mock_get_session):
+        """Summary metrics are replaced; the stored transcription metrics survive."""
+        session = MagicMock()
+        mock_get_session.return_value.__enter__ = MagicMock(return_value=session)
+        mock_get_session.return_value.__exit__ = MagicMock(return_value=False)
+        rows = _rows(2)
+
+        backfill._write_summaries(rows, [dict(SUMMARY), None])
+
+        sql, params = session.execute.call_args.args
+        assert "metrics_json -> 'transcription'" in str(sql)
+        assert "|| CAST(:metrics_json AS jsonb)" in str(sql)
+        assert [param["id"] for param in params] == [rows[0][0]]
+        assert "transcription" not in json.loads(params[0]["metrics_json"])
+        session.commit.assert_called_once()
@@ -0,0 +1,87 @@
+"""Unit tests for the batched transcription engine."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from app.services.batched_transcription import (  # noqa: E402
+    WINDOW_SAMPLES,
+    BatchedTranscriptionEngine,
+    speech_windows,
+)
+
+SR = 16000
+
+
+class TestSpeechWindows:
+    """Tests for speech_windows."""
+
+    def test_groups_spans_up_to_window_length(self):
+        """Nearby spans share a window; a long span is split at 30 s."""
+        speech = [
+            {"start": 0, "end": 10 * SR},
+            {"start": 12 * SR, "end": 25 * SR},
+            {"start": 40 * SR, "end": 105 * SR},
+        ]
+
+        windows = speech_windows(speech)
+
+        assert [(s / SR, e / SR) for s, e in windows] == [
+            (0, 25), (40, 70), (70, 100), (100, 105),
+        ]
+        assert all(e - s <= WINDOW_SAMPLES for s, e in windows)
+
+
+class TestBatchedTranscriptionEngine:
+    """Tests for BatchedTranscriptionEngine."""
+
+    def test_routes_batched_segments_back_to_owners(self):
+        """Windows from two requests share a batch and return to their owner."""
+        service = MagicMock(model_size="distil-large-v3", beam_size=5, without_timestamps=False)
+        service.model_for.return_value = "distil-large-v3"
+        engine = BatchedTranscriptionEngine(service, batch_size=8, max_wait_ms=200)
+
+        calls = []
+
+        def fake_transcribe(buffer, clip_timestamps, **kwargs):
+            calls.append(len(clip_timestamps))
+            # The pipeline's default would blur segments to their 30 s slot
+            assert kwargs["without_timestamps"] is False
+            # One segment per slot, 1-2 s into the slot, labelled by amplitude
+            segments = [
+                MagicMock(
+                    start=slot * 30 + 1.0,
+                    end=slot * 30 + 2.0,
+                    text=f" {buffer[clip['start']]:.0f} ",
+                    avg_logprob=-0.2,
+                    no_speech_prob=0.01,
+                )
+                for slot, clip in enumerate(clip_timestamps)
+            ]
+            return iter(segments), MagicMock()
+
+        engine._pipeline = MagicMock(transcribe=MagicMock(side_effect=fake_transcribe))
+
+        audio_a = np.full(40 * SR, 1.0, dtype=np.float32)
+        audio_b = np.full(10 * SR, 2.0, dtype=np.float32)
+        speech = {
+            id(audio_a): [{"start": 0, "end": 40 * SR}],
+            id(audio_b): [{"start": 5 * SR, "end": 10 * SR}],
+        }
+        mock_vad = MagicMock(
+            get_speech_timestamps=MagicMock(side_effect=lambda audio, _: speech[id(audio)])
+        )
+
+        with patch.dict("sys.modules", {"faster_whisper.vad": mock_vad}):
+            future_a = engine.submit(audio_a, language="en")
+            future_b = engine.submit(audio_b, language="en")
+
+        result_a = future_a.result(timeout=5)
+        result_b = future_b.result(timeout=5)
+
+        assert [(s["start"], s["text"]) for s in result_a.segments] == [(1.0, "1"), (31.0, "1")]
+        assert [(s["start"], s["text"]) for s in result_b.segments] == [(6.0, "2")]
+        assert (result_a.language, result_a.duration) == ("en", 40.0)
+        assert calls == [3]  # All three windows decoded in one call
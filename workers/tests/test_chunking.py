@@ -0,0 +1,67 @@
+"""Unit tests for chunk planning and stitching."""
+
+from app.services.chunking import Chunk, plan_chunks, stitch_segments
+
+SR = 16000
+
+
+def _spans(*seconds):
+    """Build VAD speech spans from (start, end) second pairs."""
+    return [{"start": int(s * SR), "end": int(e * SR)} for s, e in seconds]
+
+
+class TestPlanChunks:
+    """Tests for plan_chunks."""
+
+    def test_cuts_in_silence_after_min_length(self):
+        """Chunks close at the first pause past min length."""
+        speech = _spans((0, 25), (27, 50), (52, 80), (82, 100))
+
+        chunks = plan_chunks(speech, 100 * SR, min_samples=40 * SR, max_samples=120 * SR)
+
+        assert [(c.start / SR, c.end / SR) for c in chunks] == [(0, 51), (51, 100)]
+        assert all(c.start == c.own_start for c in chunks)
+
+    def test_force_splits_unbroken_speech_with_overlap(self):
+        """Speech longer than max length is split with shared context."""
+        speech = _spans((0, 250))
+
+        chunks = plan_chunks(
+            speech, 250 * SR, min_samples=30 * SR, max_samples=100 * SR, overlap_samples=SR
+        )
+
+        assert [c.own_start / SR for c in chunks] == [0, 100, 200]
+        assert chunks[1].start == 99 * SR
+        assert chunks[0].end == 101 * SR
+        assert chunks[-1].end == 250 * SR
+
+    def test_no_speech_yields_no_chunks(self):
+        """Silent audio produces no chunks."""
+        assert plan_chunks([], 10 * SR, min_samples=SR, max_samples=2 * SR) == []
+
+
+class TestStitchSegments:
+    """Tests for stitch_segments."""
+
+    def test_keeps_order_and_drops_overlap_duplicates(self):
+        """Overlap segments are attributed once and boundary words de-duplicated."""
+        first = Chunk(start=0, end=101 * SR, own_start=0)
+        second = Chunk(start=99 * SR, end=150 * SR, own_start=100 * SR)
+        results = [
+            (first, [
+                {"start": 90.0, "end": 97.0, "text": "So we shipped"},
+                {"start": 97.5, "end": 101.0, "text": "the new release"},
+            ]),
+            (second, [
+                {"start": 99.0, "end": 100.5, "text": "new"},
+                {"start": 100.5, "end": 104.0, "text": "Release, on Friday."},
+            ]),
+        ]
+
+        merged = stitch_segments(results, SR)
+
+        assert [s["text"] for s in merged] == [
+            "So we shipped",
+            "the new release",
+            "on Friday.",
+        ]
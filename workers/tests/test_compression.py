@@ -0,0 +1,56 @@
+"""Tests for extractive transcript compression."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from app.services.compression import (  # noqa: E402
+    compress_transcript,
+    rank_sentences,
+    split_sentences,
+)
+
+TRANSCRIPT = (
+    "Hi, thanks for joining today. "
+    "Tell me about the distributed cache you built. "
+    "The distributed cache sharded keys across nodes with consistent hashing. "
+    "Um, yeah. "
+    "Consistent hashing kept the cache warm when nodes joined. "
+    "Okay, great. "
+    "How did you measure cache hit rates across nodes? "
+    "Thanks, bye."
+)
+
+
+class TestCompression:
+    """Tests for TextRank sentence ranking and compression."""
+
+    def test_filler_ranks_below_content(self):
+        """Sentences sharing no terms with the interview rank lowest."""
+        sentences = split_sentences(TRANSCRIPT)
+
+        scores = rank_sentences(sentences)
+
+        assert scores.sum() == pytest.approx(1.0)
+        filler = sentences.index("Um, yeah.")
+        content = sentences.index(
+            "The distributed cache sharded keys across nodes with consistent hashing."
+        )
+        assert scores[filler] < scores[content]
+
+    def test_keeps_top_sentences_in_order(self):
+        """Kept sentences stay in their original order, filler dropped."""
+        compressed = compress_transcript(TRANSCRIPT, ratio=0.5)
+
+        kept = split_sentences(compressed)
+        original = split_sentences(TRANSCRIPT)
+        assert [original.index(sentence) for sentence in kept] == sorted(
+            original.index(sentence) for sentence in kept
+        )
+        assert "Um, yeah." not in kept
+        assert len(compressed.split()) >= 0.5 * len(TRANSCRIPT.split())
+        assert len(compressed.split()) < len(TRANSCRIPT.split())
+
+    def test_ratio_one_is_a_no_op(self):
+        """A ratio of 1 returns the transcript unchanged."""
+        assert compress_transcript(TRANSCRIPT, ratio=1.0) == TRANSCRIPT
@@ -1,6 +1,7 @@
 """Unit tests for ML services with mocked models."""
 
 import sys
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -103,6 +104,168 @@ class TestTranscriptionService:
         assert result[0]["end"] == 5.0
         assert result[0]["text"] == "Test segment."
 
+    def test_transcribe_result_keeps_whisper_details(self):
+        """Test one pass yields text, segments, language, duration and confidence."""
+        mock_whisper_model = MagicMock()
+
+        segments = [
+            MagicMock(start=0.0, end=4.0, text=" Hello. ", avg_logprob=-0.1, no_speech_prob=0.01),
+            MagicMock(start=4.0, end=5.0, text=" Bye. ", avg_logprob=-1.0, no_speech_prob=0.2),
+        ]
+        mock_info = MagicMock(language="fr", language_probability=0.97, duration=6.5)
+
+        mock_model_instance = MagicMock()
+        mock_model_instance.transcribe.return_value = (iter(segments), mock_info)
+        mock_whisper_model.return_value = mock_model_instance
+
+        with patch.dict("sys.modules", {"faster_whisper": MagicMock(WhisperModel=mock_whisper_model)}):
+            if "app.services.transcription" in sys.modules:
+                del sys.modules["app.services.transcription"]
+            from app.services.transcription import TranscriptionService
+
+            service = TranscriptionService(device="cpu")
+            result = service.transcribe_result("/fake/audio.mp3")
+
+        mock_model_instance.transcribe.assert_called_once()
+        assert result.text == "Hello. Bye."
+        assert (result.language, result.duration) == ("fr", 6.5)
+        assert result.segments[1]["no_speech_prob"] == 0.2
+        # Length-weighted: (4 * e^-0.1 + 1 * e^-1) / 5
+        assert result.confidence == pytest.approx(0.797, abs=0.001)
+        assert type(result).from_dict(result.to_dict()) == result
+
+    def test_transcribe_stream_offsets_window_timestamps(self):
+        """Test transcribe_stream shifts segment times by window offset."""
+        np = pytest.importorskip("numpy")
+
+        mock_whisper_model = MagicMock()
+
+        def fake_transcribe(audio, **kwargs):
+            segment = MagicMock(
+                start=1.0, end=2.0, text=" Window. ", avg_logprob=-0.1, no_speech_prob=0.0
+            )
+            return iter([segment]), MagicMock(language="en", language_probability=0.9)
+
+        mock_model_instance = MagicMock()
+        mock_model_instance.transcribe.side_effect = fake_transcribe
+        mock_whisper_model.return_value = mock_model_instance
+
+        with patch.dict("sys.modules", {"faster_whisper": MagicMock(WhisperModel=mock_whisper_model)}):
+            if "app.services.transcription" in sys.modules:
+                del sys.modules["app.services.transcription"]
+            from app.services.transcription import TranscriptionService
+
+            service = TranscriptionService(device="cpu")
+            blocks = [np.zeros(16000, dtype=np.float32)] * 3
+            segments = list(service.iter_stream_segments(blocks, window_seconds=2.0))
+            result = service.transcribe_stream(iter(blocks), window_seconds=2.0)
+
+        assert [s["start"] for s in segments] == pytest.approx([1.0, 3.0], abs=0.1)
+        assert result.text == "Window. Window."
+        assert (result.language, result.duration) == ("en", pytest.approx(3.0))
+        # Language detected on the first window is pinned for the rest
+        last_kwargs = mock_model_instance.transcribe.call_args.kwargs
+        assert last_kwargs["language"] == "en"
+
+    def test_transcribe_chunked_stitches_chunks_in_order(self):
+        """Test transcribe_chunked fans chunks out and stitches results."""
+        np = pytest.importorskip("numpy")
+        from concurrent.futures import Future
+
+        sr = 16000
+        audio = np.zeros(200 * sr, dtype=np.float32)
+        speech = [
+            {"start": 0, "end": 70 * sr},
+            {"start": 72 * sr, "end": 150 * sr},
+            {"start": 152 * sr, "end": 200 * sr},
+        ]
+
+        mock_model = MagicMock()
+
+        def fake_transcribe(chunk_audio, **kwargs):
+            segment = MagicMock(
+                start=0.5,
+                end=1.5,
+                text=f" {len(chunk_audio) // sr}s ",
+                avg_logprob=-0.1,
+                no_speech_prob=0.0,
+            )
+            return iter([segment]), MagicMock(language="de")
+
+        mock_model.transcribe.side_effect = fake_transcribe
+
+        class InlinePool:
+            def submit(self, fn, *args):
+                future = Future()
+                future.set_result(fn(*args))
+                return future
+
+        mock_fw = MagicMock(decode_audio=MagicMock(return_value=audio))
+        mock_vad = MagicMock(get_speech_timestamps=MagicMock(return_value=speech))
+
+        with patch.dict("sys.modules", {"faster_whisper": mock_fw, "faster_whisper.vad": mock_vad}):
+            if "app.services.transcription" in sys.modules:
+                del sys.modules["app.services.transcription"]
+            import app.services.transcription as transcription
+
+            transcription._pool_model = mock_model
+            service = transcription.TranscriptionService(device="cpu")
+            with patch.object(service, "_get_pool", return_value=InlinePool()):
+                result = service.transcribe_chunked(
+                    "/fake/audio.mp3", min_chunk_seconds=60, max_chunk_seconds=120, workers=2
+                )
+
+        assert [s["text"] for s in result.segments] == ["71s", "80s", "49s"]
+        assert [s["start"] for s in result.segments] == [0.5, 71.5, 151.5]
+        assert (result.language, result.duration) == ("de", 200.0)
+        # Detected language is pinned for every chunk
+        assert mock_model.transcribe.call_args.kwargs["language"] == "de"
+
+    def test_routes_by_language_under_memory_budget(self):
+        """Test English goes to the distilled model and other languages are routed."""
+        np = pytest.importorskip("numpy")
+
+        models = {}
+
+        def make_model(model_size, **kwargs):
+            def fake_transcribe(audio, language=None, **kw):
+                detected = "es" if model_size == "large-v3" else "en"
+                segment = MagicMock(
+                    start=0.0, end=1.0, text=f" {model_size} ", avg_logprob=-0.1, no_speech_prob=0.0
+                )
+                return iter([segment]), MagicMock(
+                    language=language or detected, language_probability=0.9, duration=1.0
+                )
+
+            models[model_size] = MagicMock(transcribe=MagicMock(side_effect=fake_transcribe))
+            return models[model_size]
+
+        audio = np.zeros(16000, dtype=np.float32)
+        mock_fw = MagicMock(
+            WhisperModel=MagicMock(side_effect=make_model),
+            decode_audio=MagicMock(return_value=audio),
+        )
+        with patch.dict("sys.modules", {"faster_whisper": mock_fw}):
+            if "app.services.transcription" in sys.modules:
+                del sys.modules["app.services.transcription"]
+            from app.services.transcription import TranscriptionService
+
+            service = TranscriptionService(
+                device="cpu", multilingual_model_size="large-v3", memory_budget_mb=2000
+            )
+            footprints = {"distil-large-v3": 800.0, "large-v3": 1600.0}
+            with patch.object(service, "_footprint_mb", side_effect=footprints.get):
+                detected = service.transcribe_result("/fake/audio.mp3")
+                hinted = service.transcribe_result("/fake/audio.mp3", language="en")
+
+        # Detected Spanish: the multilingual model detects and transcribes
+        assert (detected.language, detected.model, detected.text) == ("es", "large-v3", "large-v3")
+        # A hint skips detection and English goes to the distilled model
+        assert (hinted.language, hinted.model) == ("en", "distil-large-v3")
+        assert models["large-v3"].transcribe.call_count == 2
+        # Both models together exceed the budget, so only the English one stays
+        assert list(service._models) == ["distil-large-v3"]
+
     def test_cpu_uses_int8_compute_type(self):
         """Test that CPU device uses int8 compute type."""
         mock_torch = MagicMock()
@@ -119,9 +282,89 @@ class TestTranscriptionService:
             assert service.compute_type == "int8"
 
 
+class _FakeTokenizer:
+    """Whitespace tokenizer: one token per word."""
+
+    pad_token_id = 0
+
+    def encode(self, text, add_special_tokens=True):
+        return text.split()
+
+    def decode(self, ids):
+        return " ".join(ids)
+
+    def apply_chat_template(self, messages, tokenize=True, add_generation_prompt=False):
+        tokens = []
+        for message in messages:
+            tokens += [f"<{message['role']}>", *message["content"].split(), "<eot>"]
+        if add_generation_prompt:
+            tokens.append("<assistant>")
+        return tokens
+
+
+class _FakeLLMPipeline:
+    """Chat pipeline stand-in that records prompts and replies via ``respond``."""
+
+    def __init__(self, respond, context_tokens=None):
+        self.respond = respond
+        self.tokenizer = _FakeTokenizer()
+        self.model = SimpleNamespace(
+            config=SimpleNamespace(max_position_embeddings=context_tokens)
+        )
+        self.calls = []
+
+    def __call__(self, inputs, **kwargs):
+        self.calls.append((inputs, kwargs))
+
+        def reply(messages):
+            return [{"generated_text": [*messages, {"role": "assistant", "content": self.respond(messages)}]}]
+
+        if isinstance(inputs[0], list):
+            return [reply(messages) for messages in inputs]
+        return reply(inputs)
+
+
+def _summarization_service(respond, **kwargs):
+    """SummarizationService whose pipeline is a _FakeLLMPipeline."""
+    from app.services.summarization import SummarizationService
+
+    kwargs.setdefault("reuse_prompt_cache", False)
+    service = SummarizationService(load_in_4bit=False, **kwargs)
+    service.backend._pipeline = _FakeLLMPipeline(respond)
+    return service
+
+
+FINAL_ANALYSIS = {
+    "executive_summary": "A long technical interview.",
+    "key_topics": ["Python"],
+    "strengths": ["Clear"],
+    "areas_for_improvement": ["Depth"],
+    "sentiment_score": 0.4,
+}
+
+
+def _section_analysis(summary):
+    return {
+        "section_summary": summary,
+        "key_topics": [],
+        "strengths": [],
+        "areas_for_improvement": [],
+        "sentiment_score": 0.0,
+    }
+
+
 class TestSummarizationService:
     """Tests for SummarizationService."""
 
+    def test_positional_model_name_builds_default_backend(self):
+        """The original positional parameters keep their meaning."""
+        from app.services.summarization import SummarizationService
+
+        service = SummarizationService("my-org/my-model", "cpu", False)
+
+        assert service.backend.model_name == "my-org/my-model"
+        assert (service.backend.device, service.backend.load_in_4bit) == ("cpu", False)
+
     def test_summarize_returns_valid_schema(self):
         """Test that summarize returns all required keys."""
         mock_response = {
@@ -228,6 +471,569 @@ class TestSummarizationService:
         with pytest.raises(ValueError, match="Missing required key"):
             service._validate_output(data)
 
+    def test_split_windows_respects_token_budget(self):
+        """Test windows stay within the budget and cover every sentence."""
+        service = _summarization_service(lambda messages: "")
+        transcript = " ".join(f"Sentence number {i} is here." for i in range(20))
+
+        windows = service._split_windows(transcript, max_tokens=12)
+
+        assert all(len(window.split()) <= 12 for window in windows)
+        assert " ".join(windows) == transcript
+
+    def test_split_windows_cuts_overlong_sentence(self):
+        """Test a sentence longer than a window is cut by tokens."""
+        service = _summarization_service(lambda messages: "")
+
+        windows = service._split_windows("one two three four five six seven", max_tokens=3)
+
+        assert windows == ["one two three", "four five six", "seven"]
+
+    def test_short_transcript_is_single_pass(self):
+        """Test transcripts within the budget use one generation."""
+        import json
+
+        service = _summarization_service(
+            lambda messages: json.dumps(FINAL_ANALYSIS), max_input_tokens=100
+        )
+
+        result = service.summarize("A short interview.")
+
+        assert result == FINAL_ANALYSIS
+        assert len(service.backend._pipeline.calls) == 1
+
+    def test_summarize_batch_buckets_by_length(self):
+        """Test single-pass transcripts share a batch, shortest first."""
+        import json
+
+        def respond(messages):
+            transcript = messages[1]["content"]
+            return json.dumps({**FINAL_ANALYSIS, "executive_summary": transcript.split()[1]})
+
+        service = _summarization_service(respond, max_input_tokens=100, batch_size=4)
+
+        results = service.summarize_batch(["long one two three", "short", "mid one"])
+
+        assert [r["executive_summary"] for r in results] == ["long", "short", "mid"]
+        (inputs, kwargs), = service.backend._pipeline.calls
+        assert [messages[1]["content"].split()[1] for messages in inputs] == [
+            "short", "mid", "long",
+        ]
+        assert kwargs["batch_size"] == 4
+
+    def test_summarize_batch_falls_back_per_transcript(self):
+        """Test one unparseable reply does not fail the rest of the batch."""
+        import json
+
+        from app.services.summarization import FALLBACK_SUMMARY
+
+        def respond(messages):
+            return "not json" if "bad" in messages[1]["content"] else json.dumps(FINAL_ANALYSIS)
+
+        service = _summarization_service(respond, max_input_tokens=100)
+
+        assert service.summarize_batch(["good", "bad"]) == [FINAL_ANALYSIS, FALLBACK_SUMMARY]
+
+    def test_draft_model_assists_single_generations_only(self):
+        """Test the draft model is passed to single, not batched, generations."""
+        import json
+
+        service = _summarization_service(
+            lambda messages: json.dumps(FINAL_ANALYSIS), max_input_tokens=100
+        )
+        draft_model = MagicMock()
+        service.backend._draft_model = draft_model
+
+        service.summarize("A short interview.")
+        service.summarize_batch(["One interview.", "Another interview."])
+
+        single_call, batch_call = service.backend._pipeline.calls
+        assert single_call[1]["assistant_model"] is draft_model
+        assert "assistant_model" not in batch_call[1]
+
+    def test_cascade_keeps_small_model_summary_that_passes_checks(self):
+        """Test a good small-model summary is kept without escalating."""
+        import json
+
+        from app.services.summarization import CascadeTier
+
+        small = _summarization_service(lambda messages: json.dumps(FINAL_ANALYSIS)).backend
+        service = _summarization_service(
+            lambda messages: json.dumps(FINAL_ANALYSIS),
+            cascade=[CascadeTier(name="small", backend=small, max_input_tokens=100)],
+        )
+
+        result = service.summarize("A short interview.")
+
+        assert result["model_tier"] == "small"
+        assert result["tiers_tried"] == ["small"]
+        assert len(small._pipeline.calls) == 1
+        assert service.backend._pipeline.calls == []
+
+    def test_cascade_escalates_failures_and_long_transcripts(self):
+        """Test weak summaries and transcripts over the tier limit reach the large model."""
+        import json
+
+        from app.services.summarization import CascadeTier
+
+        weak = {**FINAL_ANALYSIS, "strengths": []}
+        small = _summarization_service(lambda messages: json.dumps(weak)).backend
+        service = _summarization_service(
+            lambda messages: json.dumps(FINAL_ANALYSIS),
+            cascade=[CascadeTier(name="small", backend=small, max_input_tokens=5)],
+            min_list_items=1,
+        )
+
+        short, long = service.summarize_batch(
+            ["A short interview.", "A much longer interview than the small tier takes."]
+        )
+
+        large = service.backend.name
+        assert (short["model_tier"], short["tiers_tried"]) == (large, ["small", large])
+        assert (long["model_tier"], long["tiers_tried"]) == (large, [large])
+        assert short["strengths"] == FINAL_ANALYSIS["strengths"]
+
+    def test_context_window_caps_single_pass_budget(self):
+        """Test a transcript the context cannot hold is map-reduced."""
+        import json
+
+        from app.services.summarization import SYSTEM_PROMPT, USER_PROMPT_TEMPLATE
+        from app.services.summarization_backends import GENERATION_KWARGS
+
+        def respond(messages):
+            if "Section analyses" in messages[1]["content"]:
+                return json.dumps(FINAL_ANALYSIS)
+            return json.dumps(_section_analysis("part"))
+
+        service = _summarization_service(respond, max_input_tokens=10_000, window_tokens=10_000)
+        overhead = (
+            len(SYSTEM_PROMPT.split())
+            + len(USER_PROMPT_TEMPLATE.format(transcript="").split())
+            + 32
+        )
+        service.backend._pipeline.model.config.max_position_embeddings = (
+            overhead + GENERATION_KWARGS["max_new_tokens"] + 20
+        )
+        transcript = " ".join(f"Sentence {i} goes here." for i in range(10))  # 40 tokens
+
+        result = service.summarize(transcript)
+
+        assert result == FINAL_ANALYSIS
+        map_call = service.backend._pipeline.calls[0]
+        assert len(map_call[0]) == 2  # 20-token windows
+
+    def test_over_budget_keeps_opening_closing_and_dense_middle(self):
+        """Test truncation keeps the most informative sections, in order."""
+        service = _summarization_service(lambda messages: "")
+        filler = ["yeah yeah yeah."] * 6
+        transcript = " ".join(
+            ["Opening role overview.", *filler, "Kubernetes migration tradeoffs.", *filler,
+             "Closing next steps."]
+        )
+
+        shortened = service._select_windows(transcript, budget=24)
+
+        assert shortened.startswith("Opening role overview.")
+        assert shortened.endswith("[...] Closing next steps.")
+        assert "[...] Kubernetes migration tradeoffs. [...]" in shortened
+        assert len(shortened.split()) <= 24
+
+    def test_long_transcript_uses_map_reduce(self):
+        """Test long transcripts are mapped in a batch, then reduced."""
+        import json
+
+        from app.services.summarization import SYSTEM_PROMPT
+
+        def respond(messages):
+            if "Section analyses" in messages[1]["content"]:
+                return json.dumps(FINAL_ANALYSIS)
+            return json.dumps(_section_analysis("part"))
+
+        service = _summarization_service(
+            respond, max_input_tokens=10, window_tokens=10, reduce_fan_in=8
+        )
+        transcript = " ".join(f"Sentence {i} goes here." for i in range(10))
+
+        result = service.summarize(transcript)
+
+        assert result == FINAL_ANALYSIS
+        map_call, reduce_call = service.backend._pipeline.calls
+        assert len(map_call[0]) == 5  # Two 4-token sentences per window
+        assert map_call[1]["batch_size"] == service.batch_size
+        assert reduce_call[0][0]["content"] == SYSTEM_PROMPT
+
+    def test_map_reduce_combines_hierarchically(self):
+        """Test section analyses beyond the fan-in are merged in groups first."""
+        import json
+
+        def respond(messages):
+            content = messages[1]["content"]
+            if "Section analyses" in content:
+                return json.dumps(FINAL_ANALYSIS)
+            if "Merge them" in content:
+                return json.dumps(_section_analysis("merged"))
+            return json.dumps(_section_analysis("part"))
+
+        service = _summarization_service(
+            respond, max_input_tokens=4, window_tokens=4, reduce_fan_in=2
+        )
+        transcript = " ".join(f"Sentence {i} goes here." for i in range(5))
+
+        result = service.summarize(transcript)
+
+        assert result == FINAL_ANALYSIS
+        # Map 5 windows, combine into 3 then 2 (<= fan-in), then reduce
+        batch_sizes = [len(inputs) for inputs, _ in service.backend._pipeline.calls[:-1]]
+        assert batch_sizes == [5, 3, 2]
+
+    def test_prompt_cache_built_once_per_system_prompt(self):
+        """Test the system prompt prefix is prefilled once and reused."""
+        from app.services.summarization_backends import _PromptCache
+
+        service = _summarization_service(lambda messages: "", reuse_prompt_cache=True)
+        prefix = service.backend._pipeline.tokenizer.apply_chat_template(
+            [{"role": "system", "content": "Be brief."}]
+        )
+        service.backend._build_prompt_cache = MagicMock(
+            return_value=_PromptCache(ids=prefix, past_key_values=None, prefill_ms=1.0)
+        )
+        service.backend._generate_with_prompt_cache = MagicMock(return_value="reply")
+        messages = [
+            {"role": "system", "content": "Be brief."},
+            {"role": "user", "content": "First transcript"},
+        ]
+
+        assert service._generate(messages) == "reply"
+        messages[1]["content"] = "Second transcript"
+        assert service._generate(messages) == "reply"
+
+        service.backend._build_prompt_cache.assert_called_once_with("Be brief.")
+        prompt_ids = service.backend._generate_with_prompt_cache.call_args.args[1]
+        assert prompt_ids[: len(prefix)] == prefix
+        assert prompt_ids[len(prefix) :] == ["<user>", "Second", "transcript", "<eot>", "<assistant>"]
+        assert service.backend._pipeline.calls == []
+
+    def test_prompt_cache_mismatch_uses_pipeline(self):
+        """Test prompts that do not start with the cached prefix prefill in full."""
+        from app.services.summarization_backends import _PromptCache
+
+        service = _summarization_service(lambda messages: "full", reuse_prompt_cache=True)
+        service.backend._build_prompt_cache = MagicMock(
+            return_value=_PromptCache(ids=["<other>"], past_key_values=None, prefill_ms=1.0)
+        )
+        service.backend._generate_with_prompt_cache = MagicMock()
+
+        reply = service._generate(
+            [{"role": "system", "content": "Be brief."}, {"role": "user", "content": "Hi"}]
+        )
+
+        assert reply == "full"
+        service.backend._generate_with_prompt_cache.assert_not_called()
+
+    def test_constrained_decoding_passes_schema_enforcer(self):
+        """Test constrained mode hands a schema-bound token filter to generation."""
+        import json
+
+        from app.services.summarization import ANALYSIS_JSON_SCHEMA
+
+        mock_enforcer = MagicMock()
+        integration = mock_enforcer.integrations.transformers
+        integration.build_transformers_prefix_allowed_tokens_fn.return_value = "allowed_fn"
+
+        service = _summarization_service(
+            lambda messages: json.dumps(FINAL_ANALYSIS), constrained_decoding=True
+        )
+        with patch.dict("sys.modules", {
+            "lmformatenforcer": mock_enforcer,
+            "lmformatenforcer.integrations.transformers": integration,
+        }):
+            result = service.summarize("A short interview.")
+            service.summarize("Another short interview.")
+
+        assert result == FINAL_ANALYSIS
+        mock_enforcer.JsonSchemaParser.assert_called_with(ANALYSIS_JSON_SCHEMA)
+        # Tokenizer vocabulary is analyzed once per model
+        integration.build_token_enforcer_tokenizer_data.assert_called_once()
+        _, kwargs = service.backend._pipeline.calls[0]
+        assert kwargs["prefix_allowed_tokens_fn"] == "allowed_fn"
+
+    def test_unconstrained_decoding_has_no_token_filter(self):
+        """Test the default mode generates without a token filter."""
+        import json
+
+        service = _summarization_service(lambda messages: json.dumps(FINAL_ANALYSIS))
+
+        service.summarize("A short interview.")
+
+        _, kwargs = service.backend._pipeline.calls[0]
+        assert "prefix_allowed_tokens_fn" not in kwargs
+
+    def test_map_reduce_without_parseable_sections_falls_back(self):
+        """Test the fallback analysis when no section can be parsed."""
+        service = _summarization_service(
+            lambda messages: "not json", max_input_tokens=4, window_tokens=4
+        )
+
+        result = service.summarize("Sentence one goes here. Sentence two goes here.")
+
+        assert result["executive_summary"] == "Analysis could not be completed."
+
+    def test_fingerprint_tracks_prompts_model_and_settings(self):
+        """The fingerprint changes with anything that changes a summary."""
+        service = _summarization_service(lambda messages: "{}")
+        fingerprint = service.fingerprint
+
+        assert _summarization_service(lambda messages: "{}").fingerprint == fingerprint
+        assert (
+            _summarization_service(lambda messages: "{}", model_name="other/model").fingerprint
+            != fingerprint
+        )
+        service.compression_ratio = 0.5
+        assert service.fingerprint != fingerprint
+        service.compression_ratio = 1.0
+        # The module the service class came from (other tests re-import it)
+        module_globals = type(service).fingerprint.fget.__globals__
+        with patch.dict(module_globals, {"SYSTEM_PROMPT": "Be brief."}):
+            assert service.fingerprint != fingerprint
+
+
+class TestLlamaCppBackend:
+    """Tests for the GGUF / llama.cpp summarization backend."""
+
+    def _backend(self, reply="{}", **kwargs):
+        from app.services.summarization_backends import LlamaCppBackend
+
+        mock_llama_cpp = MagicMock()
+        llm = mock_llama_cpp.Llama.return_value
+        llm.create_chat_completion.return_value = {
+            "choices": [{"message": {"role": "assistant", "content": reply}}]
+        }
+        backend = LlamaCppBackend(model_path="/models/llama-q4.gguf", **kwargs)
+        with patch.dict("sys.modules", {"llama_cpp": mock_llama_cpp}):
+            backend.load()
+        return backend, mock_llama_cpp
+
+    def test_requires_model_source(self):
+        """Test the backend refuses to start without a model path or repo."""
+        from app.services.summarization_backends import LlamaCppBackend
+
+        with pytest.raises(ValueError, match="model_path or repo_id"):
+            LlamaCppBackend()
+
+    def test_load_memory_maps_with_threads(self):
+        """Test the model is memory-mapped and uses the configured threads."""
+        backend, mock_llama_cpp = self._backend(n_threads=6)
+
+        _, kwargs = mock_llama_cpp.Llama.call_args
+        assert kwargs["model_path"] == "/models/llama-q4.gguf"
+        assert kwargs["use_mmap"] is True
+        assert kwargs["n_threads"] == 6
+        backend._llm.set_cache.assert_called_once()
+
+    def test_summarize_through_service_with_schema(self):
+        """Test the service contract holds and schemas become grammars."""
+        import json
+
+        from app.services.summarization import ANALYSIS_JSON_SCHEMA, SummarizationService
+
+        backend, _ = self._backend(reply=json.dumps(FINAL_ANALYSIS))
+        backend._llm.tokenize.side_effect = lambda data, **kwargs: data.split()
+        service = SummarizationService(backend=backend, constrained_decoding=True)
+
+        result = service.summarize("A short interview.")
+
+        assert result == FINAL_ANALYSIS
+        _, kwargs = backend._llm.create_chat_completion.call_args
+        assert kwargs["response_format"] == {"type": "json_object", "schema": ANALYSIS_JSON_SCHEMA}
+
+
+class _RecordingBackend:
+    """Inner backend that records how generations were grouped."""
+
+    def __init__(self):
+        self.calls = []
+
+    def generate(self, messages, schema=None, max_new_tokens=None):
+        self.calls.append(("single", 1))
+        return messages[-1]["content"].upper()
+
+    def generate_batch(self, conversations, schema=None, max_new_tokens=None, batch_size=1):
+        self.calls.append(("batch", len(conversations)))
+        return [messages[-1]["content"].upper() for messages in conversations]
+
+
+class TestMicroBatchingBackend:
+    """Tests for MicroBatchingBackend."""
+
+    def test_concurrent_callers_share_a_batch(self):
+        """Test conversations queued together run as one batch, in order."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from app.services.summarization_backends import MicroBatchingBackend
+
+        inner = _RecordingBackend()
+        backend = MicroBatchingBackend(inner, batch_size=8, max_wait_ms=200)
+        conversations = [[{"role": "user", "content": f"job {i}"}] for i in range(4)]
+
+        with ThreadPoolExecutor(max_workers=4) as callers:
+            replies = list(callers.map(backend.generate, conversations))
+
+        assert replies == [f"JOB {i}" for i in range(4)]
+        assert inner.calls == [("batch", 4)]
+
+    def test_lone_generation_uses_inner_generate(self):
+        """Test a batch of one keeps the inner single-generation path."""
+        from app.services.summarization_backends import MicroBatchingBackend
+
+        inner = _RecordingBackend()
+        backend = MicroBatchingBackend(inner, batch_size=8, max_wait_ms=1)
+
+        assert backend.generate([{"role": "user", "content": "solo"}]) == "SOLO"
+        assert inner.calls == [("single", 1)]
+
+    def test_different_schemas_are_not_mixed(self):
+        """Test generations with different decoding settings run separately."""
+        from app.services.summarization_backends import MicroBatchingBackend
+
+        inner = _RecordingBackend()
+        backend = MicroBatchingBackend(inner, batch_size=8, max_wait_ms=200)
+
+        first = backend.submit([{"role": "user", "content": "a"}], schema={"type": "object"})
+        second = backend.submit([{"role": "user", "content": "b"}], schema=None)
+
+        assert (first.result(), second.result()) == ("A", "B")
+        assert inner.calls == [("single", 1), ("single", 1)]
+
+    def test_failures_propagate_to_callers(self):
+        """Test an inner failure is raised in every waiting caller."""
+        from app.services.summarization_backends import MicroBatchingBackend
+
+        inner = MagicMock()
+        inner.generate.side_effect = RuntimeError("out of memory")
+        backend = MicroBatchingBackend(inner, batch_size=8, max_wait_ms=1)
+
+        with pytest.raises(RuntimeError, match="out of memory"):
+            backend.generate([{"role": "user", "content": "x"}])
+
+    def test_tokenizer_never_used_concurrently(self):
+        """Test caller tokenization never overlaps itself or a generation."""
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        from app.services.summarization_backends import MicroBatchingBackend
+
+        active = []
+        overlaps = []
+        guard = threading.Lock()
+
+        def tokenizing(result):
+            def call(*args, **kwargs):
+                with guard:
+                    active.append(1)
+                    overlaps.append(len(active) > 1)
+                threading.Event().wait(0.005)
+                with guard:
+                    active.pop()
+                return result
+
+            return call
+
+        inner = MagicMock()
+        inner.encode.side_effect = tokenizing([1, 2, 3])
+        inner.generate.side_effect = tokenizing("reply")
+        backend = MicroBatchingBackend(inner, batch_size=1, max_wait_ms=1)
+
+        def work(i):
+            if i % 4:
+                return backend.count_tokens("text")
+            return backend.generate([{"role": "user", "content": "x"}])
+
+        with ThreadPoolExecutor(max_workers=8) as callers:
+            list(callers.map(work, range(16)))
+
+        assert overlaps and not any(overlaps)
+
+
+class TestPendingSummaries:
+    """Tests for the batched-summarization queue."""
+
+    def test_drain_returns_at_once_when_empty(self):
+        """Test an empty queue never blocks the dispatcher."""
+        from app.services.summarization_queue import PendingSummaries
+
+        client = MagicMock()
+        client.lrange.return_value = []
+        client.lmove.return_value = None
+
+        assert PendingSummaries(client).drain("d1", max_items=4, max_wait_ms=1000) == []
+        client.blmove.assert_not_called()
+        client.srem.assert_called_once_with("vibecheck:summarize:pending:dispatchers", "d1")
+
+    def test_drain_claims_into_processing_list(self):
+        """Test payloads are moved, not popped, until the batch is full."""
+        from app.services.summarization_queue import PendingSummaries
+
+        client = MagicMock()
+        client.lrange.return_value = []
+        client.lmove.return_value = b'{"job_id": "1"}'
+        client.blmove.side_effect = [b'{"job_id": "2"}', b'{"job_id": "3"}']
+
+        batch = PendingSummaries(client, key="q").drain("d1", max_items=3, max_wait_ms=1000)
+
+        assert [payload["job_id"] for payload in batch] == ["1", "2", "3"]
+        client.lmove.assert_called_once_with("q", "q:processing:d1", "LEFT", "RIGHT")
+        client.set.assert_called_once_with("q:lease:d1", 1, ex=4500)
+
+    def test_drain_stops_when_wait_expires(self):
+        """Test a partial batch is returned once nothing more arrives."""
+        from app.services.summarization_queue import PendingSummaries
+
+        client = MagicMock()
+        client.lrange.return_value = []
+        client.lmove.return_value = b'{"job_id": "1"}'
+        client.blmove.return_value = None
+
+        batch = PendingSummaries(client).drain("d1", max_items=3, max_wait_ms=10)
+
+        assert [payload["job_id"] for payload in batch] == ["1"]
+
+    def test_retry_resumes_its_own_batch(self):
+        """Test a dispatcher holding payloads gets them back and claims no more."""
+        from app.services.summarization_queue import PendingSummaries
+
+        client = MagicMock()
+        client.lrange.return_value = [b'{"job_id": "1"}', b'{"job_id": "2"}']
+
+        batch = PendingSummaries(client).drain("d1", max_items=4, max_wait_ms=1000)
+
+        assert [payload["job_id"] for payload in batch] == ["1", "2"]
+        client.lmove.assert_not_called()
+
+    def test_reap_requeues_only_expired_leases_in_order(self):
+        """Test abandoned payloads return to the head of the queue, in order."""
+        from app.services.summarization_queue import PendingSummaries
+
+        client = MagicMock()
+        client.smembers.return_value = {b"dead", b"alive"}
+        client.exists.side_effect = lambda key: key == "q:lease:alive"
+        processing = {"q:processing:dead": [b"1", b"2"], "q:processing:alive": [b"3"]}
+        queue = [b"4"]
+
+        def lmove(source, destination, src_side, dest_side):
+            assert (destination, src_side, dest_side) == ("q", "RIGHT", "LEFT")
+            if not processing[source]:
+                return None
+            item = processing[source].pop()
+            queue.insert(0, item)
+            return item
+
+        client.lmove.side_effect = lmove
+
+        assert PendingSummaries(client, key="q").reap() == 2
+        assert queue == [b"1", b"2", b"4"]
+        assert processing["q:processing:alive"] == [b"3"]
+        client.srem.assert_called_once_with("q:dispatchers", "dead")
+
 
 class TestS3Service:
     """Tests for S3Service."""
@@ -256,6 +1062,50 @@ class TestS3Service:
             "test-bucket", "uploads/test.mp3", "/tmp/test.mp3"
         )
 
+    @patch("app.services.s3.boto3")
+    @patch("app.services.s3.get_settings")
+    def test_open_stream_returns_body(self, mock_settings, mock_boto3):
+        """Test open_stream returns the get_object body."""
+        from app.services.s3 import S3Service
+
+        mock_settings.return_value.s3_bucket_name = "test-bucket"
+
+        mock_client = MagicMock()
+        mock_client.get_object.return_value = {"Body": "stream"}
+        mock_boto3.client.return_value = mock_client
+
+        service = S3Service()
+        result = service.open_stream("uploads/test.mp3")
+
+        assert result == "stream"
+        mock_client.get_object.assert_called_once_with(
+            Bucket="test-bucket", Key="uploads/test.mp3"
+        )
+
+    @patch("app.services.s3.boto3")
+    @patch("app.services.s3.get_settings")
+    def test_download_file_with_hash(self, mock_settings, mock_boto3, tmp_path):
+        """Test download_file_with_hash writes the file and returns SHA-256."""
+        import hashlib
+        import io
+
+        from app.services.s3 import S3Service
+
+        mock_settings.return_value.s3_bucket_name = "test-bucket"
+
+        content = b"fake audio bytes" * 1000
+        mock_client = MagicMock()
+        mock_client.get_object.return_value = {"Body": io.BytesIO(content)}
+        mock_boto3.client.return_value = mock_client
+
+        service = S3Service()
+        local_path = str(tmp_path / "audio" / "test.mp3")
+        digest = service.download_file_with_hash("uploads/test.mp3", local_path)
+
+        assert digest == hashlib.sha256(content).hexdigest()
+        with open(local_path, "rb") as f:
+            assert f.read() == content
+
     @patch("app.services.s3.boto3")
     @patch("app.services.s3.get_settings")
     def test_file_exists_returns_true(self, mock_settings, mock_boto3):
@@ -0,0 +1,111 @@
+"""Tests for the model server and its thin clients."""
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from app.model_server import create_server  # noqa: E402
+from app.services.model_client import (  # noqa: E402
+    ModelServerClient,
+    RemoteSummarizationService,
+    RemoteTranscriptionService,
+)
+
+
+@pytest.fixture(params=["unix", "http"])
+def served(request, tmp_path):
+    """A running server backed by mock models, and a client for it."""
+    models = MagicMock()
+    models.info.return_value = {
+        "status": "ok", "model_size": "distil-large-v3", "compute_type": "int8",
+        "summarization_model": "meta-llama/Llama-3.3-8B-Instruct",
+        "summarization_fingerprint": "f" * 64,
+    }
+    if request.param == "unix":
+        url = f"unix://{tmp_path}/models.sock"
+    else:
+        url = "http://127.0.0.1:0"
+    server = create_server(url, models)
+    if request.param == "http":
+        url = f"http://127.0.0.1:{server.server_address[1]}"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield models, ModelServerClient(url, timeout=10)
+    server.shutdown()
+    server.server_close()
+
+
+class TestModelServer:
+    """Round trips between the clients and the server."""
+
+    def test_transcription_client_uploads_audio(self, served, tmp_path):
+        """Test audio bytes and language reach the server; segments come back."""
+        models, client = served
+        models.transcribe.return_value = {"segments": [{"start": 0.0, "end": 1.0, "text": "Hi"}]}
+        audio_path = tmp_path / "audio.mp3"
+        audio_path.write_bytes(b"fake audio")
+        service = RemoteTranscriptionService(client)
+
+        segments = service.transcribe_with_timestamps(str(audio_path), language="en")
+
+        assert segments == [{"start": 0.0, "end": 1.0, "text": "Hi"}]
+        models.transcribe.assert_called_once_with(b"fake audio", "en")
+        assert service.model_size == "distil-large-v3"
+        assert service.compute_type == "int8"
+
+    def test_stream_pins_language_after_first_window(self, served):
+        """Test streamed windows are offset and reuse the detected language."""
+        models, client = served
+        models.transcribe_pcm.return_value = {
+            "segments": [{"start": 1.0, "end": 2.0, "text": "word"}],
+            "language": "de",
+        }
+        service = RemoteTranscriptionService(client)
+        blocks = [np.zeros(16000 * 3, dtype=np.float32)]
+
+        segments = list(service.iter_stream_segments(blocks, window_seconds=2.0))
+
+        assert [segment["start"] for segment in segments] == pytest.approx([1.0, 3.0], abs=0.2)
+        languages = [call.args[1] for call in models.transcribe_pcm.call_args_list]
+        assert languages == [None, "de"]
+
+    def test_summarization_client(self, served):
+        """Test transcripts are summarized on the server."""
+        models, client = served
+        models.summarize.return_value = {"summary": {"executive_summary": "Good"}}
+
+        service = RemoteSummarizationService(client)
+        summary = service.summarize("A transcript")
+
+        assert summary == {"executive_summary": "Good"}
+        assert service.fingerprint == "f" * 64
+        assert service.model_name == "meta-llama/Llama-3.3-8B-Instruct"
+        models.summarize.assert_called_once_with({"transcript": "A transcript"})
+
+    def test_summarization_client_batch(self, served):
+        """Test a batch of transcripts is summarized in one request."""
+        models, client = served
+        models.summarize_batch.return_value = {"summaries": [{"a": 1}, {"b": 2}]}
+
+        summaries = RemoteSummarizationService(client).summarize_batch(["one", "two"])
+
+        assert summaries == [{"a": 1}, {"b": 2}]
+        models.summarize_batch.assert_called_once_with({"transcripts": ["one", "two"]})
+
+    def test_server_error_raises_runtime_error(self, served):
+        """Test model failures are reported as RuntimeError, not retried."""
+        models, client = served
+        models.summarize.side_effect = ValueError("model exploded")
+
+        with pytest.raises(RuntimeError, match="model exploded"):
+            RemoteSummarizationService(client).summarize("A transcript")
+
+    def test_unreachable_server_raises_os_error(self, tmp_path):
+        """Test connection failures surface as OSError (transient)."""
+        client = ModelServerClient(f"unix://{tmp_path}/missing.sock")
+
+        with pytest.raises(OSError):
+            RemoteSummarizationService(client).summarize("A transcript")
@@ -0,0 +1,115 @@
+"""Unit tests for the partitioned transcription engine."""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+from app.services.partitioned_transcription import (
+    PartitionedTranscriptionEngine,
+    partition_cores,
+)
+from app.services.transcription import TranscriptResult
+
+
+class TestPartitionCores:
+    """Tests for partition_cores."""
+
+    def test_contiguous_equal_slices(self):
+        assert partition_cores(list(range(32)), 4) == [
+            list(range(0, 8)),
+            list(range(8, 16)),
+            list(range(16, 24)),
+            list(range(24, 32)),
+        ]
+
+    def test_extra_cores_go_first(self):
+        assert partition_cores([5, 1, 2, 3, 4, 0, 6], 3) == [[0, 1, 2], [3, 4], [5, 6]]
+
+    def test_partitions_capped_at_cores(self):
+        assert partition_cores([0, 1], 4) == [[0], [1]]
+
+
+class _FakePool:
+    """A one-process pool stand-in that runs calls inline."""
+
+    def __init__(self, max_workers, mp_context, initializer, initargs):
+        self.cores = initargs[0]
+        self.options = initargs[1]
+        self.running = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def submit(self, fn, *args):
+        future = Future()
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        if fn.__name__ == "_partition_cores":
+            future.set_result(self.cores)
+        else:
+            threading.Event().wait(0.05)
+            future.set_result(TranscriptResult(segments=[], model=str(self.cores)))
+        with self.lock:
+            self.running -= 1
+        return future
+
+    def shutdown(self):
+        pass
+
+
+class TestPartitionedTranscriptionEngine:
+    """Tests for PartitionedTranscriptionEngine."""
+
+    def _engine(self, partitions, cores=8):
+        service = MagicMock(model_size="distil-large-v3", compute_type="int8")
+        with patch(
+            "app.services.partitioned_transcription.ProcessPoolExecutor", _FakePool
+        ), patch("os.sched_getaffinity", return_value=set(range(cores))):
+            return PartitionedTranscriptionEngine(service, partitions)
+
+    def test_partitions_copy_service_options(self):
+        """Each partition gets its core slice and the service's decoding options."""
+        engine = self._engine(2)
+
+        assert [pool.cores for pool in engine._pools] == [[0, 1, 2, 3], [4, 5, 6, 7]]
+        assert engine._pools[0].options["model_size"] == "distil-large-v3"
+        assert engine._pools[0].options["compute_type"] == "int8"
+
+    def test_concurrent_jobs_spread_one_per_partition(self):
+        """Concurrent jobs never share a partition and use all of them."""
+        engine = self._engine(4)
+
+        with ThreadPoolExecutor(max_workers=8) as jobs:
+            results = list(jobs.map(engine.transcribe, [f"{i}.wav" for i in range(8)]))
+
+        assert len(results) == 8
+        assert {result.model for result in results} == {
+            str(cores) for cores in engine.cores
+        }
+        assert all(pool.peak == 1 for pool in engine._pools)
+        assert engine._free.qsize() == 4
+
+
+class TestPartitionedEngineSingleton:
+    """Tests for app.tasks.get_partitioned_engine."""
+
+    def test_concurrent_first_calls_build_one_engine(self):
+        """Threads racing on the first job share one set of partitions."""
+        from app import tasks
+
+        built = []
+
+        def build(service, partitions):
+            threading.Event().wait(0.05)
+            built.append(partitions)
+            return MagicMock()
+
+        with patch.object(tasks, "_partitioned_engine", None), patch(
+            "app.services.partitioned_transcription.PartitionedTranscriptionEngine",
+            side_effect=build,
+        ), patch("app.tasks.get_transcription_service"):
+            with ThreadPoolExecutor(max_workers=4) as threads:
+                engines = list(threads.map(lambda _: tasks.get_partitioned_engine(), range(4)))
+
+        assert len(built) == 1
+        assert all(engine is engines[0] for engine in engines)
@@ -0,0 +1,125 @@
+"""Tests for model preloading in the Celery master."""
+
+from unittest.mock import MagicMock, mock_open, patch
+
+import pytest
+
+from app import preload
+from app.core.quality import QualityTier
+
+BALANCED = [QualityTier.BALANCED]
+
+
+def _worker(queues):
+    """A WorkController stand-in consuming ``queues`` (None = every queue)."""
+    worker = MagicMock()
+    worker.app.amqp.queues.consume_from = (
+        {name: MagicMock() for name in queues} if queues is not None else None
+    )
+    return worker
+
+
+@pytest.fixture
+def settings():
+    with patch("app.preload.get_settings") as mock_settings:
+        mock_settings.return_value.preload_models = True
+        mock_settings.return_value.model_server_url = ""
+        mock_settings.return_value.partitioned_transcription = False
+        yield mock_settings.return_value
+
+
+@pytest.fixture(autouse=True)
+def reset_child_models():
+    yield
+    preload._child_models = ([], [])
+
+
+class TestPreload:
+    """Tests for the worker_init / worker_process_init handlers."""
+
+    def test_memory_usage_sums_shared_pages(self):
+        """Shared clean and dirty pages are reported together."""
+        smaps = "Rss: 2048 kB\nPss: 1024 kB\nShared_Clean: 512 kB\nShared_Dirty: 512 kB\n"
+        with patch("builtins.open", mock_open(read_data=smaps)):
+            assert preload.memory_usage_mb() == {"rss": 2.0, "pss": 1.0, "shared": 1.0}
+
+    @pytest.mark.parametrize(
+        "queues, expected",
+        [
+            (None, (BALANCED, BALANCED)),
+            (["transcription"], (BALANCED, [])),
+            (["summarization", "persist"], ([], BALANCED)),
+            (["fetch"], ([], [])),
+            (
+                ["transcription.fast", "transcription", "summarization.accurate"],
+                ([QualityTier.FAST, QualityTier.BALANCED], [QualityTier.ACCURATE]),
+            ),
+        ],
+    )
+    def test_queue_models(self, queues, expected):
+        """Only the models the consumed queues need are preloaded."""
+        assert preload._queue_models(_worker(queues)) == expected
+
+    @patch("app.tasks.get_summarization_service")
+    @patch("app.tasks.get_transcription_service")
+    def test_master_prefetches_whisper_and_loads_cpu_llm(
+        self, mock_transcription, mock_summarization, settings
+    ):
+        """Whisper files are prefetched; a CPU LLM is loaded before fork."""
+        mock_transcription.return_value.device = "cpu"
+        mock_summarization.return_value.backend.device = "cpu"
+
+        preload.preload_in_master(sender=_worker(None))
+
+        mock_transcription.return_value.prefetch_model.assert_called_once()
+        mock_transcription.return_value._load_model.assert_not_called()
+        mock_summarization.return_value.load.assert_called_once()
+        assert preload._child_models == (BALANCED, BALANCED)
+
+    @patch("app.tasks.get_summarization_service")
+    @patch("app.tasks.get_transcription_service")
+    def test_master_leaves_cuda_models_to_children(
+        self, mock_transcription, mock_summarization, settings
+    ):
+        """Nothing is loaded onto CUDA in the master."""
+        mock_transcription.return_value.device = "cuda"
+        mock_summarization.return_value.backend.device = "cuda"
+
+        preload.preload_in_master(sender=_worker(None))
+
+        mock_transcription.return_value.prefetch_model.assert_not_called()
+        mock_summarization.return_value.load.assert_not_called()
+        assert preload._child_models == (BALANCED, BALANCED)
+
+    @patch("app.tasks.get_partitioned_engine")
+    def test_partitions_start_with_the_worker(self, mock_engine, settings):
+        """Partition processes start at worker start, even without preloading."""
+        settings.preload_models = False
+        settings.partitioned_transcription = True
+
+        preload.start_partitions(sender=_worker(["transcription.fast"]))
+        mock_engine.assert_not_called()
+
+        preload.start_partitions(sender=_worker(["transcription"]))
+        mock_engine.assert_called_once()
+
+    @patch("app.tasks.get_transcription_service")
+    def test_master_skips_with_model_server(self, mock_transcription, settings):
+        """Children load no models when a model server is configured."""
+        settings.model_server_url = "unix:///run/vibecheck/models.sock"
+
+        preload.preload_in_master(sender=_worker(None))
+
+        mock_transcription.assert_not_called()
+        assert preload._child_models == ([], [])
+
+    @patch("app.tasks.get_summarization_service")
+    @patch("app.tasks.get_transcription_service")
+    def test_child_builds_models_at_start(self, mock_transcription, mock_summarization):
+        """A child builds its Whisper model before taking tasks."""
+        preload._child_models = (BALANCED, [])
+
+        preload.finish_child_startup()
+
+        mock_transcription.return_value._load_model.assert_called_once()
+        mock_summarization.assert_not_called()
@@ -0,0 +1,73 @@
+"""Tests for per-job quality tiers."""
+
+from app.core.config import Settings
+from app.core.quality import QualityTier, parse_tier, tier_queue, tier_settings
+
+
+class TestQualityTiers:
+    """Tests for tier parsing, settings and queues."""
+
+    def test_parse_tier_defaults_to_balanced(self):
+        """Unset or unknown tiers run as balanced."""
+        assert parse_tier("fast") == QualityTier.FAST
+        assert parse_tier("ACCURATE") == QualityTier.ACCURATE
+        assert parse_tier(None) == QualityTier.BALANCED
+        assert parse_tier("premium") == QualityTier.BALANCED
+
+    def test_tier_settings_apply_overrides(self):
+        """A tier overrides only the settings it lists."""
+        settings = Settings(
+            transcription_beam_size=5,
+            summarization_cascade_models=["small/model"],
+            quality_tiers={
+                "fast": {"transcription_beam_size": 1},
+                "accurate": {"summarization_cascade_models": []},
+            },
+        )
+
+        fast = tier_settings(settings, QualityTier.FAST)
+        accurate = tier_settings(settings, QualityTier.ACCURATE)
+
+        assert (fast.transcription_beam_size, fast.summarization_cascade_models) == (
+            1,
+            ["small/model"],
+        )
+        assert (accurate.transcription_beam_size, accurate.summarization_cascade_models) == (
+            5,
+            [],
+        )
+        assert tier_settings(settings, QualityTier.BALANCED) is settings
+
+    def test_fast_tier_routes_other_languages_off_the_english_model(self):
+        """Non-English fast jobs never reach the English-only model."""
+        from app.services.transcription import TranscriptionService
+
+        fast = tier_settings(Settings(), QualityTier.FAST)
+        service = TranscriptionService(
+            model_size=fast.transcription_model,
+            device="cpu",
+            multilingual_model_size=fast.transcription_multilingual_model or None,
+        )
+
+        assert service.model_for("en") == "distil-small.en"
+        assert service.model_for("de") == "small"
+
+    def test_english_only_tier_falls_back_to_balanced_routing(self):
+        """A tier with a .en model and no multilingual model keeps the balanced one."""
+        settings = Settings(
+            transcription_model="distil-large-v3",
+            transcription_multilingual_model="",
+            quality_tiers={"fast": {"transcription_model": "base.en"}},
+        )
+        fast = tier_settings(settings, QualityTier.FAST)
+        assert fast.transcription_multilingual_model == "distil-large-v3"
+
+        settings.transcription_multilingual_model = "large-v3"
+        assert tier_settings(settings, QualityTier.FAST).transcription_multilingual_model == (
+            "large-v3"
+        )
+
+    def test_tier_queue(self):
+        """Balanced jobs keep the stage queue; other tiers get their own."""
+        assert tier_queue("transcription", QualityTier.BALANCED) == "transcription"
+        assert tier_queue("summarization", QualityTier.FAST) == "summarization.fast"
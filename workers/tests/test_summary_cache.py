@@ -0,0 +1,66 @@
+"""Unit tests for the summary cache."""
+
+from unittest.mock import MagicMock, patch
+
+from app.services.summary_cache import SummaryCache, summary_cache_key
+
+
+def _mock_session(mock_get_session):
+    """Wire a MagicMock session into the patched get_session context manager."""
+    mock_session = MagicMock()
+    mock_get_session.return_value.__enter__ = MagicMock(return_value=mock_session)
+    mock_get_session.return_value.__exit__ = MagicMock(return_value=False)
+    return mock_session
+
+
+SUMMARY = {"executive_summary": "Good.", "sentiment_score": 0.5}
+
+
+class TestSummaryCache:
+    """Tests for SummaryCache."""
+
+    def test_key_covers_fingerprint_and_transcript(self):
+        """Keys differ when either the settings or the transcript differ."""
+        key = summary_cache_key("a" * 64, "Hello.")
+
+        assert len(key) == 64
+        assert summary_cache_key("a" * 64, "Hello.") == key
+        assert summary_cache_key("b" * 64, "Hello.") != key
+        assert summary_cache_key("a" * 64, "Hello!") != key
+
+    @patch("app.services.summary_cache.get_session")
+    def test_get_hit_returns_summary_and_counts(self, mock_get_session):
+        """A hit returns the summary and bumps the hit counter."""
+        mock_session = _mock_session(mock_get_session)
+        mock_session.execute.return_value.fetchone.return_value = (SUMMARY,)
+
+        cache = SummaryCache(max_bytes=1024, max_age_days=30)
+
+        assert cache.get("c" * 64) == SUMMARY
+        assert (cache.hits, cache.misses) == (1, 0)
+
+    @patch("app.services.summary_cache.get_session")
+    def test_get_db_error_degrades_to_miss(self, mock_get_session):
+        """Database errors are treated as a miss, not a job failure."""
+        mock_get_session.side_effect = ConnectionError("db down")
+
+        cache = SummaryCache(max_bytes=1024, max_age_days=30)
+
+        assert cache.get("c" * 64) is None
+        assert cache.misses == 1
+
+    @patch("app.services.summary_cache.get_session")
+    def test_put_upserts_then_evicts(self, mock_get_session):
+        """put upserts the entry and runs age and size eviction."""
+        mock_session = _mock_session(mock_get_session)
+        mock_session.execute.return_value.rowcount = 0
+
+        cache = SummaryCache(max_bytes=1024, max_age_days=7)
+        cache.put("c" * 64, "meta-llama/Llama-3.3-8B-Instruct", SUMMARY)
+
+        statements = [str(c[0][0]) for c in mock_session.execute.call_args_list]
+        assert "INSERT INTO summary_cache" in statements[0]
+        assert "last_accessed_at < :cutoff" in statements[1]
+        assert "running_bytes > :max_bytes" in statements[2]
+        assert mock_session.execute.call_args_list[2][0][1] == {"max_bytes": 1024}
+        mock_session.commit.assert_called_once()
@@ -1,116 +1,631 @@
 """Unit tests for Celery tasks."""
 
-from datetime import datetime
+import json
+import os
 from unittest.mock import MagicMock, patch
 from uuid import uuid4
 
 import pytest
 
+from app.core.quality import QualityTier
+
+
+def _mock_session(mock_get_session):
+    """Wire a MagicMock session into the patched get_session context manager."""
+    mock_session = MagicMock()
+    mock_get_session.return_value.__enter__ = MagicMock(return_value=mock_session)
+    mock_get_session.return_value.__exit__ = MagicMock(return_value=False)
+    return mock_session
+
+
+def _payload(**extra):
+    """Build a pipeline payload as produced by fetch_audio."""
+    payload = {
+        "job_id": str(uuid4()),
+        "user_id": str(uuid4()),
+        "interviewer_id": str(uuid4()),
+        "s3_audio_key": "uploads/u/1/interview.mp3",
+        "language": None,
+        "quality_tier": "balanced",
+    }
+    payload.update(extra)
+    return payload
+
 
 class TestProcessInterviewTask:
-    """Tests for process_interview task."""
+    """Tests for process_interview pipeline dispatch."""
 
-    @patch("app.tasks.get_session")
-    @patch("app.tasks.time.sleep")
-    def test_process_interview_success(self, mock_sleep, mock_get_session):
-        """Task successfully processes job and updates status."""
+    @patch("app.tasks._load_quality_tier", return_value=QualityTier.BALANCED)
+    @patch("app.tasks._load_checkpoints", return_value={})
+    @patch("app.tasks.chain")
+    def test_process_interview_dispatches_stage_chain(self, mock_chain, mock_load, mock_tier):
+        """Task dispatches fetch -> transcribe -> summarize -> persist."""
         job_id = str(uuid4())
+        mock_chain.return_value.apply_async.return_value.id = "chain-task-id"
 
-        # Mock database session context manager
-        mock_session = MagicMock()
-        mock_get_session.return_value.__enter__ = MagicMock(
-            return_value=mock_session
-        )
-        mock_get_session.return_value.__exit__ = MagicMock(return_value=False)
-
-        # Import and run task
         from app.tasks import process_interview
 
         result = process_interview(job_id)
 
-        assert result["status"] == "completed"
-        assert result["job_id"] == job_id
+        assert result == {
+            "status": "dispatched",
+            "job_id": job_id,
+            "task_id": "chain-task-id",
+        }
+        stages = [sig.task for sig in mock_chain.call_args[0]]
+        assert stages == [
+            "vibecheck.tasks.fetch_audio",
+            "vibecheck.tasks.transcribe",
+            "vibecheck.tasks.summarize",
+            "vibecheck.tasks.persist",
+        ]
+        assert mock_chain.call_args[0][0].args == (job_id,)
+        queues = [sig.options.get("queue") for sig in mock_chain.call_args[0]]
+        assert queues == [None, "transcription", "summarization", None]
 
-        # Verify session.execute was called (for status updates)
-        assert mock_session.execute.called
-        assert mock_session.commit.called
-        # Should be called twice: once for PROCESSING, once for COMPLETED
-        assert mock_session.execute.call_count == 2
-        assert mock_session.commit.call_count == 2
+    @patch("app.tasks._load_quality_tier", return_value=QualityTier.FAST)
+    @patch("app.tasks._load_checkpoints", return_value={})
+    @patch("app.tasks.chain")
+    def test_process_interview_routes_tier_queues(self, mock_chain, mock_load, mock_tier):
+        """Transcription and summarization go to the job's tier queues."""
+        from app.tasks import process_interview
 
-    @patch("app.tasks.get_session")
-    @patch("app.tasks.time.sleep")
-    def test_process_interview_updates_to_processing_first(
-        self, mock_sleep, mock_get_session
+        process_interview(str(uuid4()))
+
+        queues = [sig.options.get("queue") for sig in mock_chain.call_args[0]]
+        assert queues == [None, "transcription.fast", "summarization.fast", None]
+
+    @patch("app.tasks._load_quality_tier", return_value=QualityTier.BALANCED)
+    @patch("app.tasks._load_checkpoints")
+    @patch("app.tasks.chain")
+    def test_process_interview_resumes_after_checkpoints(self, mock_chain, mock_load, mock_tier):
+        """Checkpointed stages are left out of the dispatched chain."""
+        mock_load.return_value = {
+            "fetch_audio": {"s3_audio_key": "k", "audio_size": 1},
+            "transcribe": {"audio_sha256": "ab" * 32, "transcript": "text"},
+        }
+
+        from app.tasks import process_interview
+
+        process_interview(str(uuid4()))
+
+        stages = [sig.task for sig in mock_chain.call_args[0]]
+        assert stages == [
+            "vibecheck.tasks.fetch_audio",
+            "vibecheck.tasks.summarize",
+            "vibecheck.tasks.persist",
+        ]
+
+    @patch("app.tasks._update_job_failed")
+    @patch("app.tasks._load_checkpoints", side_effect=ConnectionError("db down"))
+    @patch("app.tasks.chain")
+    def test_process_interview_retries_transient_db_errors(
+        self, mock_chain, mock_load, mock_update_failed
     ):
-        """Task updates status to PROCESSING before work."""
+        """A database outage during dispatch retries instead of stranding the job."""
+        from app.tasks import process_interview
+
+        # Called directly (outside a worker), retry re-raises the original error
+        with pytest.raises(ConnectionError):
+            process_interview(str(uuid4()))
+
+        mock_chain.assert_not_called()
+        mock_update_failed.assert_not_called()
+
+    @patch("app.tasks._update_job_failed")
+    @patch("app.tasks._load_checkpoints", side_effect=ValueError("bad checkpoints"))
+    def test_process_interview_fails_job_on_permanent_error(self, mock_load, mock_update_failed):
+        """A permanent dispatch error marks the job FAILED."""
+        from celery.exceptions import Ignore
+
+        from app.tasks import process_interview
+
         job_id = str(uuid4())
+        with pytest.raises(Ignore):
+            process_interview(job_id)
+
+        mock_update_failed.assert_called_once_with(job_id, "bad checkpoints")
+
+    def test_task_registered_with_correct_name(self):
+        """Task is registered with expected name."""
+        from app.main import celery_app
+
+        assert "vibecheck.tasks.process_interview" in celery_app.tasks
+
+    def test_stage_tasks_routed_to_dedicated_queues(self):
+        """Each pipeline stage is routed to its own queue."""
+        from app.main import celery_app
 
-        mock_session = MagicMock()
-        mock_get_session.return_value.__enter__ = MagicMock(
-            return_value=mock_session
+        routes = celery_app.conf.task_routes
+        assert routes["vibecheck.tasks.fetch_audio"]["queue"] == "fetch"
+        assert routes["vibecheck.tasks.transcribe"]["queue"] == "transcription"
+        assert routes["vibecheck.tasks.summarize"]["queue"] == "summarization"
+        assert routes["vibecheck.tasks.persist"]["queue"] == "persist"
+
+
+class TestPipelineStages:
+    """Tests for the per-stage pipeline tasks."""
+
+    @patch("app.tasks.get_s3_service")
+    @patch("app.tasks.get_session")
+    def test_fetch_audio_marks_processing(self, mock_get_session, mock_get_s3):
+        """fetch_audio updates status to PROCESSING and returns payload."""
+        job_id = str(uuid4())
+        user_id, interviewer_id = uuid4(), uuid4()
+        mock_session = _mock_session(mock_get_session)
+        mock_session.execute.return_value.fetchone.return_value = (
+            "uploads/key.mp3",
+            user_id,
+            interviewer_id,
+            None,
+            "de",
+            "accurate",
         )
-        mock_get_session.return_value.__exit__ = MagicMock(return_value=False)
+        mock_get_s3.return_value.get_file_size.return_value = 1024
 
-        from app.tasks import process_interview
+        from app.tasks import fetch_audio
 
-        process_interview(job_id)
+        payload = fetch_audio(job_id)
 
-        # Check first execute call contained PROCESSING status
-        first_call_args = mock_session.execute.call_args_list[0]
-        # The second argument is the params dict
-        params = first_call_args[0][1]
+        params = mock_session.execute.call_args_list[1][0][1]
         assert params["status"] == "processing"
+        assert payload == {
+            "job_id": job_id,
+            "user_id": str(user_id),
+            "interviewer_id": str(interviewer_id),
+            "s3_audio_key": "uploads/key.mp3",
+            "language": "de",
+            "quality_tier": "accurate",
+        }
+        checkpoint_params = mock_session.execute.call_args_list[2][0][1]
+        assert checkpoint_params["stage"] == "fetch_audio"
 
+    @patch("app.tasks.get_s3_service")
     @patch("app.tasks.get_session")
-    @patch("app.tasks.time.sleep")
-    def test_process_interview_updates_to_completed_after_work(
-        self, mock_sleep, mock_get_session
+    def test_fetch_audio_merges_checkpointed_outputs(
+        self, mock_get_session, mock_get_s3
     ):
-        """Task updates status to COMPLETED after work."""
-        job_id = str(uuid4())
-
-        mock_session = MagicMock()
-        mock_get_session.return_value.__enter__ = MagicMock(
-            return_value=mock_session
+        """Checkpointed stage outputs are carried in the payload."""
+        mock_session = _mock_session(mock_get_session)
+        mock_session.execute.return_value.fetchone.return_value = (
+            "uploads/key.mp3",
+            uuid4(),
+            uuid4(),
+            {
+                "fetch_audio": {"s3_audio_key": "uploads/key.mp3", "audio_size": 9},
+                "transcribe": {"audio_sha256": "ab" * 32, "transcript": "text"},
+            },
+            None,
+            None,
         )
-        mock_get_session.return_value.__exit__ = MagicMock(return_value=False)
 
-        from app.tasks import process_interview
+        from app.tasks import fetch_audio
 
-        process_interview(job_id)
+        payload = fetch_audio(str(uuid4()))
 
-        # Check second execute call contained COMPLETED status
-        second_call_args = mock_session.execute.call_args_list[1]
-        params = second_call_args[0][1]
-        assert params["status"] == "completed"
+        assert payload["transcript"] == "text"
+        assert "summary" not in payload
+        # Audio was already located; no S3 round-trip
+        mock_get_s3.return_value.get_file_size.assert_not_called()
 
+    @patch("app.tasks._update_job_failed")
     @patch("app.tasks.get_session")
-    @patch("app.tasks.time.sleep")
-    def test_process_interview_simulates_work(
-        self, mock_sleep, mock_get_session
+    def test_fetch_audio_missing_job_fails_permanently(
+        self, mock_get_session, mock_update_failed
     ):
-        """Task simulates work via sleep."""
+        """Missing job marks FAILED and stops the chain."""
+        from celery.exceptions import Ignore
+
         job_id = str(uuid4())
+        mock_session = _mock_session(mock_get_session)
+        mock_session.execute.return_value.fetchone.return_value = None
+
+        from app.tasks import fetch_audio
+
+        with pytest.raises(Ignore):
+            fetch_audio(job_id)
+
+        mock_update_failed.assert_called_once()
+        assert "not found" in mock_update_failed.call_args[0][1]
+
+    @patch("app.tasks._save_checkpoint")
+    @patch("app.tasks.get_transcript_cache")
+    @patch("app.tasks.get_transcription_service")
+    @patch("app.tasks.get_s3_service")
+    def test_transcribe_downloads_and_cleans_up(
+        self, mock_get_s3, mock_get_ts, mock_get_cache, mock_save
+    ):
+        """transcribe downloads audio, adds transcript and removes temp file."""
+        downloaded = []
+
+        def fake_download(key, path):
+            open(path, "wb").close()
+            downloaded.append(path)
+            return "ab" * 32
+
+        from app.services.transcription import TranscriptResult
 
-        mock_session = MagicMock()
-        mock_get_session.return_value.__enter__ = MagicMock(
-            return_value=mock_session
+        mock_get_s3.return_value.download_file_with_hash.side_effect = fake_download
+        transcription = TranscriptResult(
+            segments=[
+                {"start": 0.0, "end": 1.0, "text": "Hello", "avg_logprob": -0.1},
+                {"start": 1.0, "end": 2.0, "text": "there.", "avg_logprob": -0.3},
+            ],
+            language="en",
+            duration=2.5,
         )
-        mock_get_session.return_value.__exit__ = MagicMock(return_value=False)
+        mock_get_ts.return_value.transcribe_result.return_value = transcription
+        mock_get_cache.return_value.get.return_value = None
 
-        from app.tasks import process_interview
+        from app.tasks import transcribe
 
-        process_interview(job_id)
+        payload = _payload(language="en")
+        result = transcribe(payload)
 
-        # Verify sleep was called (simulating work)
-        mock_sleep.assert_called_once_with(5)
+        assert result["transcript"] == "Hello there."
+        assert result["audio_sha256"] == "ab" * 32
+        assert result["job_id"] == payload["job_id"]
+        assert result["transcription"]["language"] == "en"
+        assert result["transcription"]["duration"] == 2.5
+        assert result["transcription"]["confidence"] == pytest.approx(0.83, abs=0.01)
+        # Wall time is measured on fresh transcriptions, for the job's RTF
+        assert result["transcription"]["seconds"] >= 0
+        assert not os.path.exists(downloaded[0])
+        # The upload's language hint is passed on, skipping detection
+        mock_get_ts.return_value.transcribe_result.assert_called_once_with(downloaded[0], "en")
+        mock_get_cache.return_value.put.assert_called_once()
+        mock_save.assert_called_once_with(
+            payload["job_id"],
+            "transcribe",
+            {
+                "audio_sha256": "ab" * 32,
+                "transcript": "Hello there.",
+                "transcription": transcription.to_dict(),
+            },
+        )
 
-    def test_task_registered_with_correct_name(self):
-        """Task is registered with expected name."""
-        from app.main import celery_app
+    @patch("app.tasks._save_checkpoint")
+    @patch("app.tasks.get_transcript_cache")
+    @patch("app.tasks.get_transcription_service")
+    @patch("app.tasks.get_s3_service")
+    def test_transcribe_cache_hit_skips_whisper(
+        self, mock_get_s3, mock_get_ts, mock_get_cache, mock_save
+    ):
+        """A transcript cache hit skips transcription entirely."""
+        from app.services.transcription import TranscriptResult
 
-        assert "vibecheck.tasks.process_interview" in celery_app.tasks
+        mock_get_s3.return_value.download_file_with_hash.return_value = "cd" * 32
+        mock_get_cache.return_value.get.return_value = TranscriptResult(
+            segments=[{"start": 0.0, "end": 1.0, "text": "Cached text."}],
+            language="de",
+            duration=1.0,
+        )
+
+        from app.tasks import transcribe
+
+        result = transcribe(_payload())
+
+        assert result["transcript"] == "Cached text."
+        assert result["transcription"]["language"] == "de"
+        mock_get_ts.return_value.transcribe_result.assert_not_called()
+        mock_get_cache.return_value.put.assert_not_called()
+
+    @patch("app.tasks.get_transcription_service")
+    def test_transcribe_skips_when_checkpointed(self, mock_get_ts):
+        """A payload carrying a checkpointed transcript is passed through."""
+        from app.tasks import transcribe
+
+        payload = _payload(transcript="From checkpoint.")
+
+        assert transcribe(payload) == payload
+        mock_get_ts.assert_not_called()
+
+    @patch("app.tasks.get_transcription_service")
+    @patch("app.tasks.get_s3_service")
+    def test_transcribe_part_offsets_segments(self, mock_get_s3, mock_get_ts):
+        """transcribe_part shifts part-relative times to the full recording."""
+        mock_get_ts.return_value.transcribe_with_timestamps.return_value = [
+            {"start": 1.0, "end": 2.5, "text": "Part text."},
+        ]
+
+        from app.tasks import transcribe_part
+
+        segments = transcribe_part(str(uuid4()), "tmp/fanout/j/0001.wav", 900.0, "en")
+
+        assert segments == [{"start": 901.0, "end": 902.5, "text": "Part text."}]
+        kwargs = mock_get_ts.return_value.transcribe_with_timestamps.call_args.kwargs
+        assert kwargs["language"] == "en"
+
+    @patch("app.tasks._save_checkpoint")
+    @patch("app.tasks.get_transcript_cache", return_value=None)
+    @patch("app.tasks.get_s3_service")
+    def test_merge_parts_orders_by_timestamp_and_cleans_up(
+        self, mock_get_s3, mock_get_cache, mock_save
+    ):
+        """merge_parts merges part transcripts in time order and deletes parts."""
+        from app.tasks import merge_parts
+
+        payload = _payload(audio_sha256="ef" * 32)
+        part_segments = [
+            [{"start": 900.5, "end": 901.0, "text": "second"}],
+            [{"start": 0.5, "end": 1.0, "text": "first"}],
+        ]
+        keys = ["tmp/fanout/j/0000.wav", "tmp/fanout/j/0001.wav"]
+
+        result = merge_parts(part_segments, payload, keys)
+
+        assert result["transcript"] == "first second"
+        assert result["audio_sha256"] == "ef" * 32
+        mock_get_s3.return_value.delete_files.assert_called_once_with(keys)
+        mock_save.assert_called_once()
+
+    @patch("app.tasks.get_transcription_service")
+    @patch("app.tasks.get_s3_service")
+    def test_fan_out_builds_chord_over_uploaded_parts(self, mock_get_s3, mock_get_ts):
+        """Long audio is split into S3 parts with a merge callback."""
+        np = pytest.importorskip("numpy")
+
+        audio = np.zeros(16000 * 2500, dtype=np.float32)
+        mock_get_ts.return_value.detect_language.return_value = "en"
+
+        from app.tasks import _fan_out_transcription
+
+        payload = _payload()
+        with patch.dict(
+            "sys.modules",
+            {"faster_whisper": MagicMock(decode_audio=MagicMock(return_value=audio))},
+        ):
+            sig = _fan_out_transcription(payload, "/tmp/audio", "ab" * 32)
+
+        offsets = [part.args[2] for part in sig.tasks]
+        assert offsets == pytest.approx([0.0, 900.0, 1800.0], abs=0.1)
+        assert all(part.args[3:] == ("en", "balanced") for part in sig.tasks)
+        assert all(part.options["queue"] == "transcription" for part in sig.tasks)
+        assert mock_get_s3.return_value.upload_bytes.call_count == 3
+        assert sig.body.task == "vibecheck.tasks.merge_parts"
+        assert sig.body.args[0]["audio_sha256"] == "ab" * 32
+        assert sig.body.args[1][0] == f"tmp/fanout/{payload['job_id']}/0000.wav"
+
+    @patch("app.tasks.get_summary_cache", return_value=None)
+    @patch("app.tasks._update_job_failed")
+    @patch("app.tasks.get_summarization_service")
+    def test_summarize_transient_error_retries(
+        self, mock_get_ss, mock_update_failed, mock_get_cache
+    ):
+        """Transient errors retry the stage and keep PROCESSING status."""
+        mock_get_ss.return_value.summarize.side_effect = ConnectionError("boom")
+
+        from app.tasks import summarize
+
+        # Called directly (outside a worker), retry re-raises the original error
+        with pytest.raises(ConnectionError):
+            summarize(_payload(transcript="text"))
+
+        mock_update_failed.assert_not_called()
+
+    @patch("app.tasks.get_summary_cache", return_value=None)
+    @patch("app.tasks.summarize_batch")
+    @patch("app.tasks.get_pending_summaries")
+    @patch("app.tasks.get_settings")
+    def test_batched_summarize_queues_payload(
+        self, mock_settings, mock_get_pending, mock_summarize_batch, mock_get_cache
+    ):
+        """In batched mode the stage queues the job and ends the chain."""
+        from celery.exceptions import Ignore
+
+        mock_settings.return_value.batched_summarization = True
+
+        from app.tasks import summarize
+
+        payload = _payload(transcript="text")
+        with pytest.raises(Ignore):
+            summarize(payload)
+
+        mock_get_pending.return_value.push.assert_called_once_with(payload)
+        mock_summarize_batch.delay.assert_called_once_with()
+
+    @patch("app.tasks.get_summary_cache", return_value=None)
+    @patch("app.tasks.persist")
+    @patch("app.tasks._save_checkpoint")
+    @patch("app.tasks.get_summarization_service")
+    @patch("app.tasks.get_pending_summaries")
+    def test_summarize_batch_fans_out_to_persist(
+        self, mock_get_pending, mock_get_ss, mock_save, mock_persist, mock_get_cache
+    ):
+        """Each summarized job is checkpointed and sent on to persist."""
+        payloads = [_payload(transcript="one"), _payload(transcript="two")]
+        mock_get_pending.return_value.drain.return_value = payloads
+        mock_get_ss.return_value.summarize_batch.return_value = [{"n": 1}, {"n": 2}]
+
+        from app.tasks import summarize_batch
+
+        with patch.object(summarize_batch, "apply_async") as mock_watchdog:
+            result = summarize_batch()
+
+        assert result == {"status": "dispatched", "jobs": 2}
+        mock_get_pending.return_value.reap.assert_called_once_with()
+        mock_get_pending.return_value.complete.assert_called_once()
+        assert mock_watchdog.call_args.kwargs["countdown"] > 3600
+        mock_get_ss.return_value.summarize_batch.assert_called_once_with(["one", "two"])
+        persisted = [call.args[0] for call in mock_persist.delay.call_args_list]
+        assert persisted == [
+            {**payloads[0], "summary": {"n": 1}},
+            {**payloads[1], "summary": {"n": 2}},
+        ]
+        assert mock_save.call_count == 2
+
+    @patch("app.tasks.get_summarization_service")
+    @patch("app.tasks.get_pending_summaries")
+    def test_summarize_batch_transient_error_keeps_claim(self, mock_get_pending, mock_get_ss):
+        """Transient failures keep the batch claimed for the retry."""
+        payloads = [_payload(transcript="one")]
+        mock_get_pending.return_value.drain.return_value = payloads
+        mock_get_ss.return_value.summarize_batch.side_effect = ConnectionError("boom")
+
+        from app.tasks import summarize_batch
+
+        with patch.object(summarize_batch, "apply_async"), pytest.raises(ConnectionError):
+            summarize_batch()
+
+        mock_get_pending.return_value.renew.assert_called_once()
+        mock_get_pending.return_value.complete.assert_not_called()
+
+    @patch("app.tasks._update_job_failed")
+    @patch("app.tasks.get_summarization_service")
+    @patch("app.tasks.get_pending_summaries")
+    def test_summarize_batch_fails_jobs_when_retries_run_out(
+        self, mock_get_pending, mock_get_ss, mock_update_failed
+    ):
+        """The last transient failure marks every job FAILED and releases the batch."""
+        from celery.exceptions import Ignore
+
+        payloads = [_payload(transcript="one"), {**_payload(transcript="two"), "job_id": "j2"}]
+        mock_get_pending.return_value.drain.return_value = payloads
+        mock_get_ss.return_value.summarize_batch.side_effect = ConnectionError("boom")
+
+        from app.tasks import summarize_batch
+
+        with patch.object(summarize_batch, "apply_async"), patch.object(
+            summarize_batch, "max_retries", 0
+        ), pytest.raises(Ignore):
+            summarize_batch()
+
+        failed = [call.args[0] for call in mock_update_failed.call_args_list]
+        assert failed == [payloads[0]["job_id"], "j2"]
+        mock_get_pending.return_value.complete.assert_called_once()
+
+    @patch("app.tasks._save_checkpoint")
+    @patch("app.tasks.get_summary_cache")
+    @patch("app.tasks.get_summarization_service")
+    def test_summarize_cache_hit_skips_llm(self, mock_get_ss, mock_get_cache, mock_save):
+        """A cached summary is reused without running the model."""
+        mock_get_ss.return_value.fingerprint = "f" * 64
+        mock_get_cache.return_value.get.return_value = {"executive_summary": "Cached"}
+
+        from app.services.summary_cache import summary_cache_key
+        from app.tasks import summarize
+
+        result = summarize(_payload(transcript="text"))
+
+        assert result["summary"] == {"executive_summary": "Cached"}
+        mock_get_cache.return_value.get.assert_called_once_with(
+            summary_cache_key("f" * 64, "text")
+        )
+        mock_get_ss.return_value.summarize.assert_not_called()
+        mock_get_cache.return_value.put.assert_not_called()
+        mock_save.assert_called_once()
+
+    @patch("app.tasks._save_checkpoint")
+    @patch("app.tasks.get_summary_cache")
+    @patch("app.tasks.get_summarization_service")
+    def test_summarize_cache_miss_stores_summary(self, mock_get_ss, mock_get_cache, mock_save):
+        """Fresh summaries are cached; fallback summaries are not."""
+        from app.services.summarization import FALLBACK_SUMMARY
+        from app.tasks import summarize
+
+        mock_get_ss.return_value.fingerprint = "f" * 64
+        mock_get_ss.return_value.model_name = "llm"
+        mock_get_cache.return_value.get.return_value = None
+        mock_get_ss.return_value.summarize.return_value = {"executive_summary": "Fresh"}
+
+        summarize(_payload(transcript="text"))
+
+        mock_get_cache.return_value.put.assert_called_once()
+        assert mock_get_cache.return_value.put.call_args.args[1:] == (
+            "llm",
+            {"executive_summary": "Fresh"},
+        )
+
+        mock_get_cache.return_value.put.reset_mock()
+        mock_get_ss.return_value.summarize.return_value = dict(FALLBACK_SUMMARY)
+
+        summarize(_payload(transcript="text"))
+
+        mock_get_cache.return_value.put.assert_not_called()
+
+    @patch("app.tasks.backfill_summaries.delay")
+    @patch("app.backfill.run_backfill")
+    def test_backfill_task_sends_next_slice_until_done(self, mock_run, mock_delay):
+        """The backfill task re-sends itself until every row is reached."""
+        from app.backfill import BackfillStats
+        from app.tasks import backfill_summaries
+
+        mock_run.return_value = BackfillStats(rows=500, done=False)
+        assert backfill_summaries() == {"status": "continued", "rows": 500}
+        mock_delay.assert_called_once_with()
+
+        mock_delay.reset_mock()
+        mock_run.return_value = BackfillStats(rows=20, done=True)
+        assert backfill_summaries() == {"status": "done", "rows": 20}
+        mock_delay.assert_not_called()
+
+    def test_retry_countdown_backs_off_exponentially_with_jitter(self):
+        """Retry delays double per attempt, stay jittered and are capped."""
+        from app.tasks import _retry_countdown
+
+        for retries in range(3):
+            delay = 30 * 2**retries
+            countdown = _retry_countdown(retries)
+            assert delay / 2 <= countdown <= delay
+        assert _retry_countdown(20) <= 900
+
+    @patch("app.tasks.get_settings")
+    def test_model_server_makes_services_thin_clients(self, mock_settings):
+        """With a model server URL the workers load no models themselves."""
+        import app.tasks as tasks
+        from app.services.model_client import (
+            RemoteSummarizationService,
+            RemoteTranscriptionService,
+        )
+
+        mock_settings.return_value.model_server_url = "unix:///tmp/models.sock"
+        mock_settings.return_value.model_server_timeout_seconds = 60.0
+
+        with patch.dict(tasks._transcription_services, clear=True), patch.dict(
+            tasks._summarization_services, clear=True
+        ):
+            assert isinstance(tasks.get_transcription_service(), RemoteTranscriptionService)
+            assert isinstance(tasks.get_summarization_service(), RemoteSummarizationService)
+
+    @patch("app.tasks.get_session")
+    def test_persist_upserts_and_completes(self, mock_get_session):
+        """persist upserts the analysis and marks the job COMPLETED."""
+        analysis_id = uuid4()
+        mock_session = _mock_session(mock_get_session)
+        mock_session.execute.return_value.scalar.return_value = analysis_id
+        summary = {
+            "executive_summary": "Good.",
+            "key_topics": ["Python"],
+            "strengths": ["Clear"],
+            "areas_for_improvement": ["Depth"],
+            "sentiment_score": 0.5,
+        }
+
+        from app.tasks import persist
+
+        payload = _payload(
+            transcript="text",
+            summary=summary,
+            transcription={
+                "language": "fr",
+                "duration": 100.0,
+                "model": "large-v3",
+                "seconds": 25.0,
+            },
+        )
+        result = persist(payload)
+
+        assert result == {
+            "status": "completed",
+            "job_id": payload["job_id"],
+            "analysis_id": str(analysis_id),
+        }
+        upsert_sql = str(mock_session.execute.call_args_list[0][0][0])
+        assert "ON CONFLICT (job_id)" in upsert_sql
+        metrics = json.loads(mock_session.execute.call_args_list[0][0][1]["metrics_json"])
+        assert metrics["transcription"] == {"language": "fr", "model": "large-v3", "rtf": 0.25}
+        final_params = mock_session.execute.call_args_list[-1][0][1]
+        assert final_params["status"] == "completed"
 
 
 class TestJobStatusEnum:
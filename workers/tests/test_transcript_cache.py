@@ -0,0 +1,69 @@
+"""Unit tests for the transcript cache."""
+
+from unittest.mock import MagicMock, patch
+
+from app.services.transcript_cache import TranscriptCache
+from app.services.transcription import TranscriptResult
+
+
+def _mock_session(mock_get_session):
+    """Wire a MagicMock session into the patched get_session context manager."""
+    mock_session = MagicMock()
+    mock_get_session.return_value.__enter__ = MagicMock(return_value=mock_session)
+    mock_get_session.return_value.__exit__ = MagicMock(return_value=False)
+    return mock_session
+
+
+class TestTranscriptCache:
+    """Tests for TranscriptCache."""
+
+    @patch("app.services.transcript_cache.get_session")
+    def test_get_hit_returns_entry_and_counts(self, mock_get_session):
+        """A hit returns the transcription and bumps the hit counter."""
+        mock_session = _mock_session(mock_get_session)
+        segments = [{"start": 0.0, "end": 1.0, "text": "Hi."}]
+        mock_session.execute.return_value.fetchone.return_value = (segments, "en", 1.5)
+
+        cache = TranscriptCache(max_bytes=1024, max_age_days=30)
+        result = cache.get("a" * 64, "distil-large-v3", "int8")
+
+        assert result == TranscriptResult(segments=segments, language="en", duration=1.5)
+        assert result.text == "Hi."
+        assert (cache.hits, cache.misses) == (1, 0)
+
+    @patch("app.services.transcript_cache.get_session")
+    def test_get_miss_counts(self, mock_get_session):
+        """A miss returns None and bumps the miss counter."""
+        mock_session = _mock_session(mock_get_session)
+        mock_session.execute.return_value.fetchone.return_value = None
+
+        cache = TranscriptCache(max_bytes=1024, max_age_days=30)
+
+        assert cache.get("a" * 64, "distil-large-v3", "int8") is None
+        assert (cache.hits, cache.misses) == (0, 1)
+
+    @patch("app.services.transcript_cache.get_session")
+    def test_get_db_error_degrades_to_miss(self, mock_get_session):
+        """Database errors are treated as a miss, not a job failure."""
+        mock_get_session.side_effect = ConnectionError("db down")
+
+        cache = TranscriptCache(max_bytes=1024, max_age_days=30)
+
+        assert cache.get("a" * 64, "distil-large-v3", "int8") is None
+        assert cache.misses == 1
+
+    @patch("app.services.transcript_cache.get_session")
+    def test_put_upserts_then_evicts(self, mock_get_session):
+        """put upserts the entry and runs age and size eviction."""
+        mock_session = _mock_session(mock_get_session)
+        mock_session.execute.return_value.rowcount = 0
+
+        cache = TranscriptCache(max_bytes=1024, max_age_days=7)
+        cache.put("a" * 64, "distil-large-v3", "int8", TranscriptResult(segments=[]))
+
+        statements = [str(c[0][0]) for c in mock_session.execute.call_args_list]
+        assert "INSERT INTO transcript_cache" in statements[0]
+        assert "last_accessed_at < :cutoff" in statements[1]
+        assert "running_bytes > :max_bytes" in statements[2]
+        assert mock_session.execute.call_args_list[2][0][1] == {"max_bytes": 1024}
+        mock_session.commit.assert_called_once()